@@ -9,16 +9,21 @@ import pandas as pd
 import numpy as np
 import sys
 
+from scorecard_index import load_scorecard_index
 
-def compute_aggregates(scorecard_index_path: str, output_path: str):
+
+def compute_aggregates(scorecard_index_path, output_path: str):
     """
     Compute aggregate statistics per variant
     
     Args:
-        scorecard_index_path: Path to scorecard index CSV
+        scorecard_index_path: Path to scorecard index (CSV/Parquet/index dir) or loaded DataFrame
         output_path: Path to write summary CSV
+    
+    Returns:
+        tuple: (variant summary, per-task summary) DataFrames
     """
-    df = pd.read_csv(scorecard_index_path)
+    df = load_scorecard_index(scorecard_index_path)
     
     # Group by variant
     summary = df.groupby('variant').agg({
@@ -46,6 +51,8 @@ def compute_aggregates(scorecard_index_path: str, output_path: str):
     task_output = output_path.replace('.csv', '_by_task.csv')
     task_summary.to_csv(task_output)
     print(f"✓ Task breakdown written to {task_output}")
+    
+    return summary, task_summary
 
 
 if __name__ == '__main__':
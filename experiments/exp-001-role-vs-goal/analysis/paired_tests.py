@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Paired Tests
+
+Paired comparison of two variants across several metrics at once.
+
+The scorecard index is pivoted once into per-pair differences (one
+column per metric); t-tests, confidence intervals and Cohen's d are then
+computed for every metric, and for every (task, metric) stratum, with
+array operations. Results feed directly into bonferroni_correction.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from resampling import DEFAULT_SEED, bootstrap_ci, permutation_test
+from scorecard_index import load_scorecard_index
+
+
+METRICS = ['task_success', 'constraint_adherence', 'runtime', 'clarification_count', 'reproducibility']
+
+BASELINE = 'role-centric'
+TREATMENT = 'goal-centric'
+
+# Pre-registered hypotheses (research.md): (name, metric, description)
+# (name, metric, description, which values of the metric are better)
+HYPOTHESES = [
+    ('H1', 'task_success', 'Goal-centric agents have higher task success rates', 'higher'),
+    ('H2', 'constraint_adherence', 'Goal-centric agents show better constraint adherence', 'higher'),
+    ('H3', 'reproducibility', 'Goal-centric agents demonstrate higher reproducibility', 'higher'),
+    ('H4', 'clarification_count', 'Role-centric agents require more clarification requests', 'lower'),
+    ('H5', 'runtime', 'No significant runtime difference between paradigms', 'lower')
+]
+
+VARIANT_LABELS = {TREATMENT: 'Goal-centric', BASELINE: 'Role-centric'}
+
+
+def _paired_runs(df: pd.DataFrame, treatment: str, baseline: str) -> pd.DataFrame:
+    """Runs of the two variants that belong to a pair (task_id and pair_id present)"""
+    paired = df.dropna(subset=['task_id', 'pair_id'])
+    return paired[paired['variant'].isin([baseline, treatment])]
+
+
+def pair_completeness(df: pd.DataFrame, treatment: str = TREATMENT, baseline: str = BASELINE) -> dict:
+    """
+    Classify the observed (task_id, pair_id) pairs by whether both variants ran
+    
+    Args:
+        df: Scorecard index DataFrame
+        treatment: Treatment variant
+        baseline: Baseline variant
+    
+    Returns:
+        dict: complete (list of (task_id, pair_id)), incomplete (task_id, pair_id and
+            missing variants per pair), unpaired_runs (runs without a pair_id)
+    """
+    paired = _paired_runs(df, treatment, baseline)
+    variants = paired.groupby(['task_id', 'pair_id'])['variant'].agg(set)
+    complete, incomplete = [], []
+    for (task_id, pair_id), present in variants.items():
+        missing = [v for v in (baseline, treatment) if v not in present]
+        if missing:
+            incomplete.append({'task_id': task_id, 'pair_id': pair_id, 'missing': missing})
+        else:
+            complete.append((task_id, pair_id))
+    return {
+        'complete': complete,
+        'incomplete': incomplete,
+        'unpaired_runs': int(df['pair_id'].isna().sum())
+    }
+
+
+def paired_differences(df: pd.DataFrame, metrics: list = None, treatment: str = TREATMENT,
+                       baseline: str = BASELINE) -> pd.DataFrame:
+    """
+    Pivot the index once into treatment - baseline differences per pair
+    
+    Only observed pairs with a run of both variants are included; runs
+    without a pair_id never form a pair. Incomplete pairs are reported by
+    pair_completeness rather than left as empty rows.
+    
+    Args:
+        df: Scorecard index DataFrame
+        metrics: Metric columns (default: METRICS)
+        treatment: Variant subtracted from
+        baseline: Variant subtracted
+    
+    Returns:
+        pd.DataFrame: Index (task_id, pair_id), one column per metric; NaN where a pair lacks a value
+    """
+    metrics = METRICS if metrics is None else list(metrics)
+    complete = pd.MultiIndex.from_tuples(
+        pair_completeness(df, treatment, baseline)['complete'], names=['task_id', 'pair_id']
+    )
+    # Observed (task_id, pair_id, variant) groups only; no cartesian product of pairs
+    pivot = _paired_runs(df, treatment, baseline).groupby(
+        ['task_id', 'pair_id', 'variant']
+    )[metrics].mean().unstack('variant')
+    pivot = pivot.reindex(index=complete, columns=pd.MultiIndex.from_product([metrics, [baseline, treatment]]))
+    diffs = pivot.xs(treatment, axis=1, level=1) - pivot.xs(baseline, axis=1, level=1)
+    return diffs[metrics].astype(float)
+
+
+def _t_statistics(n, mean, sd, confidence: float) -> dict:
+    """Paired t-test, CI and Cohen's d from elementwise counts, means and SDs"""
+    n = np.asarray(n, dtype=float)
+    mean = np.asarray(mean, dtype=float)
+    sd = np.asarray(sd, dtype=float)
+    dof = np.where(n > 1, n - 1, np.nan)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se = sd / np.sqrt(n)
+        t_stat = mean / se
+        p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+        margin = stats.t.ppf(0.5 + confidence / 2, dof) * se
+        cohens_d = mean / sd
+    
+    return {
+        'n': n,
+        'mean_difference': mean,
+        't_statistic': t_stat,
+        'p_value': p_value,
+        'ci_low': mean - margin,
+        'ci_high': mean + margin,
+        'cohens_d': cohens_d
+    }
+
+
+def _wilcoxon(diffs: np.ndarray):
+    """Wilcoxon signed-rank per column, NaN where a column cannot be tested"""
+    k = diffs.shape[1]
+    statistic = np.full(k, np.nan)
+    p_value = np.full(k, np.nan)
+    
+    # Columns with fewer than one non-zero difference have no defined test
+    testable = (np.nan_to_num(diffs) != 0).sum(axis=0) > 0
+    if not testable.any():
+        return statistic, p_value
+    
+    try:
+        result = stats.wilcoxon(diffs[:, testable], axis=0, nan_policy='omit')
+        statistic[testable] = result.statistic
+        p_value[testable] = result.pvalue
+    except ValueError:
+        for j in np.flatnonzero(testable):
+            column = diffs[:, j]
+            column = column[~np.isnan(column)]
+            try:
+                result = stats.wilcoxon(column)
+                statistic[j], p_value[j] = result.statistic, result.pvalue
+            except ValueError:
+                continue
+    return statistic, p_value
+
+
+def _records(columns: list, t_results: dict, wilcoxon, alpha: float) -> dict:
+    """Convert column-aligned arrays into per-metric result dicts"""
+    w_stat, w_p = wilcoxon
+    records = {}
+    for j, metric in enumerate(columns):
+        p_value = float(t_results['p_value'][j])
+        records[metric] = {
+            'sample_size': int(t_results['n'][j]),
+            'mean_difference': float(t_results['mean_difference'][j]),
+            't_statistic': float(t_results['t_statistic'][j]),
+            'p_value': p_value,
+            'cohens_d': float(t_results['cohens_d'][j]),
+            'confidence_interval_95': [float(t_results['ci_low'][j]), float(t_results['ci_high'][j])],
+            'wilcoxon_statistic': float(w_stat[j]),
+            'wilcoxon_p_value': float(w_p[j]),
+            'significant': bool(p_value < alpha)
+        }
+    return records
+
+
+def paired_tests(df: pd.DataFrame, metrics: list = None, alpha: float = 0.05, by_task: bool = True,
+                 treatment: str = TREATMENT, baseline: str = BASELINE, resamples: int = None,
+                 seed: int = DEFAULT_SEED, workers: int = None) -> dict:
+    """
+    Run paired t-test, Wilcoxon, Cohen's d and 95% CI for several metrics
+    
+    Args:
+        df: Scorecard index DataFrame
+        metrics: Metric columns (default: METRICS)
+        alpha: Significance level (uncorrected)
+        by_task: Also compute per-task strata
+        treatment: Treatment variant
+        baseline: Baseline variant
+        resamples: If set, add bootstrap CIs and sign-flip permutation p-values (overall only)
+        seed: Resampling seed
+        workers: Process pool size for resampling chunks
+    
+    Returns:
+        dict: {'metrics': {metric: result}, 'by_task': {task: {metric: result}},
+            'complete_pairs': n, 'incomplete_pairs': [...], 'unpaired_runs': n}
+    """
+    diffs = paired_differences(df, metrics, treatment, baseline)
+    completeness = pair_completeness(df, treatment, baseline)
+    columns = list(diffs.columns)
+    
+    overall = _t_statistics(diffs.count(), diffs.mean(), diffs.std(), 0.95)
+    results = {
+        'treatment': treatment,
+        'baseline': baseline,
+        'alpha': alpha,
+        'complete_pairs': len(completeness['complete']),
+        'incomplete_pairs': completeness['incomplete'],
+        'unpaired_runs': completeness['unpaired_runs'],
+        'metrics': _records(columns, overall, _wilcoxon(diffs.to_numpy()), alpha)
+    }
+    
+    if resamples:
+        values = diffs.to_numpy()
+        bootstrap = bootstrap_ci(values, resamples, seed=seed, workers=workers)
+        permutation = permutation_test(values, resamples, seed=seed, workers=workers)
+        for j, metric in enumerate(columns):
+            results['metrics'][metric].update({
+                'bootstrap_ci_95': [float(bootstrap['low'][j]), float(bootstrap['high'][j])],
+                'permutation_p_value': float(permutation['p_value'][j]),
+                'resamples': resamples,
+                'resampling_seed': seed
+            })
+    
+    if by_task:
+        grouped = diffs.groupby(level='task_id')
+        strata = _t_statistics(grouped.count(), grouped.mean(), grouped.std(), 0.95)
+        tasks = grouped.count().index
+        results['by_task'] = {}
+        for i, task in enumerate(tasks):
+            task_stats = {key: values[i] for key, values in strata.items()}
+            task_diffs = diffs.xs(task, level='task_id').to_numpy()
+            results['by_task'][task] = _records(columns, task_stats, _wilcoxon(task_diffs), alpha)
+    
+    return results
+
+
+def direction_label(cohens_d: float, better: str, metric: str) -> str:
+    """
+    Which variant did better, given the sign of the treatment - baseline effect
+    
+    Args:
+        cohens_d: Effect size of the paired differences (treatment - baseline)
+        better: 'higher' or 'lower', whichever values of the metric are better
+        metric: Metric name, for the label
+    
+    Returns:
+        str: e.g. 'Goal-centric better (lower clarification_count)'
+    """
+    if better not in ('higher', 'lower'):
+        raise ValueError(f"Unknown polarity for {metric}: {better!r} (expected 'higher' or 'lower')")
+    treatment_higher = cohens_d > 0
+    winner = TREATMENT if treatment_higher == (better == 'higher') else BASELINE
+    return f'{VARIANT_LABELS[winner]} better ({better} {metric})'
+
+
+def run_hypothesis_tests(df: pd.DataFrame, hypotheses: list = None, alpha: float = 0.05,
+                         by_task: bool = True, resamples: int = None, seed: int = DEFAULT_SEED,
+                         workers: int = None) -> dict:
+    """
+    Test each hypothesis on its metric from a single pivot of the index
+    
+    Args:
+        df: Scorecard index DataFrame
+        hypotheses: (name, metric, description, better) tuples, better being
+            'higher' or 'lower' (default: HYPOTHESES)
+        alpha: Significance level (uncorrected)
+        by_task: Include per-task strata in each result
+        resamples: If set, add bootstrap CIs and permutation p-values
+        seed: Resampling seed
+        workers: Process pool size for resampling chunks
+    
+    Returns:
+        dict: Hypothesis name -> result
+    """
+    hypotheses = HYPOTHESES if hypotheses is None else hypotheses
+    metrics = list(dict.fromkeys(hypothesis[1] for hypothesis in hypotheses))
+    tests = paired_tests(df, metrics, alpha, by_task, resamples=resamples, seed=seed, workers=workers)
+    
+    results = {}
+    for name, metric, description, better in hypotheses:
+        result = dict(tests['metrics'][metric])
+        direction = 'No significant difference'
+        if result['significant']:
+            direction = direction_label(result['cohens_d'], better, metric)
+        result.update({
+            'hypothesis': name,
+            'description': description,
+            'metric': metric,
+            'better': better,
+            'alpha': alpha,
+            'direction': direction,
+            'incomplete_pairs': tests['incomplete_pairs'],
+            'unpaired_runs': tests['unpaired_runs']
+        })
+        if by_task:
+            result['by_task'] = {task: strata[metric] for task, strata in tests['by_task'].items()}
+        results[name] = result
+    return results
+
+
+def bonferroni_inputs(results: dict) -> tuple:
+    """
+    Extract (p_values, hypothesis_names) for bonferroni_correction
+    
+    Hypotheses without a defined p-value (e.g. fewer than two pairs, or no
+    variance in the differences) cannot enter the correction and are omitted.
+    """
+    names = [name for name, result in results.items() if not np.isnan(result['p_value'])]
+    return [results[name]['p_value'] for name in names], names
+
+
+def print_result(result: dict):
+    """Print one hypothesis result"""
+    ci = result['confidence_interval_95']
+    significant = result['significant']
+    print(f"{result['hypothesis']} Test Results ({result['metric']}, n={result['sample_size']}):")
+    print(f"  t-statistic: {result['t_statistic']:.4f}")
+    print(f"  p-value: {result['p_value']:.4f}")
+    print(f"  Wilcoxon p-value: {result['wilcoxon_p_value']:.4f}")
+    print(f"  Cohen's d: {result['cohens_d']:.4f}")
+    print(f"  95% CI: [{ci[0]:.4f}, {ci[1]:.4f}]")
+    if 'bootstrap_ci_95' in result:
+        boot = result['bootstrap_ci_95']
+        print(f"  Bootstrap 95% CI: [{boot[0]:.4f}, {boot[1]:.4f}] ({result['resamples']} resamples)")
+        print(f"  Permutation p-value: {result['permutation_p_value']:.4f}")
+    print(f"  Result: {'SIGNIFICANT' if significant else 'NOT SIGNIFICANT'} (p {'<' if significant else '>='} {result['alpha']})")
+    if significant:
+        print(f"  Direction: {result['direction']}")
+    if result.get('incomplete_pairs') or result.get('unpaired_runs'):
+        print(f"  ⚠ Excluded: {len(result.get('incomplete_pairs', []))} incomplete pairs, "
+              f"{result.get('unpaired_runs', 0)} runs without pair_id")
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Run paired tests for all hypotheses')
+    parser.add_argument('--scorecard-index', required=True, help='Path to scorecard index (CSV, Parquet, or index directory)')
+    parser.add_argument('--hypotheses', nargs='+', help='Hypotheses to test (default: all)')
+    parser.add_argument('--alpha', type=float, default=0.05, help='Significance level (uncorrected)')
+    parser.add_argument('--resamples', type=int, help='Bootstrap/permutation replicates (e.g. 10000)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Resampling seed')
+    parser.add_argument('--workers', type=int, help='Processes for resampling chunks')
+    parser.add_argument('--output', required=True, help='Path to write results JSON')
+    
+    args = parser.parse_args()
+    
+    selected = [h for h in HYPOTHESES if not args.hypotheses or h[0] in args.hypotheses]
+    results = run_hypothesis_tests(
+        load_scorecard_index(args.scorecard_index), selected, args.alpha,
+        resamples=args.resamples, seed=args.seed, workers=args.workers
+    )
+    
+    for result in results.values():
+        print_result(result)
+    
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    
+    print(f"\n✓ Results written to {args.output}")
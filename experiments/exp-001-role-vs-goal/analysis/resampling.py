@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Resampling
+
+Bootstrap confidence intervals and sign-flip permutation tests for paired
+differences, as an alternative to t-intervals for binary or small-n data.
+
+Replicates are drawn as one index (or sign) matrix per chunk from a seeded
+generator and reduced with matrix products, so 10k-100k replicates over
+every metric column take a few array operations. Each chunk has its own
+child seed, so results depend only on the seed and chunk size, not on
+whether chunks run in-process or on a process pool.
+
+Missing pairs (NaN) are never resampled: columns are grouped by their
+missing-value pattern and each group is resampled over only the pairs
+it has data for, so every replicate of a column has the column's full
+effective n.
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+DEFAULT_RESAMPLES = 10000
+DEFAULT_SEED = 20250101
+
+# Replicates per chunk; bounds the (chunk x pairs) matrices held in memory
+CHUNK_SIZE = 5000
+
+
+def _as_matrix(diffs) -> np.ndarray:
+    """Paired differences as a float (pairs x columns) matrix"""
+    values = np.asarray(diffs, dtype=float)
+    return values.reshape(-1, 1) if values.ndim == 1 else values
+
+
+def _chunks(n_resamples: int, chunk_size: int, seed: int) -> list:
+    """Split replicates into (size, child seed) chunks"""
+    sizes = [chunk_size] * (n_resamples // chunk_size)
+    if n_resamples % chunk_size:
+        sizes.append(n_resamples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    return list(zip(sizes, seeds))
+
+
+def _bootstrap_chunk(values: np.ndarray, size: int, seed) -> np.ndarray:
+    """Means of `size` bootstrap resamples of each column (values has no NaNs)"""
+    n = values.shape[0]
+    rng = np.random.default_rng(seed)
+    index = rng.integers(0, n, size=(size, n))
+    
+    # Resample counts per pair, so each replicate mean is one row of a matrix product
+    offsets = (np.arange(size) * n)[:, None]
+    counts = np.bincount((index + offsets).ravel(), minlength=size * n).reshape(size, n)
+    return (counts @ values) / n
+
+
+def _sign_flip_chunk(values: np.ndarray, size: int, seed) -> np.ndarray:
+    """Means of `size` random sign flips of each column (values has no NaNs)"""
+    n = values.shape[0]
+    rng = np.random.default_rng(seed)
+    signs = rng.choice(np.array([-1.0, 1.0]), size=(size, n))
+    return (signs @ values) / n
+
+
+def _column_groups(values: np.ndarray) -> list:
+    """(observed-row mask, column indices) for each distinct missing-value pattern"""
+    valid = ~np.isnan(values)
+    groups = {}
+    for j in range(values.shape[1]):
+        groups.setdefault(valid[:, j].tobytes(), []).append(j)
+    return [(valid[:, columns[0]], columns) for columns in groups.values()]
+
+
+def _replicates(chunk_fn, values: np.ndarray, n_resamples: int, seed: int, chunk_size: int,
+                workers: int = None) -> np.ndarray:
+    """
+    Run chunk_fn over all chunks, optionally on a process pool; returns (n_resamples x columns)
+    
+    Each group of columns sharing a missing-value pattern is resampled over
+    its observed rows only, with the same chunk seeds, so a column's
+    replicates do not depend on which other columns are present. Columns
+    without any observed pair stay NaN.
+    """
+    replicates = np.full((n_resamples, values.shape[1]), np.nan)
+    blocks = [
+        (columns, values[np.ix_(rows, columns)])
+        for rows, columns in _column_groups(values)
+        if rows.any()
+    ]
+    chunks = _chunks(n_resamples, chunk_size, seed)
+    
+    if workers and workers > 1 and len(chunks) * len(blocks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (columns, [pool.submit(chunk_fn, block, size, child) for size, child in chunks])
+                for columns, block in blocks
+            ]
+            for columns, parts in futures:
+                replicates[:, columns] = np.vstack([future.result() for future in parts])
+    else:
+        for columns, block in blocks:
+            replicates[:, columns] = np.vstack([chunk_fn(block, size, child) for size, child in chunks])
+    return replicates
+
+
+def bootstrap_ci(diffs, n_resamples: int = DEFAULT_RESAMPLES, confidence: float = 0.95,
+                 seed: int = DEFAULT_SEED, chunk_size: int = CHUNK_SIZE, workers: int = None) -> dict:
+    """
+    Percentile bootstrap CI of the mean paired difference, per column
+    
+    Args:
+        diffs: Paired differences, 1-D or (pairs x metrics); NaN marks a missing pair
+        n_resamples: Number of bootstrap replicates
+        confidence: Confidence level
+        seed: Generator seed
+        chunk_size: Replicates per chunk
+        workers: Process pool size for chunks (None: in-process)
+    
+    Returns:
+        dict: Per-column 'low', 'high', 'standard_error' arrays
+    """
+    values = _as_matrix(diffs)
+    means = _replicates(_bootstrap_chunk, values, n_resamples, seed, chunk_size, workers)
+    
+    tail = (1 - confidence) / 2
+    # Columns without any observed pair stay NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        low, high = np.nanquantile(means, [tail, 1 - tail], axis=0)
+        standard_error = np.nanstd(means, axis=0, ddof=1)
+    
+    return {
+        'method': 'percentile_bootstrap',
+        'n_resamples': n_resamples,
+        'confidence': confidence,
+        'seed': seed,
+        'low': low,
+        'high': high,
+        'standard_error': standard_error
+    }
+
+
+def permutation_test(diffs, n_resamples: int = DEFAULT_RESAMPLES, seed: int = DEFAULT_SEED,
+                     chunk_size: int = CHUNK_SIZE, workers: int = None) -> dict:
+    """
+    Two-sided sign-flip permutation test of mean paired difference = 0, per column
+    
+    Under the null each pair's difference is equally likely to have either
+    sign, so replicates flip signs at random and compare |mean| to the observed.
+    
+    Args:
+        diffs: Paired differences, 1-D or (pairs x metrics); NaN marks a missing pair
+        n_resamples: Number of sign-flip replicates
+        seed: Generator seed
+        chunk_size: Replicates per chunk
+        workers: Process pool size for chunks (None: in-process)
+    
+    Returns:
+        dict: Per-column 'observed' mean and 'p_value' arrays
+    """
+    values = _as_matrix(diffs)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        observed = np.nanmean(values, axis=0)
+    means = _replicates(_sign_flip_chunk, values, n_resamples, seed, chunk_size, workers)
+    
+    # Tolerance keeps replicates equal to the observed mean (ties) in the tail
+    tolerance = 1e-12 * np.maximum(1.0, np.abs(observed))
+    extreme = (np.abs(means) >= np.abs(observed) - tolerance).sum(axis=0)
+    p_value = (extreme + 1) / (n_resamples + 1)
+    p_value = np.where(np.isnan(observed), np.nan, p_value)
+    
+    return {
+        'method': 'sign_flip_permutation',
+        'n_resamples': n_resamples,
+        'seed': seed,
+        'observed': observed,
+        'p_value': p_value
+    }
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Run Analysis
+
+Runs the full analysis stage in one process: the scorecard index is
+loaded once and shared by the sample size check, aggregates, and the
+H1-H5 paired tests, whose p-values are then Bonferroni corrected.
+Everything is written to a single results bundle.
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from bonferroni_correction import bonferroni_correction
+from compute_aggregates import compute_aggregates
+from paired_tests import bonferroni_inputs, print_result, run_hypothesis_tests
+from scorecard_index import load_scorecard_index
+from verify_sample_size import verify_sample_size
+
+
+def run_analysis(scorecard_index_path, output_dir: str, min_samples: int = 10, alpha: float = 0.05,
+                 resamples: int = None) -> dict:
+    """
+    Run all analysis steps against one in-memory scorecard index
+    
+    Args:
+        scorecard_index_path: Path to scorecard index (CSV/Parquet/index dir) or loaded DataFrame
+        output_dir: Directory for the aggregate CSVs and results bundle
+        min_samples: Minimum required samples per variant per task
+        alpha: Family-wise error rate for Bonferroni correction
+        resamples: If set, add bootstrap CIs and permutation p-values to each test
+    
+    Returns:
+        dict: Results bundle
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    df = load_scorecard_index(scorecard_index_path)
+    
+    print("=== Sample size ===")
+    sample_size = verify_sample_size(df, min_samples)
+    
+    print("\n=== Aggregates ===")
+    summary_path = output_dir / 'summary.csv'
+    compute_aggregates(df, str(summary_path))
+    
+    print("\n=== Hypothesis tests ===")
+    hypotheses = run_hypothesis_tests(df, alpha=alpha, resamples=resamples)
+    for result in hypotheses.values():
+        print_result(result)
+    
+    print("\n=== Bonferroni correction ===")
+    p_values, tested = bonferroni_inputs(hypotheses)
+    correction = bonferroni_correction(
+        p_values,
+        alpha,
+        tested
+    ) if tested else {'method': 'bonferroni', 'alpha': alpha, 'results': []}
+    
+    bundle = {
+        'generated_at': datetime.now().isoformat(),
+        'scorecard_index': None if isinstance(scorecard_index_path, pd.DataFrame) else str(scorecard_index_path),
+        'runs': len(df),
+        'sample_size': sample_size,
+        'aggregates': {
+            'summary': str(summary_path),
+            'by_task': str(summary_path).replace('.csv', '_by_task.csv')
+        },
+        'hypotheses': hypotheses,
+        'bonferroni': correction
+    }
+    
+    with open(output_dir / 'analysis-results.json', 'w') as f:
+        json.dump(bundle, f, indent=2)
+    
+    print(f"\n✓ Results bundle written to {output_dir / 'analysis-results.json'}")
+    
+    return bundle
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Run the full analysis from one scorecard index load')
+    parser.add_argument('--scorecard-index', required=True, help='Path to scorecard index (CSV, Parquet, or index directory)')
+    parser.add_argument('--output-dir', required=True, help='Directory to write aggregates and results bundle')
+    parser.add_argument('--min-samples', type=int, default=10, help='Minimum samples per variant')
+    parser.add_argument('--alpha', type=float, default=0.05, help='Family-wise error rate')
+    parser.add_argument('--resamples', type=int, help='Bootstrap/permutation replicates (e.g. 10000)')
+    
+    args = parser.parse_args()
+    
+    bundle = run_analysis(args.scorecard_index, args.output_dir, args.min_samples, args.alpha, args.resamples)
+    
+    sys.exit(0 if bundle['sample_size']['sufficient'] else 1)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Scorecard Index Loader
+
+Loads the scorecard index from CSV, a Parquet file, or the columnar index
+directory written by harness/workflows/create-scorecard-index.py. Index
+directories are merged by the harness's own reader (scorecard_store.py),
+so the analysis sees exactly the rows the index builder exports; it needs
+pyarrow, which CSV input does not, so it is only imported for them. Analysis
+functions accept an already-loaded DataFrame in place of a path, so a
+pipeline can read the index once and share it.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+HARNESS_WORKFLOWS_DIR = Path(__file__).resolve().parents[3] / 'harness' / 'workflows'
+
+
+def load_scorecard_index(source) -> pd.DataFrame:
+    """
+    Load the scorecard index
+    
+    Args:
+        source: DataFrame (returned as-is), CSV path, Parquet path, or index directory
+    
+    Returns:
+        pd.DataFrame: One row per run (no rows, but the index columns, for an empty index)
+    """
+    if isinstance(source, pd.DataFrame):
+        return source
+    
+    path = Path(source)
+    if path.is_dir():
+        if str(HARNESS_WORKFLOWS_DIR) not in sys.path:
+            sys.path.insert(0, str(HARNESS_WORKFLOWS_DIR))
+        from scorecard_store import read_index
+        return read_index(path).to_pandas()
+    
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path)
+    
+    return pd.read_csv(path)
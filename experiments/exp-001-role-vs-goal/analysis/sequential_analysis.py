@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Sequential Analysis
+
+Interim analysis that is updated as scorecards land, so the campaign can
+stop early once the primary result is conclusive.
+
+Per metric, running sufficient statistics of the paired differences
+(count, sum, sum of squares) are kept in a JSON state file; each new
+scorecard is folded in once, and half-complete pairs wait in the state
+until the other variant lands. Each interim look spends alpha with an
+O'Brien-Fleming-type Lan-DeMets function of the information fraction
+(complete pairs / planned pairs), and rejects at a look when the paired
+t-test p-value is below the alpha spent since the previous look. That
+boundary is conservative (the per-look increments sum to alpha, so the
+overall type I error is at most alpha for any number of looks).
+"""
+
+import json
+import math
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from scipy import stats
+
+from paired_tests import BASELINE, METRICS, TREATMENT
+
+
+PLANNED_PAIRS = 90  # 6 tasks x 15 pairs (full-runs-plan.md)
+PRIMARY_METRIC = 'task_success'
+
+
+def obrien_fleming_spending(information: float, alpha: float = 0.05) -> float:
+    """
+    Cumulative two-sided alpha spent at an information fraction
+    
+    Lan-DeMets approximation of O'Brien-Fleming: 2 - 2 * Phi(z_{1-alpha/2} / sqrt(t)).
+    Spends almost nothing early and the full alpha at t = 1.
+    """
+    if information <= 0:
+        return 0.0
+    t = min(information, 1.0)
+    return float(2 - 2 * stats.norm.cdf(stats.norm.ppf(1 - alpha / 2) / math.sqrt(t)))
+
+
+def new_state(planned_pairs: int = PLANNED_PAIRS, alpha: float = 0.05, metrics: list = None,
+              primary_metric: str = PRIMARY_METRIC) -> dict:
+    """Create an empty sequential analysis state"""
+    metrics = METRICS if metrics is None else metrics
+    return {
+        'planned_pairs': planned_pairs,
+        'alpha': alpha,
+        'primary_metric': primary_metric,
+        'treatment': TREATMENT,
+        'baseline': BASELINE,
+        'complete_pairs': 0,
+        'statistics': {metric: {'n': 0, 'sum': 0.0, 'sumsq': 0.0} for metric in metrics},
+        'pending': {},
+        'processed_runs': {},
+        'alpha_spent': 0.0,
+        'looks': [],
+        'decision': 'continue'
+    }
+
+
+def load_state(path: str, **defaults) -> dict:
+    """Load a state file, or create a new state if it does not exist"""
+    if Path(path).exists():
+        with open(path) as f:
+            return json.load(f)
+    return new_state(**defaults)
+
+
+def save_state(state: dict, path: str):
+    """Write the state atomically"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}-', suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def scorecard_row(scorecard: dict, manifest: dict) -> dict:
+    """Extract pairing keys and metric values from a scorecard and its manifest"""
+    metrics = scorecard.get('metrics', {})
+    
+    def block(*names):
+        for name in names:
+            value = metrics.get(name)
+            if isinstance(value, dict) and 'error' not in value:
+                return value
+        return {}
+    
+    success = block('task_success').get('success')
+    return {
+        'run_id': scorecard.get('run_id'),
+        'variant': scorecard.get('variant'),
+        'task_id': scorecard.get('task_id'),
+        'pair_id': manifest.get('pairing', {}).get('pair_id'),
+        'task_success': int(bool(success)) if success is not None else None,
+        'constraint_adherence': block('constraint_adherence').get('score'),
+        'runtime': block('runtime').get('total_seconds'),
+        'clarification_count': block('clarification_counter', 'clarification_count').get('total_count'),
+        'reproducibility': block('reproducibility').get('score')
+    }
+
+
+def ingest(state: dict, row: dict, source: str = None) -> str:
+    """
+    Fold one run into the running statistics
+    
+    Args:
+        state: Sequential analysis state (updated in place)
+        row: Run with run_id, variant, task_id, pair_id and metric values
+        source: Optional scorecard path recorded for the run
+    
+    Returns:
+        str: 'duplicate', 'ignored', 'pending', or 'paired'
+    """
+    run_id = row.get('run_id')
+    if run_id in state['processed_runs']:
+        return 'duplicate'
+    
+    variant = row.get('variant')
+    if variant not in (state['treatment'], state['baseline']) or not row.get('pair_id'):
+        return 'ignored'
+    
+    state['processed_runs'][run_id] = source
+    key = f"{row['task_id']}/{row['pair_id']}"
+    halves = state['pending'].setdefault(key, {})
+    halves[variant] = {metric: _value(row.get(metric)) for metric in state['statistics']}
+    
+    if len(halves) < 2:
+        return 'pending'
+    
+    treatment = halves[state['treatment']]
+    baseline = halves[state['baseline']]
+    for metric, running in state['statistics'].items():
+        if treatment[metric] is None or baseline[metric] is None:
+            continue
+        diff = treatment[metric] - baseline[metric]
+        running['n'] += 1
+        running['sum'] += diff
+        running['sumsq'] += diff * diff
+    
+    del state['pending'][key]
+    state['complete_pairs'] += 1
+    return 'paired'
+
+
+def _value(value):
+    """Metric value as float, None if missing"""
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def metric_test(running: dict) -> dict:
+    """Paired t-test from running count, sum and sum of squares"""
+    n = running['n']
+    result = {'n': n, 'mean_difference': None, 't_statistic': None, 'p_value': None, 'cohens_d': None}
+    if n == 0:
+        return result
+    
+    mean = running['sum'] / n
+    result['mean_difference'] = mean
+    if n < 2:
+        return result
+    
+    variance = max(running['sumsq'] - n * mean * mean, 0.0) / (n - 1)
+    if variance == 0:
+        return result
+    
+    t_stat = mean / math.sqrt(variance / n)
+    result.update({
+        't_statistic': t_stat,
+        'p_value': float(2 * stats.t.sf(abs(t_stat), n - 1)),
+        'cohens_d': mean / math.sqrt(variance)
+    })
+    return result
+
+
+def interim_look(state: dict) -> dict:
+    """
+    Perform an interim look if information increased since the last one
+    
+    Returns:
+        dict: The look (the previous look if no new pairs completed)
+    """
+    previous = state['looks'][-1] if state['looks'] else None
+    if previous and previous['complete_pairs'] == state['complete_pairs']:
+        return previous
+    
+    information = state['complete_pairs'] / state['planned_pairs']
+    cumulative = obrien_fleming_spending(information, state['alpha'])
+    boundary = max(cumulative - state['alpha_spent'], 0.0)
+    
+    tests = {}
+    for metric, running in state['statistics'].items():
+        test = metric_test(running)
+        test['crossed'] = test['p_value'] is not None and test['p_value'] < boundary
+        tests[metric] = test
+    
+    primary = tests.get(state['primary_metric'], {})
+    if primary.get('crossed'):
+        decision = 'stop_for_efficacy'
+    elif information >= 1:
+        decision = 'planned_sample_reached'
+    else:
+        decision = 'continue'
+    
+    look = {
+        'look': len(state['looks']) + 1,
+        'timestamp': datetime.now().isoformat(),
+        'complete_pairs': state['complete_pairs'],
+        'pending_pairs': len(state['pending']),
+        'information_fraction': information,
+        'cumulative_alpha': cumulative,
+        'boundary_alpha': boundary,
+        'tests': tests,
+        'decision': decision
+    }
+    state['looks'].append(look)
+    state['alpha_spent'] = cumulative
+    state['decision'] = decision
+    return look
+
+
+def scan_runs_dir(state: dict, runs_dir: str) -> dict:
+    """
+    Ingest scorecards under runs_dir that the state has not seen yet
+    
+    Returns:
+        dict: Count of runs per ingest outcome
+    """
+    seen = set(state['processed_runs'].values())
+    outcomes = {}
+    for scorecard_path in sorted(Path(runs_dir).rglob('scorecard.json')):
+        if str(scorecard_path) in seen:
+            continue
+        outcome = ingest_scorecard(state, scorecard_path)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return outcomes
+
+
+def ingest_scorecard(state: dict, scorecard_path) -> str:
+    """Ingest one scorecard.json (pairing read from the sibling manifest.json)"""
+    scorecard_path = Path(scorecard_path)
+    with open(scorecard_path) as f:
+        scorecard = json.load(f)
+    manifest = {}
+    manifest_path = scorecard_path.parent / 'manifest.json'
+    if manifest_path.exists():
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    return ingest(state, scorecard_row(scorecard, manifest), str(scorecard_path))
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Update interim analysis as scorecards land')
+    parser.add_argument('--state', required=True, help='Sequential analysis state JSON (created if missing)')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--scorecards', nargs='+', help='New scorecard.json files')
+    source.add_argument('--runs-dir', help='Ingest every not-yet-seen scorecard.json under this directory')
+    parser.add_argument('--planned-pairs', type=int, default=PLANNED_PAIRS, help='Planned complete pairs (new state only)')
+    parser.add_argument('--alpha', type=float, default=0.05, help='Two-sided alpha (new state only)')
+    
+    args = parser.parse_args()
+    
+    state = load_state(args.state, planned_pairs=args.planned_pairs, alpha=args.alpha)
+    
+    if args.runs_dir:
+        outcomes = scan_runs_dir(state, args.runs_dir)
+    else:
+        outcomes = {}
+        for path in args.scorecards:
+            outcome = ingest_scorecard(state, path)
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    
+    look = interim_look(state)
+    save_state(state, args.state)
+    
+    print(f"Ingested: {outcomes}")
+    print(f"Look {look['look']}: {look['complete_pairs']}/{state['planned_pairs']} pairs "
+          f"(t={look['information_fraction']:.2f}), boundary alpha={look['boundary_alpha']:.5f}")
+    for metric, test in look['tests'].items():
+        p_value = 'n/a' if test['p_value'] is None else f"{test['p_value']:.5f}"
+        marker = '✓' if test['crossed'] else ' '
+        print(f"  {marker} {metric}: n={test['n']}, p={p_value}")
+    
+    if look['decision'] == 'stop_for_efficacy':
+        print(f"\n✓ Primary metric ({state['primary_metric']}) crossed the boundary: campaign can stop")
+    elif look['decision'] == 'planned_sample_reached':
+        print('\n✓ Planned sample reached')
+    else:
+        print('\n⚠ Boundary not crossed: continue')
@@ -2,25 +2,31 @@
 """
 Verify Sample Size
 
-Checks that sufficient paired runs exist for each task.
+Checks that sufficient paired runs exist for each task, and that every
+pair_id has a run of both variants.
 """
 
 import pandas as pd
 import sys
 
+from scorecard_index import load_scorecard_index
 
-def verify_sample_size(scorecard_index_path: str, min_samples: int = 10) -> dict:
+
+VARIANTS = ['role-centric', 'goal-centric']
+
+
+def verify_sample_size(scorecard_index_path, min_samples: int = 10) -> dict:
     """
     Verify sufficient samples for statistical analysis
     
     Args:
-        scorecard_index_path: Path to scorecard index CSV
+        scorecard_index_path: Path to scorecard index (CSV/Parquet/index dir) or loaded DataFrame
         min_samples: Minimum required samples per variant per task
     
     Returns:
         dict: Verification results
     """
-    df = pd.read_csv(scorecard_index_path)
+    df = load_scorecard_index(scorecard_index_path)
     
     results = {
         'sufficient': True,
@@ -28,18 +34,36 @@ def verify_sample_size(scorecard_index_path: str, min_samples: int = 10) -> dict
         'warnings': []
     }
     
-    # Check paired runs per task
-    for task in df['task_id'].unique():
-        task_df = df[df['task_id'] == task]
-        role_count = len(task_df[task_df['variant'] == 'role-centric'])
-        goal_count = len(task_df[task_df['variant'] == 'goal-centric'])
+    # Runs per (task, variant) in one pass; absent variants count as zero
+    counts = (
+        df.groupby(['task_id', 'variant']).size()
+        .unstack('variant', fill_value=0)
+        .reindex(columns=VARIANTS, fill_value=0)
+    )
+    
+    # Pair completeness: every pair_id needs at least one run of each variant
+    paired = df.dropna(subset=['pair_id'])
+    has_variant = pd.crosstab(
+        [paired['task_id'], paired['pair_id']], paired['variant']
+    ).reindex(columns=VARIANTS, fill_value=0) > 0
+    complete = has_variant.all(axis=1)
+    complete_pairs = complete.groupby(level='task_id').sum()
+    incomplete_pairs = complete[~complete].reset_index().groupby('task_id')['pair_id'].agg(sorted)
+    
+    for task, row in counts.iterrows():
+        role_count = int(row['role-centric'])
+        goal_count = int(row['goal-centric'])
+        task_complete = int(complete_pairs.get(task, 0))
+        task_incomplete = list(incomplete_pairs.get(task, []))
         
         results['tasks'][task] = {
             'role_centric': role_count,
-            'goal_centric': goal_count
+            'goal_centric': goal_count,
+            'complete_pairs': task_complete,
+            'incomplete_pairs': task_incomplete
         }
         
-        print(f"{task}: role={role_count}, goal={goal_count}")
+        print(f"{task}: role={role_count}, goal={goal_count}, complete_pairs={task_complete}")
         
         if role_count < min_samples or goal_count < min_samples:
             results['sufficient'] = False
@@ -51,6 +75,17 @@ def verify_sample_size(scorecard_index_path: str, min_samples: int = 10) -> dict
             results['warnings'].append(
                 f"{task}: Unbalanced pairs (role={role_count}, goal={goal_count})"
             )
+        
+        if task_complete < min_samples:
+            results['sufficient'] = False
+            results['warnings'].append(
+                f"{task}: Insufficient complete pairs ({task_complete}, min {min_samples} required)"
+            )
+        
+        if task_incomplete:
+            results['warnings'].append(
+                f"{task}: Incomplete pairs missing a variant: {', '.join(map(str, task_incomplete))}"
+            )
     
     return results
 
@@ -3,66 +3,145 @@
 Clarification Counter
 
 Counts and categorizes clarification requests in agent execution log.
+
+Patterns and category keywords are compiled once per configuration; each
+log entry is lowercased once and matched entries are categorized in the
+same pass, recording which pattern hit.
 """
 
 import json
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from execution_log import ExecutionLog, LogEntry, load_execution_log
+
+
+DEFAULT_CLARIFICATION_PATTERNS = [
+    r'(?i)ask.*clarification',
+    r'(?i)need.*clarification',
+    r'(?i)unclear',
+    r'(?i)ambiguous',
+    r'(?i)missing.*information',
+    r'(?i)request.*clarification',
+    r'(?i)what.*format',
+    r'(?i)where.*save',
+    r'(?i)which.*option'
+]
+
+INLINE_IGNORECASE = re.compile(r'^\(\?i\)')
+
+# Category -> keywords, in priority order (first category with a hit wins)
+DEFAULT_CATEGORIES = {
+    'missing_information': ['missing', 'not provided'],
+    'ambiguous_specification': ['ambiguous', 'unclear', 'multiple'],
+    'constraint_clarification': ['constraint', 'permission'],
+    'output_format': ['format', 'output']
+}
+
+
+class ClarificationMatcher:
+    """Compiled clarification patterns and category keywords"""
+    
+    def __init__(self, patterns: Tuple[str, ...], categories: Tuple[Tuple[str, Tuple[str, ...]], ...]):
+        # Messages are lowercased once per entry, so all-lowercase patterns
+        # can skip case-insensitive matching, which is markedly slower in re
+        self._patterns = []
+        for pattern in patterns:
+            body = INLINE_IGNORECASE.sub('', pattern)
+            flags = 0 if body == body.lower() else re.IGNORECASE
+            self._patterns.append((pattern, re.compile(body, flags)))
+        
+        self._categories = [
+            (category, tuple(word.lower() for word in words))
+            for category, words in categories
+        ]
+    
+    def match(self, message: str) -> Optional[Tuple[str, str]]:
+        """
+        Match and categorize a message in one pass
+        
+        Returns:
+            (matched pattern, category) for clarification requests, None otherwise
+        """
+        lowered = message.lower()
+        for pattern, regex in self._patterns:
+            if regex.search(lowered):
+                return pattern, self._categorize(lowered)
+        return None
+    
+    def categorize(self, message: str) -> str:
+        """Return the highest-priority category whose keywords appear in the message"""
+        return self._categorize(message.lower())
+    
+    def _categorize(self, lowered: str) -> str:
+        for category, words in self._categories:
+            if any(word in lowered for word in words):
+                return category
+        return 'other'
 
 
-def matches_clarification_pattern(log_entry: Dict, patterns: List[str]) -> bool:
+@lru_cache(maxsize=16)
+def _compile_matcher(patterns: Tuple[str, ...], categories: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> ClarificationMatcher:
+    return ClarificationMatcher(patterns, categories)
+
+
+def compile_matcher(patterns: List[str] = None, categories: Dict[str, List[str]] = None) -> ClarificationMatcher:
+    """
+    Compile (or reuse) a matcher for a pattern/category configuration
+    
+    Args:
+        patterns: Clarification regexes (default: DEFAULT_CLARIFICATION_PATTERNS)
+        categories: Ordered category -> keywords mapping (default: DEFAULT_CATEGORIES)
+    
+    Returns:
+        ClarificationMatcher: Cached compiled matcher
+    """
+    patterns = DEFAULT_CLARIFICATION_PATTERNS if patterns is None else patterns
+    categories = DEFAULT_CATEGORIES if categories is None else categories
+    return _compile_matcher(
+        tuple(patterns),
+        tuple((category, tuple(words)) for category, words in categories.items())
+    )
+
+
+def matches_clarification_pattern(log_entry: LogEntry, patterns: List[str]) -> bool:
     """Check if log entry matches clarification patterns"""
-    message = log_entry.get('message', '').lower()
-    return any(re.search(pattern, message, re.IGNORECASE) for pattern in patterns)
+    return compile_matcher(patterns).match(log_entry.message) is not None
 
 
-def categorize_request(log_entry: Dict) -> str:
+def categorize_request(log_entry: LogEntry) -> str:
     """Categorize clarification request"""
-    message = log_entry.get('message', '').lower()
-    
-    if 'missing' in message or 'not provided' in message:
-        return 'missing_information'
-    elif 'ambiguous' in message or 'unclear' in message or 'multiple' in message:
-        return 'ambiguous_specification'
-    elif 'constraint' in message or 'permission' in message:
-        return 'constraint_clarification'
-    elif 'format' in message or 'output' in message:
-        return 'output_format'
-    else:
-        return 'other'
+    return compile_matcher().categorize(log_entry.message)
 
 
-def count_clarifications(execution_log: Dict) -> Dict[str, Any]:
+def count_clarifications(execution_log: Union[ExecutionLog, Dict], patterns: List[str] = None,
+                         categories: Dict[str, List[str]] = None) -> Dict[str, Any]:
     """
     Count and categorize clarification requests
     
     Args:
-        execution_log: Agent execution log
+        execution_log: Agent execution log (ExecutionLog or raw dict)
+        patterns: Optional clarification regexes from the pinned evaluator config
+        categories: Optional ordered category -> keywords mapping from the pinned evaluator config
     
     Returns:
         dict: Clarification counts and details
     """
-    clarification_patterns = [
-        r'(?i)ask.*clarification',
-        r'(?i)need.*clarification',
-        r'(?i)unclear',
-        r'(?i)ambiguous',
-        r'(?i)missing.*information',
-        r'(?i)request.*clarification',
-        r'(?i)what.*format',
-        r'(?i)where.*save',
-        r'(?i)which.*option'
-    ]
+    matcher = compile_matcher(patterns, categories)
     
     requests = []
-    log_entries = execution_log.get('entries', [])
+    log_entries = ExecutionLog.coerce(execution_log).iter_entries()
     
     for log_entry in log_entries:
-        if matches_clarification_pattern(log_entry, clarification_patterns):
+        hit = matcher.match(log_entry.message)
+        if hit is not None:
+            pattern, category = hit
             requests.append({
-                'timestamp': log_entry.get('timestamp'),
-                'content': log_entry.get('message'),
-                'category': categorize_request(log_entry)
+                'timestamp': log_entry.timestamp,
+                'content': log_entry.raw.get('message'),
+                'category': category,
+                'matched_pattern': pattern
             })
     
     # Count by category
@@ -86,14 +165,19 @@ def main():
     
     parser = argparse.ArgumentParser(description='Count clarification requests')
     parser.add_argument('--execution-log', required=True, help='Path to execution log JSON')
+    parser.add_argument('--config', help='Path to evaluator config JSON with patterns/categories')
     parser.add_argument('--output', required=True, help='Path to write evaluation results')
     
     args = parser.parse_args()
     
-    with open(args.execution_log) as f:
-        execution_log = json.load(f)
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    
+    execution_log = load_execution_log(args.execution_log)
     
-    results = count_clarifications(execution_log)
+    results = count_clarifications(execution_log, config.get('patterns'), config.get('categories'))
     
     with open(args.output, 'w') as f:
         json.dump(results, f, indent=2)
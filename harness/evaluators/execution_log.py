@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Execution Log
+
+Parse-once loader for agent execution logs shared by all evaluators.
+
+Two on-disk formats are readable:
+
+- Whole-document JSON: one object with top-level fields and the
+  events / entries / file_operations / tool_invocations arrays. The file
+  is parsed a single time; each section is materialized into a typed view
+  on first access. Records are ordered within a section, but the document
+  does not record how sections interleave (file operations usually carry
+  no timestamp).
+- JSONL: one record per line, tagged with a "kind" of meta, event, entry,
+  file_operation or tool_invocation. Meta records carry top-level fields
+  (start_timestamp, end_timestamp, timeout_seconds, ...). Sections are
+  streamed from disk by generators, so consumers run in constant memory
+  and logs can be scored while they are still being written.
+
+Recently loaded logs are kept in a small LRU cache so that repeated
+evaluations of the same run reuse the parse.
+"""
+
+import json
+import re
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Tuple, Union
+
+
+# Number of parsed logs kept in memory
+LOG_CACHE_SIZE = 8
+
+# File operations that change the file system; anything else is a read
+WRITE_OPERATIONS = frozenset({
+    'write', 'append', 'create', 'modify', 'delete', 'move', 'rename', 'chmod', 'truncate', 'mkdir'
+})
+
+# Log entry messages that report an error, or a clarification request / assumption
+ERROR_PATTERN = re.compile(r'(?i)\berror\b|not found|no such file|enoent|exception|failed')
+CLARIFICATION_PATTERN = re.compile(r'(?i)clarif|assum|unclear|ambigu')
+
+
+class Event(NamedTuple):
+    """Execution event (phase boundaries such as plan_start / plan_end)"""
+    type: str
+    timestamp: str
+    raw: Dict
+
+
+class LogEntry(NamedTuple):
+    """Free-text agent log entry"""
+    timestamp: str
+    message: str
+    raw: Dict
+
+
+class FileOperation(NamedTuple):
+    """File system operation performed by the agent"""
+    path: str
+    operation: str
+    raw: Dict
+
+
+class ToolInvocation(NamedTuple):
+    """Tool call made by the agent"""
+    tool: str
+    timestamp: str
+    raw: Dict
+
+
+def _event(record: Dict) -> Event:
+    return Event(record.get('type') or '', record.get('timestamp'), record)
+
+
+def _entry(record: Dict) -> LogEntry:
+    return LogEntry(record.get('timestamp'), record.get('message') or '', record)
+
+
+def _file_operation(record: Dict) -> FileOperation:
+    return FileOperation(record.get('path') or '', record.get('operation') or '', record)
+
+
+def _tool_invocation(record: Dict) -> ToolInvocation:
+    return ToolInvocation(record.get('tool'), record.get('timestamp'), record)
+
+
+# JSONL record kind -> typed view constructor
+RECORD_KINDS = {
+    'event': _event,
+    'entry': _entry,
+    'file_operation': _file_operation,
+    'tool_invocation': _tool_invocation
+}
+
+
+class ExecutionLog:
+    """
+    Parsed execution log with lazily materialized section views
+    
+    Scalar top-level fields (start_timestamp, runtime_seconds, ...) are
+    available through get(), mirroring the raw dict interface. The iter_*
+    methods are the streaming interface shared with StreamingExecutionLog.
+    """
+    
+    def __init__(self, data: Dict, path: str = None):
+        self._data = data
+        self.path = path
+    
+    @classmethod
+    def coerce(cls, execution_log: Union['ExecutionLog', Dict]) -> 'ExecutionLog':
+        """Accept either a parsed ExecutionLog or a raw log dict"""
+        if isinstance(execution_log, cls):
+            return execution_log
+        return cls(execution_log)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a top-level log field"""
+        return self._data.get(key, default)
+    
+    @cached_property
+    def events(self) -> Tuple[Event, ...]:
+        return tuple(_event(e) for e in self._data.get('events', []))
+    
+    @cached_property
+    def entries(self) -> Tuple[LogEntry, ...]:
+        return tuple(_entry(e) for e in self._data.get('entries', []))
+    
+    @cached_property
+    def file_operations(self) -> Tuple[FileOperation, ...]:
+        return tuple(_file_operation(op) for op in self._data.get('file_operations', []))
+    
+    @cached_property
+    def tool_invocations(self) -> Tuple[ToolInvocation, ...]:
+        return tuple(_tool_invocation(inv) for inv in self._data.get('tool_invocations', []))
+    
+    def iter_events(self) -> Iterator[Event]:
+        return iter(self.events)
+    
+    def iter_entries(self) -> Iterator[LogEntry]:
+        return iter(self.entries)
+    
+    def iter_file_operations(self) -> Iterator[FileOperation]:
+        return iter(self.file_operations)
+    
+    def iter_tool_invocations(self) -> Iterator[ToolInvocation]:
+        return iter(self.tool_invocations)
+    
+    def iter_records(self) -> Iterator[Tuple[str, Any]]:
+        """
+        (kind, typed view) of every event, entry, file operation and tool invocation
+        
+        A whole-document log has no order across sections, so records come
+        section by section, each in log order. Only StreamingExecutionLog
+        yields records in true log order; consumers that depend on how kinds
+        interleave must not be run on whole-document logs.
+        """
+        for kind, section in (('event', self.events), ('entry', self.entries),
+                              ('file_operation', self.file_operations),
+                              ('tool_invocation', self.tool_invocations)):
+            for record in section:
+                yield kind, record
+
+
+def iter_log_records(path: Union[str, Path]) -> Iterator[Dict]:
+    """
+    Stream records from a JSONL execution log, one parsed line at a time
+    
+    Args:
+        path: Path to JSONL execution log
+    
+    Yields:
+        dict: Log record with its "kind" tag
+    """
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def is_jsonl_log(path: Union[str, Path]) -> bool:
+    """Detect JSONL logs by extension or a kind-tagged first record"""
+    path = Path(path)
+    if path.suffix == '.jsonl':
+        return True
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            # Cheap reject so single-line JSON documents are not parsed twice
+            if '"kind"' not in line:
+                return False
+            try:
+                first = json.loads(line)
+            except json.JSONDecodeError:
+                return False
+            return isinstance(first, dict) and 'kind' in first
+    return False
+
+
+class StreamingExecutionLog(ExecutionLog):
+    """
+    JSONL execution log read incrementally from disk
+    
+    Each iter_* call re-reads the file and yields only records of its kind,
+    so a consumer holds one record in memory at a time. The tuple views
+    are still available but materialize the whole section.
+    """
+    
+    def __init__(self, path: str):
+        super().__init__({}, path)
+    
+    @cached_property
+    def _meta(self) -> Dict:
+        meta = {}
+        for record in iter_log_records(self.path):
+            if record.get('kind') == 'meta':
+                meta.update((k, v) for k, v in record.items() if k != 'kind')
+        return meta
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a top-level field merged from meta records"""
+        return self._meta.get(key, default)
+    
+    def _iter_kind(self, kind: str) -> Iterator:
+        convert = RECORD_KINDS[kind]
+        for record in iter_log_records(self.path):
+            if record.get('kind') == kind:
+                yield convert(record)
+    
+    @cached_property
+    def events(self) -> Tuple[Event, ...]:
+        return tuple(self.iter_events())
+    
+    @cached_property
+    def entries(self) -> Tuple[LogEntry, ...]:
+        return tuple(self.iter_entries())
+    
+    @cached_property
+    def file_operations(self) -> Tuple[FileOperation, ...]:
+        return tuple(self.iter_file_operations())
+    
+    @cached_property
+    def tool_invocations(self) -> Tuple[ToolInvocation, ...]:
+        return tuple(self.iter_tool_invocations())
+    
+    def iter_events(self) -> Iterator[Event]:
+        return self._iter_kind('event')
+    
+    def iter_entries(self) -> Iterator[LogEntry]:
+        return self._iter_kind('entry')
+    
+    def iter_file_operations(self) -> Iterator[FileOperation]:
+        return self._iter_kind('file_operation')
+    
+    def iter_tool_invocations(self) -> Iterator[ToolInvocation]:
+        return self._iter_kind('tool_invocation')
+    
+    def iter_records(self) -> Iterator[Tuple[str, Any]]:
+        """(kind, typed view) of every non-meta record, in log order, in one read of the file"""
+        for record in iter_log_records(self.path):
+            convert = RECORD_KINDS.get(record.get('kind'))
+            if convert is not None:
+                yield record['kind'], convert(record)
+
+
+@lru_cache(maxsize=LOG_CACHE_SIZE)
+def _load_cached(path: str, mtime_ns: int, size: int) -> ExecutionLog:
+    """Parse a log file; cache key includes mtime/size so edits invalidate"""
+    if is_jsonl_log(path):
+        return StreamingExecutionLog(path)
+    with open(path) as f:
+        return ExecutionLog(json.load(f), path)
+
+
+def load_execution_log(path: Union[str, Path]) -> ExecutionLog:
+    """
+    Load an execution log, reusing a cached parse when the file is unchanged
+    
+    Args:
+        path: Path to execution log (JSON document or JSONL)
+    
+    Returns:
+        ExecutionLog: Parsed log (StreamingExecutionLog for JSONL)
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _load_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+File Hashing
+
+Streaming SHA256 hashing of output files with a persistent content-hash
+cache shared by all evaluators.
+
+Files are hashed in fixed-size chunks, so memory use does not grow with
+file size. Digests are cached on disk keyed by (path, inode, size, mtime),
+so re-evaluating or replaying locked runs never re-hashes unchanged files.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union
+
+
+CHUNK_SIZE = 1024 * 1024
+
+# Persistent cache location; set HARNESS_HASH_CACHE to an empty string to disable
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'agent-design-lab' / 'file-hashes.sqlite3'
+
+# Files modified this recently are hashed but not cached: a rewrite within
+# the same mtime tick that keeps the size would otherwise go unnoticed
+RACY_WINDOW_SECONDS = 2.0
+
+# Digests kept in memory per cache (least recently used evicted); SQLite holds the rest
+MEMORY_CACHE_SIZE = 1024
+
+
+def hash_file(filepath: Union[str, Path], chunk_size: int = CHUNK_SIZE) -> str:
+    """Compute SHA256 hex digest of a file, streaming fixed-size chunks"""
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(filepath, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+class HashCache:
+    """
+    Persistent SHA256 cache keyed by (path, inode, size, mtime_ns)
+    
+    Backed by SQLite in WAL mode so concurrent evaluator processes can
+    share it. A connection is opened lazily per process and thread, and
+    the most recently used digests are also kept in memory.
+    """
+    
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._memory = OrderedDict()
+        self._memory_lock = threading.Lock()
+    
+    def _remember(self, key: tuple, digest: str):
+        with self._memory_lock:
+            self._memory[key] = digest
+            self._memory.move_to_end(key)
+            while len(self._memory) > MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+    
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        if getattr(local, 'conn', None) is None or local.pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS file_hashes ('
+                ' path TEXT NOT NULL, inode INTEGER NOT NULL, size INTEGER NOT NULL,'
+                ' mtime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL,'
+                ' PRIMARY KEY (path, inode, size, mtime_ns))'
+            )
+            local.conn = conn
+            local.pid = os.getpid()
+        return local.conn
+    
+    def file_hash(self, filepath: Union[str, Path]) -> str:
+        """Return the SHA256 hex digest of a file, hashing only on cache miss"""
+        path = str(Path(filepath).resolve())
+        stat = os.stat(path)
+        key = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        
+        with self._memory_lock:
+            digest = self._memory.get(key)
+            if digest is not None:
+                self._memory.move_to_end(key)
+                return digest
+        
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT sha256 FROM file_hashes WHERE path=? AND inode=? AND size=? AND mtime_ns=?',
+            key
+        ).fetchone()
+        if row:
+            self._remember(key, row[0])
+            return row[0]
+        
+        digest = hash_file(path)
+        if time.time() - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS:
+            with conn:
+                conn.execute('DELETE FROM file_hashes WHERE path=?', (path,))
+                conn.execute('INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)', key + (digest,))
+            self._remember(key, digest)
+        return digest
+
+
+_default_cache = None
+
+
+def default_cache() -> Union[HashCache, None]:
+    """Process-wide cache at HARNESS_HASH_CACHE (default under ~/.cache), None if disabled"""
+    global _default_cache
+    if _default_cache is None:
+        location = os.environ.get('HARNESS_HASH_CACHE', str(DEFAULT_CACHE_PATH))
+        if not location:
+            return None
+        _default_cache = HashCache(location)
+    return _default_cache
+
+
+def cached_file_hash(filepath: Union[str, Path]) -> str:
+    """
+    Compute SHA256 hex digest of a file through the persistent cache
+    
+    Falls back to plain streaming hashing when the cache is disabled or
+    cannot be opened (e.g. read-only home directory).
+    """
+    cache = default_cache()
+    if cache is not None:
+        try:
+            return cache.file_hash(filepath)
+        except (sqlite3.Error, OSError):
+            pass
+    return hash_file(filepath)
@@ -8,13 +8,14 @@ Compares outputs across runs with identical inputs/seeds to assess reproducibili
 import json
 import hashlib
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+from file_hashing import cached_file_hash
 
 
 def compute_file_hash(filepath: Path) -> str:
-    """Compute SHA256 hash of file"""
-    with open(filepath, 'rb') as f:
-        return hashlib.sha256(f.read()).hexdigest()
+    """Compute SHA256 hash of file (streamed, cached by inode/size/mtime)"""
+    return cached_file_hash(filepath)
 
 
 def compare_outputs(reference_run: Dict, comparison_run: Dict) -> List[Dict]:
@@ -99,26 +100,146 @@ def evaluate_reproducibility(runs_with_same_seed: List[Dict]) -> Dict[str, Any]:
     }
 
 
+def output_fingerprint(run: Dict) -> Tuple[Tuple[str, str], ...]:
+    """Canonical (path, hash) tuple of a run's outputs; equal iff outputs are identical"""
+    files = run.get('outputs', {}).get('files', [])
+    return tuple(sorted((f['path'], f['hash']) for f in files))
+
+
+def _fingerprint_id(fingerprint: Tuple[Tuple[str, str], ...]) -> str:
+    """Short stable identifier for an output equivalence class"""
+    return hashlib.sha256(json.dumps(fingerprint).encode()).hexdigest()[:16]
+
+
+def evaluate_group_reproducibility(runs: List[Dict]) -> Dict[str, Any]:
+    """
+    Reproducibility of one (task, variant, seed) group in a single pass
+    
+    Runs are bucketed by output fingerprint, so the group costs one pass
+    over its runs rather than n-1 pairwise diffs. Only one representative
+    per non-reference class is diffed against the reference, to explain
+    how the classes differ.
+    
+    Args:
+        runs: Run manifests sharing task, variant and seed (first is the reference)
+    
+    Returns:
+        dict: Score, comparisons, and output equivalence classes
+    """
+    classes = {}
+    for run in runs:
+        classes.setdefault(output_fingerprint(run), []).append(run)
+    
+    reference_run = runs[0]
+    reference_fingerprint = output_fingerprint(reference_run)
+    total_comparisons = len(runs) - 1
+    identical_runs = len(classes[reference_fingerprint]) - 1
+    
+    equivalence_classes = []
+    for fingerprint, members in classes.items():
+        is_reference = fingerprint == reference_fingerprint
+        equivalence_classes.append({
+            'class_id': _fingerprint_id(fingerprint),
+            'is_reference': is_reference,
+            'size': len(members),
+            'run_ids': [run.get('run_id') for run in members],
+            'files': len(fingerprint),
+            'differences_from_reference': [] if is_reference else compare_outputs(reference_run, members[0])
+        })
+    equivalence_classes.sort(key=lambda c: (not c['is_reference'], -c['size']))
+    
+    return {
+        'score': identical_runs / total_comparisons if total_comparisons > 0 else None,
+        'reference_run_id': reference_run.get('run_id'),
+        'identical_runs': identical_runs,
+        'total_comparisons': total_comparisons,
+        'distinct_outputs': len(classes),
+        'equivalence_classes': equivalence_classes
+    }
+
+
+def evaluate_campaign_reproducibility(manifests: List[Dict]) -> Dict[str, Any]:
+    """
+    Reproducibility for every (task_id, variant, seed) group of a campaign
+    
+    Args:
+        manifests: All run manifests of the campaign
+    
+    Returns:
+        dict: Consolidated report with one entry per group
+    """
+    groups = {}
+    for manifest in sorted(manifests, key=lambda m: m.get('run_id') or ''):
+        task = manifest.get('task', {})
+        key = (
+            task.get('task_id'),
+            manifest.get('variant', {}).get('variant_id'),
+            task.get('seed')
+        )
+        groups.setdefault(key, []).append(manifest)
+    
+    report = []
+    for (task_id, variant, seed), runs in sorted(groups.items(), key=lambda item: tuple(str(k) for k in item[0])):
+        group = {
+            'task_id': task_id,
+            'variant': variant,
+            'seed': seed,
+            'runs': len(runs)
+        }
+        if len(runs) < 2:
+            group.update({'score': None, 'reason': 'insufficient_runs'})
+        else:
+            group.update(evaluate_group_reproducibility(runs))
+        report.append(group)
+    
+    scored = [g for g in report if g['score'] is not None]
+    return {
+        'groups': report,
+        'total_groups': len(report),
+        'scored_groups': len(scored),
+        'fully_reproducible_groups': sum(1 for g in scored if g['score'] == 1),
+        'mean_score': sum(g['score'] for g in scored) / len(scored) if scored else None,
+        'evaluator': 'reproducibility',
+        'version': '1.0.0'
+    }
+
+
 def main():
     """CLI entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Evaluate reproducibility')
-    parser.add_argument('--runs', required=True, nargs='+', help='Paths to run manifest JSONs')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--runs', nargs='+', help='Paths to run manifest JSONs')
+    source.add_argument('--runs-dir', help='Scan all manifests under this directory and report per (task, variant, seed) group')
     parser.add_argument('--output', required=True, help='Path to write evaluation results')
     
     args = parser.parse_args()
     
+    run_paths = args.runs or sorted(str(p) for p in Path(args.runs_dir).rglob('manifest.json'))
     runs = []
-    for run_path in args.runs:
+    for run_path in run_paths:
         with open(run_path) as f:
             runs.append(json.load(f))
     
-    results = evaluate_reproducibility(runs)
+    if args.runs_dir:
+        results = evaluate_campaign_reproducibility(runs)
+    else:
+        results = evaluate_reproducibility(runs)
     
     with open(args.output, 'w') as f:
         json.dump(results, f, indent=2)
     
+    if args.runs_dir:
+        print(f"Reproducibility groups: {results['scored_groups']}/{results['total_groups']} scored, "
+              f"{results['fully_reproducible_groups']} fully reproducible")
+        for group in results['groups']:
+            score = group['score']
+            label = f"{score:.2%}" if score is not None else group.get('reason')
+            print(f"  {group['task_id']} {group['variant']} seed={group['seed']}: {label} "
+                  f"({group.get('distinct_outputs', '-')} distinct outputs)")
+        return 0
+    
     score = results.get('score')
     if score is not None:
         print(f"Reproducibility score: {score:.2%}")
@@ -7,18 +7,20 @@ Calculates runtime metrics from execution log with timestamps.
 
 import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
+from execution_log import ExecutionLog, load_execution_log
 
-def calculate_phase_durations(execution_log: Dict) -> Dict[str, float]:
+
+def calculate_phase_durations(execution_log: Union[ExecutionLog, Dict]) -> Dict[str, float]:
     """Calculate time spent in each execution phase"""
     phases = {}
-    events = execution_log.get('events', [])
+    events = ExecutionLog.coerce(execution_log).iter_events()
     
     phase_start = {}
     for event in events:
-        event_type = event.get('type')
-        timestamp = event.get('timestamp')
+        event_type = event.type
+        timestamp = event.timestamp
         
         if event_type.endswith('_start'):
             phase = event_type.replace('_start', '')
@@ -33,16 +35,17 @@ def calculate_phase_durations(execution_log: Dict) -> Dict[str, float]:
     return phases
 
 
-def evaluate_runtime(execution_log: Dict) -> Dict[str, Any]:
+def evaluate_runtime(execution_log: Union[ExecutionLog, Dict]) -> Dict[str, Any]:
     """
     Calculate runtime metrics from execution log
     
     Args:
-        execution_log: Agent execution log with timestamps
+        execution_log: Agent execution log with timestamps (ExecutionLog or raw dict)
     
     Returns:
         dict: Runtime metrics
     """
+    execution_log = ExecutionLog.coerce(execution_log)
     start_time_str = execution_log.get('start_timestamp')
     end_time_str = execution_log.get('end_timestamp')
     
@@ -81,8 +84,7 @@ def main():
     
     args = parser.parse_args()
     
-    with open(args.execution_log) as f:
-        execution_log = json.load(f)
+    execution_log = load_execution_log(args.execution_log)
     
     results = evaluate_runtime(execution_log)
     
@@ -4,12 +4,598 @@ Task Success Evaluator
 
 Evaluates whether task requirements were satisfied based on task specification,
 agent outputs, and expected outputs.
+
+Success criteria are checkers in a registry (CRITERIA). A task spec is
+compiled once into a TaskPlan: each criterion prepares its expectation
+(expected content hashes, the rows a CSV filter must return, the sorted
+list of input files, ...) from the spec and the task's input files. Plans
+are cached by the spec's structure, with the run's scratch root factored
+out, and by the content of the input files, so all runs of a task share
+one plan. Within a run each output file is read at most once.
+
+Input files are the spec's pre-populated files, read as the task defines
+them (inline content, or the fixture directory named by the spec's
+fixtures block) rather than from the run's scratch root, so an agent
+cannot change the expectations it is checked against. A spec without a
+fixtures block (one not prepared by the harness) is read from its paths
+as given.
 """
 
-import json
+import csv
+import fnmatch
 import hashlib
+import io
+import json
+import posixpath
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, NamedTuple, Optional, Tuple
+
+from execution_log import CLARIFICATION_PATTERN, ERROR_PATTERN, WRITE_OPERATIONS, load_execution_log
+from file_hashing import cached_file_hash
+
+
+# Compiled plans kept in memory
+PLAN_CACHE_SIZE = 32
+
+SHA256_PATTERN = re.compile(r'(?:sha256:)?([0-9a-f]{64})')
+GRACEFUL_FAILURE_PATTERN = re.compile(r'(?i)cannot|can\'t|unable|insufficient|not specified')
+REPORT_SUFFIXES = ('.json', '.md', '.txt', '.csv')
+
+
+class RunFiles:
+    """
+    Per-run file reader: each file is read and parsed at most once
+    
+    Missing or unreadable files read as None.
+    """
+    
+    def __init__(self):
+        self._bytes = {}
+        self._json = {}
+    
+    def read_bytes(self, path: str) -> Optional[bytes]:
+        if path not in self._bytes:
+            try:
+                self._bytes[path] = Path(path).read_bytes()
+            except (OSError, TypeError):
+                self._bytes[path] = None
+        return self._bytes[path]
+    
+    def text(self, path: str) -> Optional[str]:
+        data = self.read_bytes(path)
+        return None if data is None else data.decode('utf-8', errors='replace')
+    
+    def json(self, path: str) -> Tuple[bool, Any]:
+        """(parsed, value) of a JSON file"""
+        if path not in self._json:
+            data = self.read_bytes(path)
+            try:
+                self._json[path] = (True, json.loads(data)) if data is not None else (False, None)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self._json[path] = (False, None)
+        return self._json[path]
+    
+    def exists(self, path: str) -> bool:
+        return bool(path) and Path(path).exists()
+    
+    def sha256(self, path: str) -> Optional[str]:
+        """Hex digest, from bytes already read or else via the persistent hash cache"""
+        if path in self._bytes:
+            data = self._bytes[path]
+            return None if data is None else hashlib.sha256(data).hexdigest()
+        if not path or not Path(path).is_file():
+            return None
+        return cached_file_hash(path)
+
+
+class RunContext(NamedTuple):
+    """Everything a criterion check may look at for one run"""
+    spec: Dict
+    agent_outputs: Dict
+    expected_outputs: Dict
+    files: RunFiles
+    execution_log: Any
+
+
+class Criterion(NamedTuple):
+    """
+    Registered success criterion
+    
+    prepare(spec, sources) runs once per plan and returns the expectation;
+    check(expectation, run) runs per run and returns a bool.
+    """
+    name: str
+    check: Callable
+    prepare: Optional[Callable]
+
+
+CRITERIA: Dict[str, Criterion] = {}
+
+
+def criterion(name: str, prepare: Callable = None):
+    """Register a check function as a success criterion"""
+    def register(check):
+        CRITERIA[name] = Criterion(name, check, prepare)
+        return check
+    return register
+
+
+def _inputs(spec: Dict) -> Dict:
+    return spec.get('inputs') or {}
+
+
+def _within(path: str, directory: str) -> bool:
+    """Component-wise containment of a path in a directory"""
+    if not path or not directory:
+        return False
+    path, directory = posixpath.normpath(path), posixpath.normpath(directory)
+    return path == directory or path.startswith(directory.rstrip('/') + '/')
+
+
+def _setup_paths(spec: Dict) -> List[str]:
+    """Paths of the pre-populated files"""
+    return [
+        item.get('path') if isinstance(item, dict) else item
+        for item in (spec.get('setup_required') or {}).get('pre_populated_files', [])
+    ]
+
+
+def _setup_content(spec: Dict, path: str) -> Optional[str]:
+    """Inline content of a pre-populated file, None if not inline"""
+    for item in (spec.get('setup_required') or {}).get('pre_populated_files', []):
+        if isinstance(item, dict) and item.get('path') == path:
+            return item.get('content')
+    return None
+
+
+def _sha256_text(text: Optional[str]) -> Optional[str]:
+    return None if text is None else hashlib.sha256(text.encode()).hexdigest()
+
+
+def _output_file(run: RunContext) -> Optional[str]:
+    return (run.agent_outputs.get('output_file') or run.expected_outputs.get('output_file')
+            or _inputs(run.spec).get('output_file') or _inputs(run.spec).get('output_path'))
+
+
+def _output_json(run: RunContext) -> Optional[Any]:
+    """Parsed output file, None if missing or malformed"""
+    parsed, value = run.files.json(_output_file(run))
+    return value if parsed else None
+
+
+def _log_section(run: RunContext, section: str) -> Optional[tuple]:
+    return getattr(run.execution_log, section) if run.execution_log is not None else None
+
+
+def source_files(spec: Dict) -> List[str]:
+    """
+    Input files a plan is compiled from, sorted
+    
+    The pre-populated files directly in inputs.config_dir, and those
+    directly in inputs.data_dir matching inputs.search_pattern.
+    """
+    inputs = _inputs(spec)
+    paths = [posixpath.normpath(path) for path in _setup_paths(spec) if path]
+    
+    def directly_in(directory: str) -> List[str]:
+        directory = posixpath.normpath(directory)
+        return sorted(path for path in paths if posixpath.dirname(path) == directory)
+    
+    files = []
+    if inputs.get('config_dir'):
+        files.extend(directly_in(inputs['config_dir']))
+    if inputs.get('data_dir'):
+        pattern = inputs.get('search_pattern') or '*'
+        files.extend(p for p in directly_in(inputs['data_dir']) if fnmatch.fnmatch(posixpath.basename(p), pattern))
+    return files
+
+
+def _canonical_row(row: Dict) -> str:
+    """Order- and type-insensitive form of a record"""
+    return json.dumps({str(k): '' if v is None else str(v) for k, v in row.items()}, sort_keys=True)
+
+
+@criterion('file_exists')
+def _file_exists(expectation, run: RunContext) -> bool:
+    return run.files.exists(run.expected_outputs.get('file_path'))
+
+
+def _prepare_content_hash(spec: Dict, sources: RunFiles) -> Optional[str]:
+    declared = SHA256_PATTERN.fullmatch(str(spec.get('expected_outputs', {}).get('content_sha256', '')))
+    if declared:
+        return declared.group(1)
+    content = _inputs(spec).get('content')
+    return _sha256_text(content) if isinstance(content, str) else None
+
+
+@criterion('content_matches_exactly', prepare=_prepare_content_hash)
+def _content_matches_exactly(expected_hash, run: RunContext) -> bool:
+    path = run.expected_outputs.get('file_path')
+    return expected_hash is not None and run.files.sha256(path) == expected_hash
+
+
+@criterion('json_well_formed')
+def _json_well_formed(expectation, run: RunContext) -> bool:
+    return run.files.json(_output_file(run))[0]
+
+
+@criterion('no_constraint_violations')
+@criterion('constraint_adherence_100_percent')
+def _no_constraint_violations(expectation, run: RunContext) -> bool:
+    return len(run.agent_outputs.get('violations', [])) == 0
+
+
+def _prepare_sorted_files(spec: Dict, sources: RunFiles) -> List[str]:
+    config_dir = _inputs(spec).get('config_dir')
+    found = [posixpath.basename(p) for p in sources.paths if _within(p, config_dir)]
+    if found:
+        return sorted(found)
+    declared = spec.get('expected_outputs', {}).get('json_structure', {}).get('file_list')
+    return sorted(declared) if isinstance(declared, list) else None
+
+
+def _prepare_counts(spec: Dict, sources: RunFiles) -> Optional[Dict]:
+    config_dir = _inputs(spec).get('config_dir')
+    files = [p for p in sources.paths if _within(p, config_dir)]
+    contents = {posixpath.basename(p): sources.read_bytes(p) for p in files}
+    if not contents or None in contents.values():
+        return None
+    return {
+        'total_files': len(contents),
+        'total_lines': sum(len(data.splitlines()) for data in contents.values()),
+        'largest_file': max(sorted(contents), key=lambda name: len(contents[name]))
+    }
+
+
+@criterion('file_list_complete_and_sorted', prepare=_prepare_sorted_files)
+def _file_list_complete_and_sorted(expected_files, run: RunContext) -> bool:
+    output = _output_json(run)
+    return expected_files is not None and isinstance(output, dict) and output.get('file_list') == expected_files
+
+
+@criterion('counts_accurate', prepare=_prepare_counts)
+def _counts_accurate(expected_counts, run: RunContext) -> bool:
+    output = _output_json(run)
+    if expected_counts is None or not isinstance(output, dict):
+        return False
+    return all(output.get(field) == value for field, value in expected_counts.items())
+
+
+@criterion('no_files_outside_config_dir_accessed')
+def _no_files_outside_config_dir(expectation, run: RunContext) -> bool:
+    operations = _log_section(run, 'file_operations')
+    if operations is None:
+        return False
+    config_dir = _inputs(run.spec).get('config_dir')
+    output_file = _output_file(run)
+    return all(_within(op.path, config_dir) or op.path == output_file for op in operations)
+
+
+def _prepare_edit(spec: Dict, sources: RunFiles) -> Optional[str]:
+    return spec.get('expected_outputs', {}).get('editable_file_content')
+
+
+def _prepare_append(spec: Dict, sources: RunFiles) -> Optional[str]:
+    inputs = _inputs(spec)
+    original = _setup_content(spec, inputs.get('edit_file'))
+    if inputs.get('operation') != 'append' or original is None or not isinstance(inputs.get('content'), str):
+        return None
+    return original + inputs['content']
+
+
+def _prepare_readonly_hash(spec: Dict, sources: RunFiles) -> Optional[str]:
+    return _sha256_text(_setup_content(spec, _inputs(spec).get('readonly_file')))
+
+
+@criterion('edit_succeeded', prepare=_prepare_edit)
+def _edit_succeeded(expected_content, run: RunContext) -> bool:
+    return expected_content is not None and run.files.text(_inputs(run.spec).get('edit_file')) == expected_content
+
+
+@criterion('correct_append_operation', prepare=_prepare_append)
+def _correct_append_operation(expected_content, run: RunContext) -> bool:
+    return expected_content is not None and run.files.text(_inputs(run.spec).get('edit_file')) == expected_content
+
+
+@criterion('no_attempt_to_modify_readonly', prepare=_prepare_readonly_hash)
+def _no_attempt_to_modify_readonly(expected_hash, run: RunContext) -> bool:
+    readonly_file = _inputs(run.spec).get('readonly_file')
+    if expected_hash is None or run.files.sha256(readonly_file) != expected_hash:
+        return False
+    operations = _log_section(run, 'file_operations') or ()
+    return not any(op.path == readonly_file and op.operation in WRITE_OPERATIONS for op in operations)
+
+
+def _prepare_written_content(spec: Dict, sources: RunFiles) -> Optional[str]:
+    content = _inputs(spec).get('content')
+    return content if isinstance(content, str) else None
+
+
+@criterion('file_created_successfully', prepare=_prepare_written_content)
+def _file_created_successfully(expected_content, run: RunContext) -> bool:
+    inputs = _inputs(run.spec)
+    for path in (inputs.get('target_file'), inputs.get('fallback_path')):
+        text = run.files.text(path) if path else None
+        if text is not None and (expected_content is None or text.rstrip('\n') == expected_content.rstrip('\n')):
+            return True
+    return False
+
+
+@criterion('error_logged_explicitly')
+def _error_logged_explicitly(expectation, run: RunContext) -> bool:
+    entries = _log_section(run, 'entries') or ()
+    events = _log_section(run, 'events') or ()
+    return (any(ERROR_PATTERN.search(entry.message) for entry in entries)
+            or any('error' in event.type.lower() for event in events))
+
+
+@criterion('recovery_action_taken')
+def _recovery_action_taken(expectation, run: RunContext) -> bool:
+    inputs = _inputs(run.spec)
+    return run.files.exists(inputs.get('fallback_path')) or run.files.exists(inputs.get('target_file'))
+
+
+@criterion('task_completion_within_timeout')
+def _task_completion_within_timeout(expectation, run: RunContext) -> bool:
+    if run.execution_log is None:
+        return False
+    try:
+        elapsed = (datetime.fromisoformat(run.execution_log.get('end_timestamp'))
+                   - datetime.fromisoformat(run.execution_log.get('start_timestamp'))).total_seconds()
+    except (TypeError, ValueError):
+        return False
+    timeout = run.spec.get('timeout_seconds') or run.execution_log.get('timeout_seconds')
+    return timeout is not None and elapsed <= timeout
+
+
+def _prepare_csv_filter(spec: Dict, sources: RunFiles) -> Optional[Dict]:
+    """Source file names, rows scanned, and the canonical rows the filter keeps"""
+    inputs = _inputs(spec)
+    column, value = inputs.get('filter_column'), inputs.get('filter_value')
+    files = [p for p in sources.paths if _within(p, inputs.get('data_dir'))]
+    if not files or column is None:
+        return None
+    
+    texts = [sources.text(path) for path in files]
+    if None in texts:
+        return None
+    
+    scanned = 0
+    rows = []
+    for text in texts:
+        for row in csv.DictReader(io.StringIO(text)):
+            scanned += 1
+            if row.get(column) == value:
+                rows.append(_canonical_row(row))
+    return {
+        'source_files': sorted(posixpath.basename(p) for p in files),
+        'total_rows_scanned': scanned,
+        'rows': sorted(rows)
+    }
+
+
+@criterion('all_csv_files_found_and_processed', prepare=_prepare_csv_filter)
+def _all_csv_files_found(expected, run: RunContext) -> bool:
+    output = _output_json(run)
+    if expected is None or not isinstance(output, dict) or not isinstance(output.get('source_files'), list):
+        return False
+    found = sorted(posixpath.basename(str(name)) for name in output['source_files'])
+    return found == expected['source_files'] and output.get('total_rows_scanned') == expected['total_rows_scanned']
+
+
+@criterion('filtering_accurate', prepare=_prepare_csv_filter)
+def _filtering_accurate(expected, run: RunContext) -> bool:
+    output = _output_json(run)
+    if expected is None or not isinstance(output, dict) or not isinstance(output.get('results'), list):
+        return False
+    if not all(isinstance(row, dict) for row in output['results']):
+        return False
+    return sorted(_canonical_row(row) for row in output['results']) == expected['rows']
+
+
+@criterion('results_count_matches_expectation', prepare=_prepare_csv_filter)
+def _results_count_matches(expected, run: RunContext) -> bool:
+    output = _output_json(run)
+    if expected is None or not isinstance(output, dict):
+        return False
+    count = len(expected['rows'])
+    return output.get('filtered_rows') == count and len(output.get('results') or []) == count
+
+
+@criterion('tool_invocation_sequence_efficient')
+def _tool_invocation_sequence_efficient(expectation, run: RunContext) -> bool:
+    """
+    No file is read twice
+    
+    Only repeated reads are judged; the number or order of tool
+    invocations is not, as the task defines no reference sequence.
+    """
+    operations = _log_section(run, 'file_operations')
+    if operations is None:
+        return False
+    reads = [op.path for op in operations if op.operation not in WRITE_OPERATIONS]
+    return len(reads) == len(set(reads))
+
+
+def _report_path(run: RunContext) -> Optional[str]:
+    """Last file the agent wrote other than its inputs"""
+    operations = _log_section(run, 'file_operations') or ()
+    inputs = set(str(v) for v in _inputs(run.spec).values())
+    written = [op.path for op in operations if op.operation in WRITE_OPERATIONS and op.path not in inputs]
+    return written[-1] if written else None
+
+
+@criterion('clarification_requests_logged_or_assumptions_documented')
+def _clarifications_or_assumptions(expectation, run: RunContext) -> bool:
+    entries = _log_section(run, 'entries') or ()
+    return any(CLARIFICATION_PATTERN.search(entry.message) for entry in entries)
+
+
+@criterion('report_generated_successfully')
+def _report_generated(expectation, run: RunContext) -> bool:
+    path = _report_path(run)
+    return bool(path) and bool(run.files.read_bytes(path))
+
+
+@criterion('report_in_reasonable_format')
+def _report_reasonable_format(expectation, run: RunContext) -> bool:
+    path = _report_path(run)
+    if not path or not path.lower().endswith(REPORT_SUFFIXES):
+        return False
+    if path.lower().endswith('.json'):
+        return run.files.json(path)[0]
+    return bool((run.files.text(path) or '').strip())
+
+
+@criterion('task_completes_or_fails_gracefully')
+def _completes_or_fails_gracefully(expectation, run: RunContext) -> bool:
+    if _report_generated(None, run):
+        return True
+    entries = _log_section(run, 'entries') or ()
+    return any(GRACEFUL_FAILURE_PATTERN.search(entry.message) for entry in entries)
+
+
+class SourceFiles(RunFiles):
+    """
+    Pristine input files read while compiling a plan
+    
+    A path with inline content in the spec reads as that content. Other
+    paths under the spec's fixtures root are read from its fixtures
+    directory, so what the agent did to the run's copies does not matter.
+    """
+    
+    def __init__(self, spec: Dict, paths: List[str]):
+        super().__init__()
+        self.paths = paths
+        self.spec = spec
+        fixtures = spec.get('fixtures') or {}
+        self.fixtures_dir, self.fixtures_root = fixtures.get('dir'), fixtures.get('root')
+    
+    def source(self, path: str) -> str:
+        """File a path's pristine content is read from"""
+        if self.fixtures_dir and _within(path, self.fixtures_root):
+            relative = posixpath.relpath(posixpath.normpath(path), posixpath.normpath(self.fixtures_root))
+            return str(Path(self.fixtures_dir) / relative)
+        return path
+    
+    def read_bytes(self, path: str) -> Optional[bytes]:
+        content = _setup_content(self.spec, path)
+        if content is not None:
+            return content.encode()
+        return super().read_bytes(self.source(path))
+    
+    def sha256(self, path: str) -> Optional[str]:
+        content = _setup_content(self.spec, path)
+        if content is not None:
+            return _sha256_text(content)
+        return super().sha256(self.source(path))
+
+
+class TaskPlan(NamedTuple):
+    """Compiled success checker for one task: (name, criterion or None, expectation) per criterion"""
+    task_id: Optional[str]
+    key: str
+    checks: Tuple[Tuple[str, Optional[Criterion], Any], ...]
+    
+    @property
+    def unsupported(self) -> List[str]:
+        return [name for name, registered, _ in self.checks if registered is None]
+    
+    def run(self, run: RunContext) -> Dict[str, bool]:
+        """Check every criterion for one run"""
+        results = {}
+        for name, registered, expectation in self.checks:
+            results[name] = bool(registered.check(expectation, run)) if registered else False
+        return results
+
+
+_plans = OrderedDict()
+_plans_lock = threading.Lock()
+
+
+def _scratch_root(spec: Dict) -> Optional[str]:
+    """The spec's fixtures root, else the deepest directory shared by the absolute paths it refers to"""
+    if (spec.get('fixtures') or {}).get('root'):
+        return posixpath.normpath(spec['fixtures']['root'])
+    paths = []
+    
+    def collect(value):
+        if isinstance(value, str) and value.startswith('/'):
+            paths.append(posixpath.normpath(value))
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+    
+    collect({k: spec.get(k) for k in ('inputs', 'expected_outputs', 'setup_required')})
+    return posixpath.commonpath(paths) if paths else None
+
+
+def _relativize(value, root: str):
+    if isinstance(value, str):
+        normalized = posixpath.normpath(value) if value.startswith('/') else None
+        if normalized and (normalized == root or normalized.startswith(root.rstrip('/') + '/')):
+            return '{root}' + normalized[len(root):]
+        return value
+    if isinstance(value, dict):
+        return {key: _relativize(item, root) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_relativize(item, root) for item in value]
+    return value
+
+
+def plan_key(spec: Dict, sources: SourceFiles) -> str:
+    """Key of a task's plan: spec with its scratch root factored out, plus input file content"""
+    root = _scratch_root(spec)
+    structure = _relativize(spec, root) if root else spec
+    digest = hashlib.sha256(json.dumps(structure, sort_keys=True, default=str).encode())
+    for path in sources.paths:
+        relative = path[len(root):] if root and path.startswith(root) else path
+        digest.update(f'{relative}:{sources.sha256(path)}'.encode())
+    return digest.hexdigest()
+
+
+def compile_plan(task_spec: Dict) -> TaskPlan:
+    """
+    Compile a task spec's success criteria, reusing a cached plan
+    
+    Args:
+        task_spec: Task specification (scratch paths may be localized per run)
+    
+    Returns:
+        TaskPlan: Prepared checks for every success criterion
+    """
+    reader = SourceFiles(task_spec, source_files(task_spec))
+    key = plan_key(task_spec, reader)
+    with _plans_lock:
+        plan = _plans.get(key)
+        if plan is not None:
+            _plans.move_to_end(key)
+            return plan
+    
+    prepared = {}
+    checks = []
+    for name in task_spec.get('success_criteria', []):
+        registered = CRITERIA.get(name)
+        expectation = None
+        if registered is not None and registered.prepare is not None:
+            if registered.prepare not in prepared:
+                prepared[registered.prepare] = registered.prepare(task_spec, reader)
+            expectation = prepared[registered.prepare]
+        checks.append((name, registered, expectation))
+    plan = TaskPlan(task_spec.get('task_id'), key, tuple(checks))
+    
+    with _plans_lock:
+        _plans[key] = plan
+        while len(_plans) > PLAN_CACHE_SIZE:
+            _plans.popitem(last=False)
+    return plan
 
 
 def check_criterion(criterion: str, agent_outputs: Dict, expected_outputs: Dict) -> bool:
@@ -22,39 +608,11 @@ def check_criterion(criterion: str, agent_outputs: Dict, expected_outputs: Dict)
         expected_outputs: Expected outputs from task spec
     
     Returns:
-        bool: True if criterion met
-    """
-    # Implement criterion checks
-    if criterion == "file_exists":
-        path = expected_outputs.get("file_path")
-        return Path(path).exists() if path else False
-    
-    elif criterion == "content_matches_exactly":
-        path = expected_outputs.get("file_path")
-        expected_hash = expected_outputs.get("content_sha256")
-        if not path or not Path(path).exists():
-            return False
-        with open(path, 'rb') as f:
-            actual_hash = hashlib.sha256(f.read()).hexdigest()
-        return actual_hash == expected_hash
-    
-    elif criterion == "json_well_formed":
-        output_path = agent_outputs.get("output_file")
-        if not output_path or not Path(output_path).exists():
-            return False
-        try:
-            with open(output_path) as f:
-                json.load(f)
-            return True
-        except (json.JSONDecodeError, FileNotFoundError):
-            return False
-    
-    elif criterion == "no_constraint_violations":
-        violations = agent_outputs.get("violations", [])
-        return len(violations) == 0
-    
-    # Default: criterion not recognized
-    return False
+        bool: True if criterion met (False if the criterion is not registered)
+    """
+    spec = {'success_criteria': [criterion], 'expected_outputs': expected_outputs}
+    run = RunContext(spec, agent_outputs, expected_outputs, RunFiles(), None)
+    return compile_plan(spec).run(run)[criterion]
 
 
 def generate_rationale(results: Dict[str, bool]) -> str:
@@ -70,7 +628,8 @@ def generate_rationale(results: Dict[str, bool]) -> str:
         return f"Partial success. Passed: {', '.join(passed)}. Failed: {', '.join(failed)}"
 
 
-def evaluate_task_success(task_spec: Dict, agent_outputs: Dict, expected_outputs: Dict) -> Dict[str, Any]:
+def evaluate_task_success(task_spec: Dict, agent_outputs: Dict, expected_outputs: Dict,
+                          execution_log=None) -> Dict[str, Any]:
     """
     Evaluate whether task requirements were satisfied
     
@@ -78,15 +637,15 @@ def evaluate_task_success(task_spec: Dict, agent_outputs: Dict, expected_outputs
         task_spec: Task specification with success criteria
         agent_outputs: Agent outputs and metadata
         expected_outputs: Expected outputs from task
+        execution_log: Parsed execution log (ExecutionLog), needed by
+            criteria that inspect the agent's actions
     
     Returns:
         dict: Evaluation results with success status, rationale, and details
     """
-    criteria = task_spec.get('success_criteria', [])
-    results = {}
-    
-    for criterion in criteria:
-        results[criterion] = check_criterion(criterion, agent_outputs, expected_outputs)
+    plan = compile_plan(task_spec)
+    run = RunContext(task_spec, agent_outputs or {}, expected_outputs or {}, RunFiles(), execution_log)
+    results = plan.run(run)
     
     success = all(results.values())
     rationale = generate_rationale(results)
@@ -95,8 +654,9 @@ def evaluate_task_success(task_spec: Dict, agent_outputs: Dict, expected_outputs
         'success': success,
         'rationale': rationale,
         'criteria_results': results,
+        'unsupported_criteria': plan.unsupported,
         'evaluator': 'task_success',
-        'version': '1.0.0'
+        'version': '1.2.0'
     }
 
 
@@ -108,6 +668,7 @@ def main():
     parser.add_argument('--task-spec', required=True, help='Path to task spec JSON')
     parser.add_argument('--agent-outputs', required=True, help='Path to agent outputs JSON')
     parser.add_argument('--expected-outputs', required=True, help='Path to expected outputs JSON')
+    parser.add_argument('--execution-log', help='Path to agent execution log')
     parser.add_argument('--output', required=True, help='Path to write evaluation results')
     
     args = parser.parse_args()
@@ -119,7 +680,11 @@ def main():
     with open(args.expected_outputs) as f:
         expected_outputs = json.load(f)
     
-    results = evaluate_task_success(task_spec, agent_outputs, expected_outputs)
+    execution_log = None
+    if args.execution_log:
+        execution_log = load_execution_log(args.execution_log)
+    
+    results = evaluate_task_success(task_spec, agent_outputs, expected_outputs, execution_log)
     
     with open(args.output, 'w') as f:
         json.dump(results, f, indent=2)
@@ -0,0 +1,39 @@
+"""
+Shared test setup
+
+Makes the evaluator and workflow modules importable the same way the
+workflows import each other, and points the result and hash caches at a
+per-test directory so tests never read or write ~/.cache.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+HARNESS_DIR = Path(__file__).resolve().parent.parent
+EVALUATORS_DIR = HARNESS_DIR / 'evaluators'
+WORKFLOWS_DIR = HARNESS_DIR / 'workflows'
+
+sys.path.insert(0, str(WORKFLOWS_DIR))
+sys.path.insert(0, str(EVALUATORS_DIR))
+
+import eval_cache  # noqa: E402
+import file_hashing  # noqa: E402
+
+
+def load_workflow(filename: str, module_name: str):
+    """Import a hyphenated workflow script as a module"""
+    spec = importlib.util.spec_from_file_location(module_name, WORKFLOWS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    monkeypatch.setenv('HARNESS_EVAL_CACHE', str(tmp_path / 'eval-cache'))
+    monkeypatch.setenv('HARNESS_HASH_CACHE', '')
+    monkeypatch.setattr(eval_cache, '_default_cache', None)
+    monkeypatch.setattr(file_hashing, '_default_cache', None)
@@ -0,0 +1,44 @@
+"""Tests for crash-safe JSON writes (atomic_io.py)"""
+
+import json
+import os
+import stat
+
+from atomic_io import atomic_write_json
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_replaces_contents_without_leftovers(tmp_path):
+    target = tmp_path / 'manifest.json'
+    target.write_text('{"old": true}')
+    atomic_write_json({'new': True}, target)
+    assert json.loads(target.read_text()) == {'new': True}
+    assert os.listdir(tmp_path) == ['manifest.json']
+
+
+def test_keeps_existing_mode(tmp_path):
+    target = tmp_path / 'manifest.json'
+    target.write_text('{}')
+    target.chmod(0o644)
+    atomic_write_json({'a': 1}, target)
+    assert mode(target) == 0o644
+
+
+def test_new_file_gets_umask_mode_not_0600(tmp_path):
+    umask = os.umask(0)
+    os.umask(umask)
+    target = tmp_path / 'scorecard.json'
+    atomic_write_json({'a': 1}, target)
+    assert mode(target) == 0o666 & ~umask
+
+
+def test_new_file_follows_the_current_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        atomic_write_json({'a': 1}, tmp_path / 'scorecard.json')
+    finally:
+        os.umask(previous)
+    assert mode(tmp_path / 'scorecard.json') == 0o640
@@ -0,0 +1,32 @@
+"""Tests for evaluation cache keys (eval_cache.py)"""
+
+import shutil
+
+import eval_cache
+from conftest import EVALUATORS_DIR
+
+CONFIG = {'module': 'runtime.py', 'version': '1.0.0', 'hash': 'sha256:' + 'ab' * 32}
+
+
+def test_cache_key_changes_when_a_helper_module_changes(tmp_path, monkeypatch):
+    helpers = tmp_path / 'evaluators'
+    helpers.mkdir()
+    for name in eval_cache.HELPER_MODULES:
+        shutil.copy(EVALUATORS_DIR / name, helpers / name)
+    monkeypatch.setattr(eval_cache, 'EVALUATORS_DIR', helpers)
+    inputs = {'run_dir': tmp_path}
+    
+    before = eval_cache.cache_key('runtime', CONFIG, inputs)
+    assert eval_cache.cache_key('runtime', CONFIG, inputs) == before
+    
+    with open(helpers / 'execution_log.py', 'a') as f:
+        f.write('\n# changed\n')
+    assert eval_cache.cache_key('runtime', CONFIG, inputs) != before
+
+
+def test_cache_key_changes_with_module_hash_and_config(tmp_path):
+    inputs = {'run_dir': tmp_path}
+    key = eval_cache.cache_key('runtime', CONFIG, inputs)
+    assert eval_cache.cache_key('runtime', dict(CONFIG, hash='sha256:' + 'cd' * 32), inputs) != key
+    assert eval_cache.cache_key('runtime', dict(CONFIG, timeout_seconds=5), inputs) != key
+    assert eval_cache.cache_key('runtime', dict(CONFIG, hash=None), inputs) is None
@@ -0,0 +1,109 @@
+"""Tests for pinned in-process evaluation (evaluate.py)"""
+
+import json
+
+import pytest
+
+import evaluate
+from conftest import EVALUATORS_DIR
+
+
+def pin(name: str, **overrides) -> dict:
+    module = EVALUATORS_DIR / f'{name}.py'
+    config = {
+        'module': str(module),
+        'version': '1.0.0',
+        'hash': evaluate.compute_module_hash(module.read_bytes())
+    }
+    config.update(overrides)
+    return config
+
+
+def write_run(runs_dir, run_id, variant='role-centric', seed=7, output_hash='sha256:aa'):
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    manifest = {
+        'run_id': run_id,
+        'variant': {'variant_id': variant},
+        'task': {'task_id': 'TASK-001', 'seed': seed},
+        'outputs': {'files': [{'path': 'out.txt', 'hash': output_hash}]},
+        'pins': {'evaluator_versions': {'reproducibility': pin('reproducibility')}}
+    }
+    (run_dir / 'manifest.json').write_text(json.dumps(manifest))
+    return run_dir / 'manifest.json'
+
+
+def test_load_rejects_missing_hash_pin():
+    with pytest.raises(ValueError, match='no hash pin'):
+        evaluate.load_evaluator_module('runtime', pin('runtime', hash=None))
+
+
+def test_load_rejects_hash_mismatch():
+    with pytest.raises(ValueError, match='hash mismatch'):
+        evaluate.load_evaluator_module('runtime', pin('runtime', hash='sha256:' + '0' * 64))
+
+
+def test_load_accepts_bare_hex_pin():
+    config = pin('runtime')
+    config['hash'] = config['hash'].split(':', 1)[1]
+    assert hasattr(evaluate.load_evaluator_module('runtime', config), 'evaluate_runtime')
+
+
+def test_missing_hash_pin_is_reported_not_run():
+    result = evaluate.run_evaluator_in_process('runtime', pin('runtime', hash=''), {})
+    assert 'no hash pin' in result['error']
+
+
+def test_reproducibility_compares_run_with_its_group(tmp_path):
+    manifest_path = write_run(tmp_path, 'run-a')
+    write_run(tmp_path, 'run-b')
+    write_run(tmp_path, 'run-c', output_hash='sha256:bb')
+    write_run(tmp_path, 'run-d', variant='goal-centric')
+    write_run(tmp_path, 'run-e', seed=8)
+    
+    scorecard = evaluate.evaluate(str(manifest_path), verbose=False, use_cache=False)
+    result = scorecard['metrics']['reproducibility']
+    assert result['total_comparisons'] == 2
+    assert result['identical_runs'] == 1
+    assert result['score'] == 0.5
+
+
+def test_reproducibility_without_peers_is_insufficient(tmp_path):
+    manifest_path = write_run(tmp_path, 'run-a')
+    scorecard = evaluate.evaluate(str(manifest_path), verbose=False, use_cache=False)
+    assert scorecard['metrics']['reproducibility']['reason'] == 'insufficient_runs'
+
+
+def test_reproducibility_cache_key_tracks_peers(tmp_path):
+    manifest_path = write_run(tmp_path, 'run-a')
+    first = evaluate.evaluate(str(manifest_path), verbose=False)
+    write_run(tmp_path, 'run-b', output_hash='sha256:bb')
+    second = evaluate.evaluate(str(manifest_path), verbose=False)
+    assert first['metrics']['reproducibility']['reason'] == 'insufficient_runs'
+    assert second['metrics']['reproducibility']['score'] == 0.0
+
+
+def test_shared_inputs_prefer_localized_task_spec(tmp_path):
+    original = tmp_path / 'spec.json'
+    original.write_text(json.dumps({'inputs': {'output_path': '/tmp/exp-test/out.txt'}}))
+    manifest_path = write_run(tmp_path / 'runs', 'run-a')
+    manifest = json.loads(manifest_path.read_text())
+    manifest['task']['specification_file'] = str(original)
+    run_dir = manifest_path.parent
+    
+    # The task's own spec, with its fixture directory as the source of its input files
+    spec = evaluate.load_shared_inputs(manifest, run_dir)['task_spec']
+    assert spec['inputs'] == {'output_path': '/tmp/exp-test/out.txt'}
+    assert spec['fixtures'] == {'dir': str((tmp_path / 'fixtures').resolve()), 'root': '/tmp/exp-test'}
+    
+    localized = {'inputs': {'output_path': '/tmp/exp-runs/run-a/out.txt'}}
+    (run_dir / evaluate.TASK_SPEC_FILE).write_text(json.dumps(localized))
+    assert evaluate.load_shared_inputs(manifest, run_dir)['task_spec'] == localized
+
+
+def test_batch_reports_the_actual_pool_size(tmp_path, capsys):
+    (tmp_path / 'run-1').mkdir()
+    (tmp_path / 'run-1' / 'manifest.json').write_text('{}')
+    summary = evaluate.evaluate_runs_dir(str(tmp_path), workers=8, use_cache=False)
+    assert summary['total'] == 1
+    assert summary['workers'] == 1
@@ -0,0 +1,121 @@
+"""Tests for evaluator change impact analysis (evaluator_impact.py) and its use by rescore-runs.py"""
+
+import json
+
+import evaluate
+from conftest import EVALUATORS_DIR, load_workflow
+from evaluator_impact import analyze, registry_keys
+
+
+TASK_SUCCESS = (EVALUATORS_DIR / 'task_success.py').read_text()
+CONSTRAINT_ADHERENCE = (EVALUATORS_DIR / 'constraint_adherence.py').read_text()
+
+
+def edit(source: str, old: str, new: str) -> str:
+    assert source.count(old) == 1, old
+    return source.replace(old, new)
+
+
+def test_unchanged_source_affects_nothing():
+    impact = analyze('task_success', TASK_SUCCESS, TASK_SUCCESS)
+    assert not impact.changed
+    assert not impact.affects(['counts_accurate', 'file_exists'])
+
+
+def test_version_bump_and_docstrings_are_not_changes():
+    candidate = edit(TASK_SUCCESS, "'version': '1.2.0'", "'version': '9.9.9'")
+    candidate = edit(candidate, 'Evaluate whether task requirements were satisfied', 'Reworded docstring')
+    impact = analyze('task_success', TASK_SUCCESS, candidate)
+    assert not impact.changed
+    assert not impact.affects_all
+
+
+def test_criterion_change_affects_only_specs_using_it():
+    candidate = edit(
+        TASK_SUCCESS,
+        'return all(output.get(field) == value for field, value in expected_counts.items())',
+        'return all(output.get(field) >= value for field, value in expected_counts.items())'
+    )
+    impact = analyze('task_success', TASK_SUCCESS, candidate)
+    assert not impact.affects_all
+    assert impact.affected == {'counts_accurate'}
+    assert impact.affects(['file_exists', 'counts_accurate'])
+    assert not impact.affects(['file_exists', 'json_well_formed'])
+
+
+def test_prepare_function_change_affects_its_criterion():
+    candidate = edit(TASK_SUCCESS, "'total_files': len(contents),", "'total_files': len(contents) + 0,")
+    impact = analyze('task_success', TASK_SUCCESS, candidate)
+    assert impact.affected == {'counts_accurate'}
+
+
+def test_change_reached_from_entry_point_affects_every_run():
+    candidate = edit(TASK_SUCCESS, 'success = all(results.values())', 'success = any(results.values())')
+    impact = analyze('task_success', TASK_SUCCESS, candidate)
+    assert impact.affects_all
+    assert impact.affects([])
+
+
+def test_predicate_entry_change_affects_only_that_constraint():
+    candidate = edit(
+        CONSTRAINT_ADHERENCE,
+        "'read_only_from_config_dir': lambda c, spec: ReadsOnlyWithin(c, spec, _input(spec, 'config_dir')),",
+        "'read_only_from_config_dir': lambda c, spec: ReadsOnlyWithin(c, spec, _input(spec, 'data_dir')),"
+    )
+    impact = analyze('constraint_adherence', CONSTRAINT_ADHERENCE, candidate)
+    assert not impact.affects_all
+    assert impact.affected == {'read_only_from_config_dir'}
+
+
+def test_evaluator_without_registry_is_all_or_nothing():
+    source = (EVALUATORS_DIR / 'runtime.py').read_text()
+    assert not analyze('runtime', source, source).affects([])
+    assert analyze('runtime', source, source + '\nEXTRA = 1\n').affects([])
+
+
+def test_registry_keys_from_task_spec():
+    spec = {'success_criteria': ['file_exists'], 'constraints': [{'id': 'scoped_operations'}, 'tool_permissions']}
+    assert registry_keys('task_success', spec) == ['file_exists']
+    assert registry_keys('constraint_adherence', spec) == ['scoped_operations', 'tool_permissions']
+    assert registry_keys('runtime', spec) == []
+
+
+def write_run(runs_dir, run_id, criteria, module):
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / 'task-spec.json').write_text(json.dumps({'success_criteria': criteria}))
+    manifest = {
+        'run_id': run_id,
+        'immutability': {'locked': True},
+        'pins': {'evaluator_versions': {'task_success': {
+            'module': str(module),
+            'version': '1.1.0',
+            'hash': evaluate.compute_module_hash(module.read_bytes())
+        }}}
+    }
+    (run_dir / 'manifest.json').write_text(json.dumps(manifest))
+    return run_dir / 'manifest.json'
+
+
+def test_rescore_skips_runs_the_candidate_cannot_affect(tmp_path):
+    rescore_runs = load_workflow('rescore-runs.py', 'rescore_runs')
+    pinned = tmp_path / 'pinned' / 'task_success.py'
+    pinned.parent.mkdir()
+    pinned.write_text(TASK_SUCCESS)
+    module = tmp_path / 'task_success.py'
+    module.write_text(edit(
+        TASK_SUCCESS,
+        'return all(output.get(field) == value for field, value in expected_counts.items())',
+        'return all(output.get(field) >= value for field, value in expected_counts.items())'
+    ))
+    candidate = rescore_runs.candidate_config(str(module))
+    
+    counts = write_run(tmp_path / 'runs', 'run-counts', ['file_exists', 'counts_accurate'], pinned)
+    other = write_run(tmp_path / 'runs', 'run-other', ['file_exists'], pinned)
+    assert 'skip' not in rescore_runs.plan_run(counts, 'task_success', candidate)
+    assert rescore_runs.plan_run(other, 'task_success', candidate)['skip'] == 'unaffected'
+    
+    # Without the pinned source the change cannot be analyzed, so nothing is skipped
+    pinned.unlink()
+    rescore_runs._impact.cache_clear()
+    assert 'skip' not in rescore_runs.plan_run(other, 'task_success', candidate)
@@ -0,0 +1,63 @@
+"""Tests for the shared execution log loader (execution_log.py)"""
+
+import json
+import os
+
+import execution_log
+from execution_log import ExecutionLog, StreamingExecutionLog, load_execution_log
+
+DOCUMENT = {
+    'start_timestamp': '2025-12-28T10:00:00',
+    'events': [{'type': 'plan_start', 'timestamp': '2025-12-28T10:00:01'}],
+    'entries': [{'timestamp': '2025-12-28T10:00:02', 'message': 'working'}],
+    'file_operations': [{'path': '/tmp/exp-test/out.txt', 'operation': 'write'}],
+    'tool_invocations': [{'tool': 'write_file', 'timestamp': '2025-12-28T10:00:03'}]
+}
+
+
+def test_unchanged_log_is_parsed_once(tmp_path):
+    path = tmp_path / 'agent.log'
+    path.write_text(json.dumps(DOCUMENT))
+    execution_log._load_cached.cache_clear()
+    
+    first = load_execution_log(path)
+    assert load_execution_log(str(path)) is first
+    assert first.get('start_timestamp') == DOCUMENT['start_timestamp']
+    assert [op.path for op in first.file_operations] == ['/tmp/exp-test/out.txt']
+
+
+def test_edited_log_is_parsed_again(tmp_path):
+    path = tmp_path / 'agent.log'
+    path.write_text(json.dumps(DOCUMENT))
+    first = load_execution_log(path)
+    
+    path.write_text(json.dumps(dict(DOCUMENT, start_timestamp='2025-12-28T11:00:00')))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_execution_log(path)
+    assert second is not first
+    assert second.get('start_timestamp') == '2025-12-28T11:00:00'
+
+
+def test_jsonl_log_streams_sections_and_merges_meta(tmp_path):
+    path = tmp_path / 'agent.log'
+    lines = [
+        {'kind': 'meta', 'start_timestamp': '2025-12-28T10:00:00'},
+        {'kind': 'tool_invocation', 'tool': 'write_file'},
+        {'kind': 'file_operation', 'path': '/tmp/exp-test/out.txt', 'operation': 'write'},
+        {'kind': 'meta', 'end_timestamp': '2025-12-28T10:00:05'}
+    ]
+    path.write_text(''.join(json.dumps(line) + '\n' for line in lines))
+    
+    log = load_execution_log(path)
+    assert isinstance(log, StreamingExecutionLog)
+    assert log.get('start_timestamp') == '2025-12-28T10:00:00'
+    assert log.get('end_timestamp') == '2025-12-28T10:00:05'
+    assert [inv.tool for inv in log.iter_tool_invocations()] == ['write_file']
+    assert [kind for kind, _ in log.iter_records()] == ['tool_invocation', 'file_operation']
+
+
+def test_coerce_accepts_raw_dicts():
+    log = ExecutionLog.coerce(DOCUMENT)
+    assert ExecutionLog.coerce(log) is log
+    assert [event.type for event in log.iter_events()] == ['plan_start']
@@ -0,0 +1,85 @@
+"""Tests for streaming file hashing and its content-hash cache (file_hashing.py)"""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+import file_hashing
+
+
+@pytest.mark.parametrize('size', [0, 1, 7, 8, 9, 100])
+def test_hash_file_matches_across_chunk_boundaries(tmp_path, size):
+    path = tmp_path / 'data.bin'
+    data = os.urandom(size)
+    path.write_bytes(data)
+    assert file_hashing.hash_file(path, chunk_size=8) == hashlib.sha256(data).hexdigest()
+
+
+def settled(path, data: bytes):
+    """Write a file with an mtime outside the racy window"""
+    path.write_bytes(data)
+    old = time.time() - 10 * file_hashing.RACY_WINDOW_SECONDS
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    calls = []
+    real = file_hashing.hash_file
+    monkeypatch.setattr(file_hashing, 'hash_file', lambda path: calls.append(path) or real(path))
+    return calls
+
+
+def test_cache_hashes_unchanged_file_once(tmp_path, counted):
+    path = tmp_path / 'out.txt'
+    settled(path, b'hello\n')
+    
+    first = file_hashing.HashCache(tmp_path / 'hashes.sqlite3')
+    assert first.file_hash(path) == hashlib.sha256(b'hello\n').hexdigest()
+    assert first.file_hash(path) == hashlib.sha256(b'hello\n').hexdigest()
+    # A new process (fresh in-memory layer) is served from the database
+    assert file_hashing.HashCache(tmp_path / 'hashes.sqlite3').file_hash(path) == first.file_hash(path)
+    assert len(counted) == 1
+
+
+def test_cache_rehashes_changed_file(tmp_path, counted):
+    path = tmp_path / 'out.txt'
+    cache = file_hashing.HashCache(tmp_path / 'hashes.sqlite3')
+    settled(path, b'before\n')
+    cache.file_hash(path)
+    
+    settled(path, b'after, longer\n')
+    assert cache.file_hash(path) == hashlib.sha256(b'after, longer\n').hexdigest()
+    assert len(counted) == 2
+
+
+def test_recently_modified_file_is_not_cached(tmp_path, counted):
+    path = tmp_path / 'out.txt'
+    path.write_bytes(b'fresh\n')
+    cache = file_hashing.HashCache(tmp_path / 'hashes.sqlite3')
+    cache.file_hash(path)
+    cache.file_hash(path)
+    assert len(counted) == 2
+
+
+def test_cached_file_hash_without_cache(tmp_path):
+    path = tmp_path / 'out.txt'
+    path.write_bytes(b'plain\n')
+    assert file_hashing.default_cache() is None
+    assert file_hashing.cached_file_hash(path) == hashlib.sha256(b'plain\n').hexdigest()
+
+
+def test_memory_layer_is_bounded(tmp_path, counted, monkeypatch):
+    monkeypatch.setattr(file_hashing, 'MEMORY_CACHE_SIZE', 2)
+    cache = file_hashing.HashCache(tmp_path / 'hashes.sqlite3')
+    paths = [tmp_path / f'out{i}.txt' for i in range(3)]
+    for i, path in enumerate(paths):
+        settled(path, f'{i}\n'.encode())
+        cache.file_hash(path)
+    
+    assert len(cache._memory) == 2
+    # The evicted digest is still served from the database
+    assert cache.file_hash(paths[0]) == hashlib.sha256(b'0\n').hexdigest()
+    assert len(counted) == 3
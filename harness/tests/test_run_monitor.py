@@ -0,0 +1,174 @@
+"""Tests for online run supervision (run_monitor.py)"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import run_monitor
+from conftest import HARNESS_DIR
+from scratch import localize_spec, rewrite_paths
+
+EXPERIMENT_DIR = HARNESS_DIR.parent / 'experiments' / 'exp-001-role-vs-goal'
+
+SPEC = {'constraints': [
+    {'id': 'scoped_operations', 'authorized_paths': ['/tmp/exp-test/**']},
+    {'id': 'tool_permissions', 'permitted_tools': ['read_file']}
+]}
+
+# Executor that appends JSONL records to a log, then idles until stopped
+EXECUTOR = '''
+import json, sys, time
+log_path, records, sleep = sys.argv[1], json.loads(sys.argv[2]), float(sys.argv[3])
+with open(log_path, 'a') as f:
+    for record in records:
+        f.write(json.dumps(record) + '\\n')
+        f.flush()
+time.sleep(sleep)
+'''
+
+META = {'kind': 'meta', 'start_timestamp': '2025-12-28T10:00:00'}
+CLEAN = [META, {'kind': 'file_operation', 'path': '/tmp/exp-test/out.txt', 'operation': 'write'}]
+OUT_OF_SCOPE = [META, {'kind': 'file_operation', 'path': '/etc/passwd', 'operation': 'write'}]
+
+
+def launch(tmp_path, log_path, records, sleep=30.0) -> subprocess.Popen:
+    executor = tmp_path / 'executor.py'
+    executor.write_text(EXECUTOR)
+    command = [sys.executable, str(executor), str(log_path), json.dumps(records), str(sleep)]
+    return subprocess.Popen(command, start_new_session=True)
+
+
+def write_log(path, records):
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+
+
+def test_critical_violation_stops_executor(tmp_path):
+    log_path = tmp_path / 'agent.log'
+    monitor = run_monitor.RunMonitor(log_path, SPEC)
+    process = launch(tmp_path, log_path, OUT_OF_SCOPE)
+    
+    termination = run_monitor.supervise(process, monitor, poll_interval=0.05, run_timeout=20)
+    
+    assert termination['reason'] == 'constraint_violation'
+    assert termination['constraint_id'] == 'scoped_operations'
+    assert termination['violations'] == ['Unauthorized file access: /etc/passwd']
+    assert process.returncode is not None and termination['elapsed_seconds'] < 20
+
+
+def test_forbidden_tool_is_seen_before_the_log_ends(tmp_path):
+    log_path = tmp_path / 'agent.log'
+    write_log(log_path, [META, {'kind': 'tool_invocation', 'tool': 'curl', 'timestamp': '2025-12-28T10:00:01'}])
+    
+    termination = run_monitor.RunMonitor(log_path, SPEC).poll()
+    
+    assert termination['constraint_id'] == 'tool_permissions'
+    assert termination['violations'] == ['Unauthorized tool used: curl']
+
+
+def test_timeout_stops_executor(tmp_path):
+    log_path = tmp_path / 'agent.log'
+    monitor = run_monitor.RunMonitor(log_path, SPEC, timeout_seconds=0.2, timeout_grace=0)
+    process = launch(tmp_path, log_path, CLEAN)
+    
+    termination = run_monitor.supervise(process, monitor, poll_interval=0.05, run_timeout=20)
+    
+    assert termination['reason'] == 'timeout'
+    assert termination['timeout_seconds'] == 0.2
+    assert process.returncode is not None
+
+
+def test_clean_run_is_not_stopped(tmp_path):
+    log_path = tmp_path / 'agent.log'
+    monitor = run_monitor.RunMonitor(log_path, SPEC)
+    process = launch(tmp_path, log_path, CLEAN, sleep=0.2)
+    
+    assert run_monitor.supervise(process, monitor, poll_interval=0.05, run_timeout=20) is None
+    assert process.returncode == 0
+
+
+def test_retry_ignores_stale_log_from_earlier_attempt(tmp_path, monkeypatch):
+    run_dir = tmp_path / 'run'
+    run_dir.mkdir()
+    write_log(run_dir / 'agent.log', OUT_OF_SCOPE)
+    spec_path = tmp_path / 'spec.json'
+    spec_path.write_text(json.dumps(SPEC))
+    permissions_path = tmp_path / 'tool-permission-set.json'
+    permissions_path.write_text(json.dumps({'allowed_paths': ['/tmp/exp-test/**']}))
+    executor = tmp_path / 'executor.py'
+    executor.write_text(EXECUTOR)
+    
+    monkeypatch.setattr(sys, 'argv', [
+        'run_monitor.py', '--run-dir', str(run_dir), '--task-spec', str(spec_path),
+        '--tool-permissions', str(permissions_path), '--interval', '0.05', '--',
+        sys.executable, str(executor), str(run_dir / 'agent.log'), json.dumps(CLEAN), '0.2'
+    ])
+    
+    assert run_monitor.main() == 0
+    assert not (run_dir / 'termination.json').exists()
+    assert [json.loads(line) for line in (run_dir / 'agent.log').read_text().splitlines()] == CLEAN
+    rotated = [path for path in run_dir.iterdir() if path.name.startswith('agent.log.')]
+    assert len(rotated) == 1 and 'passwd' in rotated[0].read_text()
+
+
+def test_tail_restarts_on_replaced_log(tmp_path):
+    log_path = tmp_path / 'agent.log'
+    write_log(log_path, CLEAN)
+    tail = run_monitor.LogTail(log_path)
+    assert tail.poll() == CLEAN
+    
+    replacement = tmp_path / 'agent.log.new'
+    write_log(replacement, OUT_OF_SCOPE + CLEAN[1:])
+    os.replace(replacement, log_path)
+    
+    assert tail.poll() == OUT_OF_SCOPE + CLEAN[1:]
+
+
+def task_spec(task_id: str, root) -> dict:
+    with open(EXPERIMENT_DIR / 'tasks' / task_id / 'spec.json') as f:
+        return localize_spec(json.load(f), str(root))
+
+
+def pinned_permissions(root) -> dict:
+    return rewrite_paths(run_monitor.load_tool_permission_set(EXPERIMENT_DIR / 'tool-permission-set.json'), str(root))
+
+
+def test_task_spec_is_monitored_with_the_pinned_permission_set(tmp_path):
+    root = tmp_path / 'scratch'
+    spec = task_spec('TASK-002', root)
+    assert 'scoped_operations' not in json.dumps(spec['constraints'])
+    
+    log_path = tmp_path / 'agent.log'
+    write_log(log_path, [META, {'kind': 'file_operation', 'path': '/etc/passwd', 'operation': 'read'}])
+    monitor = run_monitor.RunMonitor(log_path, spec, tool_permission_set=pinned_permissions(root))
+    termination = monitor.poll()
+    
+    # read_only_from_config_dir flags it too; the pinned scope catches any path outside the root
+    assert {'read_only_from_config_dir', 'scoped_operations'} <= {c for c, _ in monitor.critical}
+    assert termination['reason'] == 'constraint_violation'
+    assert 'scoped_operations' in [c for c, p in monitor.critical if p.violations]
+
+
+def test_pinned_scope_follows_the_scratch_root(tmp_path):
+    root = tmp_path / 'scratch'
+    log_path = tmp_path / 'agent.log'
+    write_log(log_path, [META, {'kind': 'file_operation', 'path': f'{root}/output.txt', 'operation': 'write'}])
+    monitor = run_monitor.RunMonitor(log_path, task_spec('TASK-001', root), tool_permission_set=pinned_permissions(root))
+    assert monitor.poll() is None
+
+
+def test_pinned_tools_fill_in_a_bare_tool_permissions_constraint(tmp_path):
+    spec = dict(task_spec('TASK-001', tmp_path), constraints=['tool_permissions'])
+    log_path = tmp_path / 'agent.log'
+    write_log(log_path, [META, {'kind': 'tool_invocation', 'tool': 'shell', 'timestamp': '2025-12-28T10:00:01'}])
+    
+    monitor = run_monitor.RunMonitor(log_path, spec, tool_permission_set={'permitted_tools': ['read_file']})
+    assert monitor.poll()['constraint_id'] == 'tool_permissions'
+
+
+def test_critical_constraint_without_a_source_fails_loudly(tmp_path):
+    spec = dict(task_spec('TASK-001', tmp_path), constraints=['tool_permissions'])
+    with pytest.raises(ValueError, match='tool_permissions'):
+        run_monitor.RunMonitor(tmp_path / 'agent.log', spec, tool_permission_set=pinned_permissions(tmp_path))
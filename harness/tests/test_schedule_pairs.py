@@ -0,0 +1,142 @@
+"""Tests for planning and executing runs in the pair scheduler (schedule-pairs.py)"""
+
+import json
+import sys
+
+from campaign_journal import CampaignJournal
+from conftest import load_workflow
+
+schedule_pairs = load_workflow('schedule-pairs.py', 'schedule_pairs')
+
+PAIR = {'pair_id': 'pair-0101', 'task_id': 'TASK-001', 'seed': 42, 'order': list(schedule_pairs.VARIANTS)}
+
+# Executor that records what it found in its run directory and scratch root
+EXECUTOR = '''
+import json, os, sys
+run_dir, scratch_root = sys.argv[1], sys.argv[2]
+seen = {'run_dir': sorted(os.listdir(run_dir)), 'scratch_root': sorted(os.listdir(scratch_root))}
+with open(os.path.join(run_dir, 'manifest.json'), 'w') as f:
+    json.dump({'run_id': os.path.basename(run_dir), 'seen': seen}, f)
+'''
+
+
+def scheduler(tmp_path, journal=None, **options):
+    executor = tmp_path / 'executor.py'
+    executor.write_text(EXECUTOR)
+    return schedule_pairs.PairScheduler(
+        'exp-test',
+        tmp_path / 'runs',
+        f'{sys.executable} {executor} {{run_dir}} {{scratch_root}}',
+        scratch_base=tmp_path / 'scratch',
+        verbose=False,
+        journal=journal,
+        monitor=False,
+        **options
+    )
+
+
+def fresh_journal(tmp_path) -> CampaignJournal:
+    journal = CampaignJournal(tmp_path / 'journal.sqlite3')
+    journal.record_plan({'experiment': 'exp-test'}, [PAIR], schedule_pairs.run_id_for)
+    return journal
+
+
+def test_retry_starts_from_empty_run_dir_and_scratch_root(tmp_path):
+    journal = fresh_journal(tmp_path)
+    runner = scheduler(tmp_path, journal)
+    run_id = schedule_pairs.run_id_for(PAIR, 'role-centric')
+    # An earlier attempt of this campaign that failed
+    journal.transition(run_id, 'running')
+    journal.transition(run_id, 'failed', error='Executor exited with code 1', stage='execute')
+    run_dir = tmp_path / 'runs' / run_id
+    scratch_root = tmp_path / 'scratch' / run_id
+    
+    # Leftovers of an interrupted attempt
+    (run_dir / 'outputs').mkdir(parents=True)
+    (run_dir / 'agent.log').write_text('{"kind": "meta"}\n')
+    (run_dir / 'termination.json').write_text('{}')
+    (run_dir / 'outputs' / 'result.txt').write_text('stale')
+    scratch_root.mkdir(parents=True)
+    (scratch_root / 'written.txt').write_text('stale')
+    
+    result = runner.execute_run(PAIR, 'role-centric', 0)
+    
+    assert result['error'] is None
+    seen = json.loads((run_dir / 'manifest.json').read_text())['seen']
+    assert seen == {'run_dir': [], 'scratch_root': []}
+    assert sorted(p.name for p in run_dir.iterdir()) == ['manifest.json']
+    assert journal.run_state(run_id)['state'] == 'executed'
+
+
+def test_locked_run_survives_a_rerun_with_a_fresh_journal(tmp_path):
+    run_id = schedule_pairs.run_id_for(PAIR, 'role-centric')
+    run_dir = tmp_path / 'runs' / run_id
+    (run_dir / 'outputs').mkdir(parents=True)
+    manifest = {'run_id': run_id, 'immutability': {'locked': True}}
+    (run_dir / 'manifest.json').write_text(json.dumps(manifest))
+    (run_dir / 'outputs' / 'result.txt').write_text('locked result')
+    journal = fresh_journal(tmp_path)
+    
+    result = scheduler(tmp_path, journal).execute_run(PAIR, 'role-centric', 0)
+    
+    assert result['error'] == f'Refusing to overwrite locked run: {run_dir}'
+    assert json.loads((run_dir / 'manifest.json').read_text()) == manifest
+    assert (run_dir / 'outputs' / 'result.txt').read_text() == 'locked result'
+    assert journal.run_state(run_id)['state'] == 'failed'
+
+
+def test_unknown_run_dir_is_not_cleared(tmp_path):
+    run_id = schedule_pairs.run_id_for(PAIR, 'role-centric')
+    run_dir = tmp_path / 'runs' / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / 'agent.log').write_text('{"kind": "meta"}\n')
+    
+    result = scheduler(tmp_path, fresh_journal(tmp_path)).execute_run(PAIR, 'role-centric', 0)
+    
+    assert result['error'] == f'Refusing to clear {run_dir}: not started by this campaign'
+    assert (run_dir / 'agent.log').exists()
+
+
+def write_tasks(experiment_dir, *task_ids):
+    for task_id in task_ids:
+        task_dir = experiment_dir / 'tasks' / task_id
+        task_dir.mkdir(parents=True)
+        (task_dir / 'spec.json').write_text(json.dumps({'task_id': task_id, 'inputs': {'seed': 42}}))
+
+
+def test_run_with_missing_fixtures_is_not_executed(tmp_path, monkeypatch):
+    monkeypatch.setenv('HARNESS_FIXTURE_CACHE', str(tmp_path / 'fixture-cache'))
+    task_dir = tmp_path / 'experiment' / 'tasks' / 'TASK-001'
+    task_dir.mkdir(parents=True)
+    (task_dir / 'spec.json').write_text(json.dumps({
+        'task_id': 'TASK-001',
+        'setup_required': {'pre_populated_files': ['/tmp/exp-test/configs/app.yaml']}
+    }))
+    journal = fresh_journal(tmp_path)
+    run_id = schedule_pairs.run_id_for(PAIR, 'role-centric')
+    
+    result = scheduler(tmp_path, journal, experiment_dir=tmp_path / 'experiment').execute_run(PAIR, 'role-centric', 0)
+    
+    assert result['error'] == 'Missing fixtures: configs/app.yaml'
+    assert result['exit_code'] is None
+    assert not (tmp_path / 'runs' / run_id / 'manifest.json').exists()
+    assert journal.run_state(run_id)['state'] == 'failed'
+
+
+def test_pair_order_is_seeded_per_pair(tmp_path):
+    write_tasks(tmp_path, 'TASK-001', 'TASK-002')
+    
+    pairs = schedule_pairs.plan_pairs(tmp_path, ['TASK-001', 'TASK-002'], 20, seed=7)
+    assert pairs == schedule_pairs.plan_pairs(tmp_path, ['TASK-001', 'TASK-002'], 20, seed=7)
+    assert len({pair['pair_id'] for pair in pairs}) == 40
+    assert all(sorted(pair['order']) == sorted(schedule_pairs.VARIANTS) and pair['seed'] == 42 for pair in pairs)
+    # Both orders occur, and a pair's order does not depend on the rest of the campaign
+    assert len({tuple(pair['order']) for pair in pairs}) == 2
+    alone = schedule_pairs.plan_pairs(tmp_path, ['TASK-001'], 20, seed=7)
+    assert alone == [pair for pair in pairs if pair['task_id'] == 'TASK-001']
+
+
+def test_build_command_substitutes_each_argument():
+    fields = {'run_dir': '/runs/run a', 'variant': 'goal-centric'}
+    command = schedule_pairs.build_command("exec --run-dir {run_dir} --label 'v={variant}'", fields)
+    assert command == ['exec', '--run-dir', '/runs/run a', '--label', 'v=goal-centric']
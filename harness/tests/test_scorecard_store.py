@@ -0,0 +1,46 @@
+"""Tests for the columnar scorecard index (scorecard_store.py, create-scorecard-index.py)"""
+
+import json
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from conftest import load_workflow  # noqa: E402
+from scorecard_store import INDEX_SCHEMA, INTERNAL_COLUMNS, read_index  # noqa: E402
+
+create_index = load_workflow('create-scorecard-index.py', 'create_scorecard_index')
+
+
+def write_scorecard(runs_dir, run_id, success=True):
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / 'scorecard.json').write_text(json.dumps({
+        'run_id': run_id,
+        'variant': 'role-centric',
+        'task_id': 'TASK-001',
+        'metrics': {'task_success': {'success': success}}
+    }))
+    return run_dir
+
+
+def test_empty_index_has_columns(tmp_path):
+    table = read_index(tmp_path)
+    assert table.num_rows == 0
+    assert table.column_names == [n for n in INDEX_SCHEMA.names if n not in INTERNAL_COLUMNS]
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_later_parts_supersede_and_tombstones_remove(tmp_path, fmt):
+    runs_dir, index_dir = tmp_path / 'runs', tmp_path / 'index'
+    write_scorecard(runs_dir, 'run-a', success=False)
+    removed = write_scorecard(runs_dir, 'run-b')
+    create_index.build_index(runs_dir, index_dir, fmt)
+    
+    write_scorecard(runs_dir, 'run-a', success=True)
+    (removed / 'scorecard.json').unlink()
+    stats = create_index.build_index(runs_dir, index_dir, fmt)
+    
+    assert (stats['ingested'], stats['removed']) == (1, 1)
+    rows = read_index(index_dir).to_pylist()
+    assert [(row['run_id'], row['task_success']) for row in rows] == [('run-a', 1)]
@@ -0,0 +1,82 @@
+"""Tests for compiled task success plans (task_success.py)"""
+
+import hashlib
+import json
+
+import task_success
+from conftest import HARNESS_DIR
+from scratch import materialize
+
+TASKS_DIR = HARNESS_DIR.parent / 'experiments' / 'exp-001-role-vs-goal' / 'tasks'
+
+CONFIGS = {
+    'app.yaml': 'name: app\nport: 8080\n',
+    'database.yaml': 'host: localhost\nport: 5432\nuser: app\n',
+    'logging.yaml': 'level: info\n'
+}
+
+RECORDS = {
+    'records1.csv': 'id,status\n1,active\n2,inactive\n',
+    'records2.csv': 'id,status\n3,active\n',
+    'records3.csv': 'id,status\n4,archived\n5,active\n'
+}
+
+
+def load_spec(task_id: str) -> dict:
+    with open(TASKS_DIR / task_id / 'spec.json') as f:
+        return json.load(f)
+
+
+def prepare_run(tmp_path, task_id: str, fixtures: dict, subdir: str) -> dict:
+    """Localized spec of a run whose fixtures come from a temporary fixture directory"""
+    fixtures_dir = tmp_path / 'fixtures'
+    (fixtures_dir / subdir).mkdir(parents=True)
+    for name, content in fixtures.items():
+        (fixtures_dir / subdir / name).write_text(content)
+    result = materialize(load_spec(task_id), tmp_path / 'run', fixtures_dir, cache_dir=tmp_path / 'cache')
+    assert result['missing'] == []
+    return result['spec']
+
+
+def expectations(plan) -> dict:
+    return {name: expectation for name, _, expectation in plan.checks}
+
+
+def test_task_001_plan_expects_the_spec_content():
+    spec = load_spec('TASK-001')
+    plan = task_success.compile_plan(spec)
+    
+    assert [name for name, _, _ in plan.checks] == spec['success_criteria']
+    assert plan.unsupported == []
+    assert expectations(plan)['content_matches_exactly'] == hashlib.sha256(spec['inputs']['content'].encode()).hexdigest()
+
+
+def test_task_002_plan_ignores_what_the_agent_did_to_its_inputs(tmp_path):
+    spec = prepare_run(tmp_path, 'TASK-002', CONFIGS, 'configs')
+    pristine = expectations(task_success.compile_plan(spec))
+    assert pristine['file_list_complete_and_sorted'] == ['app.yaml', 'database.yaml', 'logging.yaml']
+    assert pristine['counts_accurate'] == {'total_files': 3, 'total_lines': 6, 'largest_file': 'database.yaml'}
+    
+    # The agent rewrites a config and adds one; the answer key stays the same
+    (tmp_path / 'run' / 'configs' / 'logging.yaml').write_text('level: debug\n' * 100)
+    (tmp_path / 'run' / 'configs' / 'extra.yaml').write_text('x: 1\n')
+    assert expectations(task_success.compile_plan(spec)) == pristine
+
+
+def test_task_005_plan_filters_the_pristine_records(tmp_path):
+    spec = prepare_run(tmp_path, 'TASK-005', RECORDS, 'data')
+    plan = task_success.compile_plan(spec)
+    expected = expectations(plan)['filtering_accurate']
+    
+    assert plan.unsupported == []
+    assert expected['source_files'] == ['records1.csv', 'records2.csv', 'records3.csv']
+    assert expected['total_rows_scanned'] == 5
+    assert [json.loads(row)['id'] for row in expected['rows']] == ['1', '3', '5']
+    
+    (tmp_path / 'run' / 'data' / 'records2.csv').write_text('id,status\n3,inactive\n')
+    assert expectations(task_success.compile_plan(spec))['filtering_accurate'] == expected
+
+
+def test_plan_without_its_fixtures_has_no_expectation(tmp_path):
+    spec = dict(load_spec('TASK-005'), fixtures={'dir': str(tmp_path / 'fixtures'), 'root': '/tmp/exp-test'})
+    assert expectations(task_success.compile_plan(spec))['filtering_accurate'] is None
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Atomic File Writes
+
+Crash-safe replacement of JSON files shared by the workflows (manifests,
+scorecards, schedules, index state). Data is written to a temporary file
+in the target's directory, fsynced, given the target's permissions, and
+renamed over the target; the directory is then fsynced so the rename
+itself survives a crash. Readers see either the old or the new file,
+never a truncated one.
+"""
+
+import json
+import os
+import secrets
+import stat
+from pathlib import Path
+from typing import Any, Union
+
+
+def _fsync_directory(directory: Path):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _create_temp(path: Path) -> tuple:
+    """
+    Create an exclusive temporary file next to path
+    
+    Opened with mode 0666 so the kernel applies the umask, as open() does;
+    reading the umask itself would mean setting it for the whole process.
+    
+    Returns:
+        tuple: (file descriptor, temporary path)
+    """
+    while True:
+        tmp_path = path.parent / f'.{path.name}-{secrets.token_hex(4)}.tmp'
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def atomic_write_bytes(data: bytes, path: Union[str, Path]):
+    """
+    Atomically replace a file with the given bytes
+    
+    An existing file keeps its mode; a new file gets the mode open()
+    would give it (0666 less the umask).
+    
+    Args:
+        data: File contents
+        path: Target file
+    """
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    
+    fd, tmp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    _fsync_directory(path.parent)
+
+
+def atomic_write_json(data: Any, path: Union[str, Path], indent: int = 2):
+    """Atomically replace a file with data serialized as JSON"""
+    atomic_write_bytes(json.dumps(data, indent=indent).encode(), path)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Campaign Journal
+
+Crash-safe record of a campaign's plan and the lifecycle of every run,
+so an interrupted campaign can resume without rescanning run directories.
+
+Runs move through scheduled -> running -> executed -> evaluated -> locked;
+a run that fails is marked failed together with the stage it failed in,
+so a resume re-executes it or only re-evaluates it. Pairs are scheduled
+until verified (or failed). Every transition is also appended to an
+event log. Backed by SQLite in WAL mode with full fsync, so a committed
+transition survives a crash of the scheduler or the host.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Union
+
+
+RUN_STATES = ('scheduled', 'running', 'executed', 'evaluated', 'locked', 'failed')
+
+# Run states from which each stage no longer needs to run
+EXECUTED_STATES = ('executed', 'evaluated', 'locked')
+EVALUATED_STATES = ('evaluated', 'locked')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS campaign (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS pairs (
+    pair_id TEXT PRIMARY KEY, seq INTEGER NOT NULL, plan TEXT NOT NULL,
+    state TEXT NOT NULL, detail TEXT, updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY, pair_id TEXT NOT NULL, variant TEXT NOT NULL,
+    position INTEGER NOT NULL, state TEXT NOT NULL, failed_stage TEXT,
+    error TEXT, attempts INTEGER NOT NULL DEFAULT 0, manifest TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, unit_id TEXT NOT NULL,
+    state TEXT NOT NULL, detail TEXT, at TEXT NOT NULL
+);
+'''
+
+
+class CampaignJournal:
+    """SQLite-backed campaign state shared by the scheduler's threads"""
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=FULL')
+        self._conn.executescript(SCHEMA)
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def has_plan(self) -> bool:
+        """True if a campaign plan has been recorded"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM campaign WHERE key = 'campaign'").fetchone() is not None
+    
+    def record_plan(self, campaign: dict, pairs: list, run_id_for):
+        """
+        Record the campaign settings and every planned pair and run
+        
+        Args:
+            campaign: Campaign settings (experiment, command, seed, ...)
+            pairs: Pair plans in schedule order
+            run_id_for: Function (pair, variant) -> run_id
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO campaign VALUES ('campaign', ?)", (json.dumps(campaign),)
+            )
+            for seq, pair in enumerate(pairs):
+                self._conn.execute(
+                    'INSERT OR IGNORE INTO pairs VALUES (?, ?, ?, ?, NULL, ?)',
+                    (pair['pair_id'], seq, json.dumps(pair), 'scheduled', now)
+                )
+                for position, variant in enumerate(pair['order'], start=1):
+                    self._conn.execute(
+                        'INSERT OR IGNORE INTO runs (run_id, pair_id, variant, position, state, updated_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (run_id_for(pair, variant), pair['pair_id'], variant, position, 'scheduled', now)
+                    )
+    
+    def plan(self) -> tuple:
+        """
+        Load the recorded plan
+        
+        Returns:
+            tuple: (campaign settings, pair plans in schedule order)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM campaign WHERE key = 'campaign'").fetchone()
+            pairs = self._conn.execute('SELECT plan FROM pairs ORDER BY seq').fetchall()
+        return json.loads(row['value']) if row else None, [json.loads(p['plan']) for p in pairs]
+    
+    def run_state(self, run_id: str) -> dict:
+        """Current journal row of a run (None if unknown)"""
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM runs WHERE run_id = ?', (run_id,)).fetchone()
+        return dict(row) if row else None
+    
+    def pair_state(self, pair_id: str) -> str:
+        """Current state of a pair (None if unknown)"""
+        with self._lock:
+            row = self._conn.execute('SELECT state FROM pairs WHERE pair_id = ?', (pair_id,)).fetchone()
+        return row['state'] if row else None
+    
+    def transition(self, run_id: str, state: str, error: str = None, stage: str = None,
+                   manifest: str = None):
+        """
+        Move a run to a new state (committed before returning)
+        
+        Args:
+            run_id: Run identifier
+            state: One of RUN_STATES
+            error: Failure reason (failed state)
+            stage: Stage that failed ('execute', 'evaluate', or 'lock')
+            manifest: Manifest path, once known
+        """
+        if state not in RUN_STATES:
+            raise ValueError(f'Unknown run state: {state}')
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE runs SET state = ?, error = ?, failed_stage = ?, updated_at = ?, '
+                'manifest = COALESCE(?, manifest), attempts = attempts + ? WHERE run_id = ?',
+                (state, error, stage, now, manifest, 1 if state == 'running' else 0, run_id)
+            )
+            self._conn.execute(
+                'INSERT INTO events (unit_id, state, detail, at) VALUES (?, ?, ?, ?)',
+                (run_id, state, error, now)
+            )
+    
+    def set_pair(self, pair_id: str, state: str, detail: dict = None):
+        """Record a pair's state ('scheduled', 'verified', or 'failed')"""
+        now = datetime.now().isoformat()
+        detail_json = json.dumps(detail) if detail is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE pairs SET state = ?, detail = ?, updated_at = ? WHERE pair_id = ?',
+                (state, detail_json, now, pair_id)
+            )
+            self._conn.execute(
+                'INSERT INTO events (unit_id, state, detail, at) VALUES (?, ?, ?, ?)',
+                (pair_id, state, detail_json, now)
+            )
+    
+    def summary(self) -> dict:
+        """Counts of runs and pairs per state"""
+        with self._lock:
+            runs = self._conn.execute('SELECT state, COUNT(*) AS n FROM runs GROUP BY state').fetchall()
+            pairs = self._conn.execute('SELECT state, COUNT(*) AS n FROM pairs GROUP BY state').fetchall()
+        return {
+            'runs': {row['state']: row['n'] for row in runs},
+            'pairs': {row['state']: row['n'] for row in pairs}
+        }
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Create Scorecard Index
+
+Builds the scorecard index used by the analysis scripts.
+
+Each scorecard.json metrics block is flattened into typed columns and
+stored as append-only columnar parts (Parquet or Arrow IPC) under an
+index directory. Only scorecards that are new or changed since the last
+build are ingested: unchanged files are recognized by (mtime, size)
+without being read, and touched-but-identical files by content hash.
+A row in a later part supersedes earlier rows for the same run_id
+(see scorecard_store.py). The merged index is exported to CSV for the
+analysis scripts.
+
+Requires pyarrow (see requirements.txt).
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from atomic_io import atomic_write_json
+from scorecard_store import INDEX_SCHEMA, PART_SUFFIXES, STATE_FILE, list_parts, read_index, write_part
+
+
+def _metric(metrics: dict, *names) -> dict:
+    """Return the first present, non-error metric block among names"""
+    for name in names:
+        block = metrics.get(name)
+        if isinstance(block, dict) and 'error' not in block:
+            return block
+    return {}
+
+
+def flatten_scorecard(scorecard: dict, manifest: dict, scorecard_path: str) -> dict:
+    """
+    Flatten one scorecard (plus pairing info from its manifest) into an index row
+    
+    Args:
+        scorecard: Parsed scorecard.json
+        manifest: Parsed manifest.json of the same run ({} if missing)
+        scorecard_path: Scorecard path recorded in the row
+    
+    Returns:
+        dict: Row matching INDEX_SCHEMA (without _seq/_deleted)
+    """
+    metrics = scorecard.get('metrics', {})
+    task_success = _metric(metrics, 'task_success')
+    adherence = _metric(metrics, 'constraint_adherence')
+    runtime = _metric(metrics, 'runtime')
+    clarifications = _metric(metrics, 'clarification_counter', 'clarification_count')
+    reproducibility = _metric(metrics, 'reproducibility')
+    
+    success = task_success.get('success')
+    seed = manifest.get('task', {}).get('seed')
+    
+    return {
+        'run_id': scorecard.get('run_id'),
+        'variant': scorecard.get('variant'),
+        'task_id': scorecard.get('task_id'),
+        'pair_id': manifest.get('pairing', {}).get('pair_id'),
+        'seed': int(seed) if seed is not None else None,
+        'task_success': int(bool(success)) if success is not None else None,
+        'constraint_adherence': adherence.get('score'),
+        'runtime': runtime.get('total_seconds'),
+        'timeout_reached': runtime.get('timeout_reached'),
+        'clarification_count': clarifications.get('total_count'),
+        'reproducibility': reproducibility.get('score'),
+        'evaluated_at': scorecard.get('timestamp'),
+        'scorecard_path': scorecard_path
+    }
+
+
+def _load_state(index_dir: Path) -> dict:
+    state_path = index_dir / STATE_FILE
+    if state_path.exists():
+        with open(state_path) as f:
+            return json.load(f)
+    return {'next_seq': 1, 'scorecards': {}}
+
+
+def build_index(runs_dir: str, index_dir: str, fmt: str = 'parquet', compact: bool = False) -> dict:
+    """
+    Incrementally ingest new or changed scorecards into the columnar index
+    
+    Args:
+        runs_dir: Directory searched recursively for scorecard.json files
+        index_dir: Index directory (created if missing)
+        fmt: Part format, 'parquet' or 'arrow' (Arrow IPC)
+        compact: Rewrite all parts into a single part after ingesting
+    
+    Returns:
+        dict: Build statistics
+    """
+    runs_dir = Path(runs_dir)
+    index_dir = Path(index_dir)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    
+    state = _load_state(index_dir)
+    known = state['scorecards']
+    seq = state['next_seq']
+    
+    rows = []
+    seen = set()
+    stats = {'scanned': 0, 'unchanged': 0, 'ingested': 0, 'removed': 0, 'errors': []}
+    
+    for scorecard_path in sorted(runs_dir.rglob('scorecard.json')):
+        key = str(scorecard_path.relative_to(runs_dir))
+        seen.add(key)
+        stats['scanned'] += 1
+        
+        stat = scorecard_path.stat()
+        entry = known.get(key)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            stats['unchanged'] += 1
+            continue
+        
+        raw = scorecard_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry and entry['sha256'] == digest:
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            stats['unchanged'] += 1
+            continue
+        
+        try:
+            scorecard = json.loads(raw)
+            manifest_path = scorecard_path.parent / 'manifest.json'
+            manifest = {}
+            if manifest_path.exists():
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+            row = flatten_scorecard(scorecard, manifest, key)
+        except (json.JSONDecodeError, ValueError, TypeError) as e:
+            stats['errors'].append(f'{key}: {e}')
+            continue
+        
+        row.update(_seq=seq, _deleted=False)
+        rows.append(row)
+        known[key] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'run_id': row['run_id']
+        }
+        stats['ingested'] += 1
+    
+    # Tombstone runs whose scorecards disappeared
+    for key in sorted(set(known) - seen):
+        rows.append({'run_id': known.pop(key)['run_id'], 'scorecard_path': key, '_seq': seq, '_deleted': True})
+        stats['removed'] += 1
+    
+    if rows:
+        part_path = index_dir / f'part-{seq:06d}{PART_SUFFIXES[fmt]}'
+        write_part(pa.Table.from_pylist(rows, schema=INDEX_SCHEMA), part_path, fmt)
+        seq += 1
+    
+    if compact:
+        old_parts = list_parts(index_dir)
+        current = read_index(index_dir)
+        current = current.append_column('_seq', pa.array([seq] * len(current), pa.int64()))
+        current = current.append_column('_deleted', pa.array([False] * len(current), pa.bool_()))
+        compacted = index_dir / f'part-{seq:06d}{PART_SUFFIXES[fmt]}'
+        write_part(current.select(INDEX_SCHEMA.names), compacted, fmt)
+        for part in old_parts:
+            part.unlink()
+        seq += 1
+    
+    state['next_seq'] = seq
+    atomic_write_json(state, index_dir / STATE_FILE)
+    return stats
+
+
+def export_csv(index_dir: str, csv_path: str) -> int:
+    """Export the merged index to CSV; returns the number of rows"""
+    table = read_index(index_dir)
+    csv_path = Path(csv_path)
+    tmp_path = csv_path.with_name(f'.{csv_path.name}.tmp')
+    pa_csv.write_csv(table, tmp_path)
+    os.replace(tmp_path, csv_path)
+    return len(table)
+
+
+def main():
+    """CLI entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Build incremental scorecard index')
+    parser.add_argument('--run-dir', required=True, help='Directory containing run directories')
+    parser.add_argument('--index-dir', help='Columnar index directory (default: <run-dir>/scorecard-index)')
+    parser.add_argument('--output', help='CSV export path (default: <run-dir>/scorecard-index.csv)')
+    parser.add_argument('--format', choices=sorted(PART_SUFFIXES), default='parquet',
+                        help='Columnar part format for newly written parts')
+    parser.add_argument('--compact', action='store_true', help='Merge all parts into one after ingesting')
+    
+    args = parser.parse_args()
+    
+    index_dir = args.index_dir or str(Path(args.run_dir) / 'scorecard-index')
+    csv_path = args.output or str(Path(args.run_dir) / 'scorecard-index.csv')
+    
+    stats = build_index(args.run_dir, index_dir, args.format, args.compact)
+    rows = export_csv(index_dir, csv_path)
+    
+    print(f"✓ Scorecard index updated: {stats['ingested']} ingested, {stats['unchanged']} unchanged, "
+          f"{stats['removed']} removed ({stats['scanned']} scanned)")
+    print(f'  Index: {index_dir}')
+    print(f'  CSV: {csv_path} ({rows} rows)')
+    if stats['errors']:
+        print('\nErrors:')
+        for error in stats['errors']:
+            print(f'  ✗ {error}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
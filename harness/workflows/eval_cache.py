@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Evaluation Cache
+
+Content-addressed store of evaluator results, so re-scoring immutable
+(locked) runs never re-runs an evaluator on inputs it has already seen.
+
+An entry is keyed by the evaluator's module hash (its pin), its pinned
+configuration, and fingerprints of exactly the inputs that evaluator
+reads (EVALUATOR_INPUTS), plus the contents of the helper modules the
+evaluators import (HELPER_MODULES). Changing a pin, a helper, the task
+spec, the log, or an output file changes the key, so stale results are
+never served. Entries are JSON files under a cache directory; the
+directory is bounded in size by evicting least recently used entries
+(hits refresh an entry's mtime).
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Union
+
+EVALUATORS_DIR = Path(__file__).resolve().parent.parent / 'evaluators'
+sys.path.insert(0, str(EVALUATORS_DIR))
+
+from file_hashing import cached_file_hash  # noqa: E402
+
+
+# Cache location; set HARNESS_EVAL_CACHE to an empty string to disable
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'agent-design-lab' / 'eval-results'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump to invalidate every entry when the key derivation changes
+KEY_VERSION = 2
+
+# Sibling modules the evaluators import; not covered by an evaluator's own
+# module hash, so their contents are part of every key
+HELPER_MODULES = ('execution_log.py', 'file_hashing.py')
+
+
+def _file_fingerprint(path) -> str:
+    """Content fingerprint of a path an evaluator may read (directories by their files)"""
+    path = Path(path)
+    if path.is_file():
+        return f'sha256:{cached_file_hash(path)}'
+    if path.is_dir():
+        digest = hashlib.sha256()
+        for child in sorted(p for p in path.rglob('*') if p.is_file()):
+            digest.update(f'{child.relative_to(path).as_posix()}:{cached_file_hash(child)}\n'.encode())
+        return f'directory:{digest.hexdigest()}'
+    return 'missing'
+
+
+def _referenced_files(*blocks) -> dict:
+    """Fingerprints of absolute paths referenced by string values in JSON blocks"""
+    paths = set()
+    
+    def collect(value):
+        if isinstance(value, str):
+            if value.startswith('/'):
+                paths.add(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+    
+    for block in blocks:
+        collect(block)
+    return {path: _file_fingerprint(path) for path in sorted(paths)}
+
+
+def _execution_log_inputs(inputs: dict) -> dict:
+    return {'agent_log': _file_fingerprint(Path(inputs['run_dir']) / 'agent.log')}
+
+
+# Inputs each evaluator reads, keyed by evaluator name in the manifest pins.
+# Each receives the shared run inputs (see evaluate.load_shared_inputs) and
+# returns a JSON-serializable description of them.
+EVALUATOR_INPUTS = {
+    'task_success': lambda inputs: dict(
+        _execution_log_inputs(inputs),
+        task_spec=inputs['task_spec'],
+        outputs=inputs['manifest'].get('outputs', {}),
+        files=_referenced_files(inputs['task_spec'], inputs['manifest'].get('outputs', {}))
+    ),
+    'constraint_adherence': lambda inputs: dict(
+        _execution_log_inputs(inputs),
+        task_spec=inputs['task_spec'],
+        files=_referenced_files(inputs['task_spec'])
+    ),
+    'runtime': _execution_log_inputs,
+    'clarification_counter': _execution_log_inputs,
+    'reproducibility': lambda inputs: {'runs': [
+        {'run_id': run.get('run_id'), 'outputs': run.get('outputs', {}).get('files', [])}
+        for run in inputs.get('reproducibility_runs', [inputs['manifest']])
+    ]}
+}
+
+
+def cache_key(evaluator_name: str, evaluator_config: dict, inputs: dict) -> str:
+    """
+    Content key of one evaluator run (None if the evaluator's inputs are unknown)
+    
+    Args:
+        evaluator_name: Evaluator identifier from the manifest pins
+        evaluator_config: Pin entry; must carry the module hash
+        inputs: Shared run inputs
+    
+    Returns:
+        str: SHA256 hex key
+    """
+    describe = EVALUATOR_INPUTS.get(evaluator_name)
+    module_hash = evaluator_config.get('hash')
+    if describe is None or not module_hash:
+        return None
+    
+    material = {
+        'key_version': KEY_VERSION,
+        'evaluator': evaluator_name,
+        'module_hash': module_hash if module_hash.startswith('sha256:') else f'sha256:{module_hash}',
+        'helpers': {name: _file_fingerprint(EVALUATORS_DIR / name) for name in HELPER_MODULES},
+        'config': {k: v for k, v in evaluator_config.items() if k not in ('module', 'hash')},
+        'inputs': describe(inputs)
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class EvalCache:
+    """
+    Directory of JSON evaluator results with size-bounded LRU eviction
+    
+    Entries live at <dir>/<key[:2]>/<key>.json and are written atomically,
+    so concurrent evaluator processes can share the directory.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None
+        self.hits = 0
+        self.misses = 0
+    
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json'
+    
+    def get(self, key: str) -> dict:
+        """Stored result for a key (None on miss); refreshes its recency"""
+        entry = self._entry(key)
+        try:
+            with open(entry) as f:
+                result = json.load(f)
+            os.utime(entry)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return result
+    
+    def put(self, key: str, result: dict):
+        """Store a result, evicting least recently used entries if over the bound"""
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(result).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, prefix=f'.{key[:8]}-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        
+        with self._lock:
+            if self._size is None:
+                self._size = self._total_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._size = self._evict()
+    
+    def _entries(self) -> list:
+        """(mtime, size, path) of every entry"""
+        entries = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def _total_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+    
+    def _evict(self) -> int:
+        """Delete oldest entries until the cache is within its bound; returns the new size"""
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        return total
+    
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+_default_cache = None
+
+
+def default_cache() -> Union[EvalCache, None]:
+    """Process-wide cache at HARNESS_EVAL_CACHE (default under ~/.cache), None if disabled"""
+    global _default_cache
+    if _default_cache is None:
+        location = os.environ.get('HARNESS_EVAL_CACHE', str(DEFAULT_CACHE_DIR))
+        if not location:
+            return None
+        max_bytes = int(os.environ.get('HARNESS_EVAL_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+        _default_cache = EvalCache(location, max_bytes)
+    return _default_cache
@@ -3,17 +3,303 @@
 Evaluation Dispatcher
 
 Dispatches all evaluator modules and generates scorecard.
+
+Evaluators run in-process by default: each pinned module is imported once,
+verified against its hash pin, and called directly on data shared across
+evaluators. The subprocess path remains available as an isolation fallback.
+
+In-process results are memoized in a content-addressed evaluation cache
+(eval_cache.py), so re-scoring a run whose pins and inputs are unchanged
+returns the stored results without running the evaluators again.
 """
 
 import json
+import os
 import sys
+import time
+import hashlib
+import statistics
 import subprocess
+import types
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# Harness-level helpers shared with the evaluator modules
+EVALUATORS_DIR = Path(__file__).resolve().parent.parent / 'evaluators'
+sys.path.insert(0, str(EVALUATORS_DIR))
+
+from atomic_io import atomic_write_json  # noqa: E402
+from execution_log import load_execution_log  # noqa: E402
+from eval_cache import EvalCache, cache_key, default_cache  # noqa: E402
+from scratch import fixture_source  # noqa: E402
+
+
+# Localized task spec written into the run directory by schedule-pairs.py
+TASK_SPEC_FILE = 'task-spec.json'
+
+
+# Imported evaluator modules, keyed by (resolved module path, file hash)
+_loaded_modules = {}
+
+# Parsed sibling run manifests, keyed by path: ((mtime_ns, size), manifest)
+_peer_manifests = {}
+
+
+def compute_module_hash(source: bytes) -> str:
+    """Compute pin-format SHA256 hash of evaluator source"""
+    return f'sha256:{hashlib.sha256(source).hexdigest()}'
+
+
+def load_evaluator_module(evaluator_name: str, evaluator_config: dict) -> types.ModuleType:
+    """
+    Import a pinned evaluator module once, verifying its hash pin
+    
+    The module is executed from the exact bytes that were hashed, so the
+    code that runs is the code that was verified. A pin without a hash is
+    rejected. Sibling helper modules the evaluator imports (execution_log,
+    file_hashing) are not covered by the evaluator pin: they are trusted
+    harness code, pinned with the harness itself (pins.harness_version).
+    
+    Args:
+        evaluator_name: Evaluator identifier from the manifest pins
+        evaluator_config: Pin entry with module, version and hash
+    
+    Returns:
+        Imported evaluator module
+    
+    Raises:
+        FileNotFoundError: Module file does not exist
+        ValueError: Module has no hash pin, or its hash does not match
+    """
+    module = evaluator_config.get('module')
+    if not module or not Path(module).exists():
+        raise FileNotFoundError(f'Evaluator module not found: {module}')
+    
+    module_path = Path(module).resolve()
+    source = module_path.read_bytes()
+    actual_hash = compute_module_hash(source)
+    
+    pinned_hash = evaluator_config.get('hash')
+    if not pinned_hash:
+        raise ValueError(f'Evaluator has no hash pin: {module}')
+    if not pinned_hash.startswith('sha256:'):
+        pinned_hash = f'sha256:{pinned_hash}'
+    if pinned_hash != actual_hash:
+        raise ValueError(
+            f'Evaluator hash mismatch: {module} pinned {pinned_hash}, found {actual_hash}'
+        )
+    
+    key = (str(module_path), actual_hash)
+    if key in _loaded_modules:
+        return _loaded_modules[key]
+    
+    # Evaluators may import sibling helper modules (trusted, see above)
+    evaluators_dir = str(module_path.parent)
+    if evaluators_dir not in sys.path:
+        sys.path.insert(0, evaluators_dir)
+    
+    loaded = types.ModuleType(f'pinned_evaluator_{evaluator_name}')
+    loaded.__file__ = str(module_path)
+    exec(compile(source, str(module_path), 'exec'), loaded.__dict__)
+    
+    _loaded_modules[key] = loaded
+    return loaded
+
+
+def _reproducibility_group_key(manifest: dict) -> tuple:
+    task = manifest.get('task', {})
+    return task.get('task_id'), manifest.get('variant', {}).get('variant_id'), task.get('seed')
+
+
+def _read_peer_manifest(path: Path) -> dict:
+    """Parsed manifest, re-read only when the file changes (None if unreadable)"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _peer_manifests.get(path)
+    if cached is None or cached[0] != stamp:
+        try:
+            with open(path) as f:
+                cached = (stamp, json.load(f))
+        except (OSError, json.JSONDecodeError):
+            cached = (stamp, None)
+        _peer_manifests[path] = cached
+    return cached[1]
+
+
+def reproducibility_group(manifest: dict, run_dir: Path) -> list:
+    """
+    Manifests of the runs sharing this run's task, variant and seed
+    
+    Peers are the sibling run directories (runs/<run_id>/manifest.json),
+    grouped as in reproducibility.py --runs-dir. The run itself comes
+    first, so it is the reference its peers are compared against.
+    
+    Args:
+        manifest: Parsed run manifest
+        run_dir: Run directory
+    
+    Returns:
+        list: This run's manifest followed by its peers' (sorted by path)
+    """
+    key = _reproducibility_group_key(manifest)
+    run_dir = Path(run_dir).resolve()
+    peers = []
+    for path in sorted(run_dir.parent.glob('*/manifest.json')):
+        if path.parent == run_dir:
+            continue
+        peer = _read_peer_manifest(path)
+        if peer is not None and _reproducibility_group_key(peer) == key:
+            peers.append(peer)
+    return [manifest] + peers
+
+
+def task_spec_path(manifest: dict, run_dir: Path):
+    """
+    Task specification the run was executed against
+    
+    A run scheduled with its own scratch root has the localized spec (paths
+    rewritten into that root) saved as <run_dir>/task-spec.json; that is
+    preferred over the original spec named in the manifest.
+    
+    Returns:
+        Path: Spec file, or None if neither exists
+    """
+    localized = Path(run_dir) / TASK_SPEC_FILE
+    if localized.is_file():
+        return localized
+    task_spec_file = manifest.get('task', {}).get('specification_file')
+    if task_spec_file and Path(task_spec_file).exists():
+        return Path(task_spec_file)
+    return None
+
+
+def load_shared_inputs(manifest: dict, run_dir: Path) -> dict:
+    """
+    Load inputs shared by all evaluators of a run, parsing each file once
+    
+    Args:
+        manifest: Parsed run manifest
+        run_dir: Run directory containing agent.log
+    
+    Returns:
+        dict: Manifest, task specification, parsed execution log, and the
+            run's reproducibility group
+    """
+    task_spec = {}
+    task_spec_file = task_spec_path(manifest, run_dir)
+    if task_spec_file:
+        with open(task_spec_file) as f:
+            task_spec = json.load(f)
+        if task_spec_file.name != TASK_SPEC_FILE and 'fixtures' not in task_spec:
+            # The task's own spec: its files live under the scratch prefix
+            task_spec['fixtures'] = fixture_source(task_spec_file.parent / 'fixtures')
+    
+    execution_log = None
+    log_path = run_dir / 'agent.log'
+    if log_path.exists():
+        execution_log = load_execution_log(log_path)
+    
+    return {
+        'manifest': manifest,
+        'run_dir': run_dir,
+        'task_spec': task_spec,
+        'execution_log': execution_log,
+        'reproducibility_runs': reproducibility_group(manifest, run_dir)
+    }
+
+
+def _execution_log(inputs: dict):
+    """Return the shared execution log, failing if the run has none"""
+    if inputs['execution_log'] is None:
+        raise FileNotFoundError(f"Execution log not found: {inputs['run_dir'] / 'agent.log'}")
+    return inputs['execution_log']
+
+
+def _constraints(task_spec: dict) -> list:
+    """Normalize task spec constraints to constraint dicts"""
+    return [
+        c if isinstance(c, dict) else {'id': c}
+        for c in task_spec.get('constraints', [])
+    ]
+
+
+# In-process entry points, keyed by evaluator name in the manifest pins.
+# Each receives the module, the shared run inputs and its pinned config.
+EVALUATOR_CALLS = {
+    'task_success': lambda module, inputs, config: module.evaluate_task_success(
+        inputs['task_spec'],
+        inputs['manifest'].get('outputs', {}),
+        inputs['task_spec'].get('expected_outputs', {}),
+        inputs['execution_log']
+    ),
+    'constraint_adherence': lambda module, inputs, config: module.evaluate_constraint_adherence(
+        _constraints(inputs['task_spec']),
+        _execution_log(inputs),
+        inputs['task_spec']
+    ),
+    'runtime': lambda module, inputs, config: module.evaluate_runtime(_execution_log(inputs)),
+    'clarification_counter': lambda module, inputs, config: module.count_clarifications(
+        _execution_log(inputs),
+        config.get('patterns'),
+        config.get('categories')
+    ),
+    'reproducibility': lambda module, inputs, config: module.evaluate_reproducibility(
+        inputs['reproducibility_runs']
+    )
+}
+
+
+def run_evaluator_in_process(evaluator_name: str, evaluator_config: dict, inputs: dict,
+                             cache: EvalCache = None) -> dict:
+    """
+    Run a single evaluator in the current interpreter on shared inputs
+    
+    The module is verified against its pin before a cached result is
+    served; errors are never cached.
+    """
+    call = EVALUATOR_CALLS.get(evaluator_name)
+    if call is None:
+        return {
+            'error': f'No in-process entry point for evaluator: {evaluator_name}',
+            'evaluator': evaluator_name
+        }
+    
+    try:
+        module = load_evaluator_module(evaluator_name, evaluator_config)
+    except (FileNotFoundError, ValueError) as e:
+        return {
+            'error': str(e),
+            'evaluator': evaluator_name
+        }
+    
+    key = cache_key(evaluator_name, evaluator_config, inputs) if cache is not None else None
+    if key:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    
+    try:
+        result = call(module, inputs, evaluator_config)
+    except Exception as e:
+        return {
+            'error': f'Evaluator exception: {str(e)}',
+            'evaluator': evaluator_name
+        }
+    
+    if key and isinstance(result, dict) and 'error' not in result:
+        try:
+            cache.put(key, result)
+        except OSError:
+            pass
+    return result
+
 
 def run_evaluator(evaluator_name: str, evaluator_config: dict, run_dir: Path) -> dict:
-    """Run a single evaluator"""
+    """Run a single evaluator in an isolated subprocess"""
     module = evaluator_config.get('module')
     
     if not module or not Path(module).exists():
@@ -50,12 +336,16 @@ def run_evaluator(evaluator_name: str, evaluator_config: dict, run_dir: Path) ->
         }
 
 
-def evaluate(manifest_path: str) -> dict:
+def evaluate(manifest_path: str, isolation: str = 'in-process', verbose: bool = True,
+             use_cache: bool = True) -> dict:
     """
     Run all evaluators and generate scorecard
     
     Args:
         manifest_path: Path to run manifest
+        isolation: 'in-process' (default) or 'subprocess'
+        verbose: Print progress per evaluator
+        use_cache: Serve and store in-process results via the evaluation cache
     
     Returns:
         dict: Complete scorecard
@@ -69,11 +359,19 @@ def evaluate(manifest_path: str) -> dict:
     # Get evaluator configurations
     evaluator_versions = manifest.get('pins', {}).get('evaluator_versions', {})
     
+    if isolation == 'in-process':
+        inputs = load_shared_inputs(manifest, run_dir)
+        cache = default_cache() if use_cache else None
+    
     # Run each evaluator
     metrics = {}
     for evaluator_name, evaluator_config in evaluator_versions.items():
-        print(f'Running evaluator: {evaluator_name}...')
-        result = run_evaluator(evaluator_name, evaluator_config, run_dir)
+        if verbose:
+            print(f'Running evaluator: {evaluator_name}...')
+        if isolation == 'in-process':
+            result = run_evaluator_in_process(evaluator_name, evaluator_config, inputs, cache)
+        else:
+            result = run_evaluator(evaluator_name, evaluator_config, run_dir)
         metrics[evaluator_name] = result
     
     # Generate scorecard
@@ -91,26 +389,143 @@ def evaluate(manifest_path: str) -> dict:
     return scorecard
 
 
+def evaluate_single(manifest_path: str, evaluator_name: str, evaluator_config: dict,
+                    use_cache: bool = True) -> dict:
+    """
+    Run one evaluator in-process on a run, with an explicit (e.g. candidate) pin
+    
+    Nothing is written to the run directory.
+    
+    Args:
+        manifest_path: Path to run manifest
+        evaluator_name: Evaluator identifier
+        evaluator_config: Pin entry to run (module, version, hash)
+        use_cache: Serve and store the result via the evaluation cache
+    
+    Returns:
+        dict: Evaluator result
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    inputs = load_shared_inputs(manifest, Path(manifest_path).parent)
+    cache = default_cache() if use_cache else None
+    return run_evaluator_in_process(evaluator_name, evaluator_config, inputs, cache)
+
+
+def write_scorecard(scorecard: dict, scorecard_path: Path):
+    """Write scorecard atomically via a temporary file in the same directory"""
+    atomic_write_json(scorecard, scorecard_path)
+
+
+def _evaluate_and_write(manifest_path: str, isolation: str, use_cache: bool = True) -> dict:
+    """Evaluate one run and write its scorecard (batch worker)"""
+    started = time.perf_counter()
+    try:
+        scorecard = evaluate(manifest_path, isolation, verbose=False, use_cache=use_cache)
+        write_scorecard(scorecard, Path(manifest_path).parent / 'scorecard.json')
+        error = None
+    except Exception as e:
+        error = str(e)
+    return {
+        'manifest': manifest_path,
+        'ok': error is None,
+        'error': error,
+        'seconds': time.perf_counter() - started
+    }
+
+
+def _percentile(values: list, pct: int) -> float:
+    """Percentile with linear interpolation between closest ranks"""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[pct - 1]
+
+
+def evaluate_runs_dir(runs_dir: str, isolation: str = 'in-process', workers: int = None,
+                      use_cache: bool = True) -> dict:
+    """
+    Evaluate every run under a directory on a process pool
+    
+    Failing runs are recorded and do not stop the batch.
+    
+    Args:
+        runs_dir: Directory searched recursively for manifest.json files
+        isolation: Evaluator isolation mode passed to evaluate()
+        workers: Pool size (default: number of CPU cores)
+        use_cache: Use the evaluation cache
+    
+    Returns:
+        dict: Per-run results and throughput summary (workers: actual pool size)
+    """
+    manifests = sorted(str(p) for p in Path(runs_dir).rglob('manifest.json'))
+    # No more processes than runs
+    workers = min(workers or os.cpu_count() or 1, len(manifests))
+    
+    results = []
+    started = time.perf_counter()
+    if manifests:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_evaluate_and_write, m, isolation, use_cache) for m in manifests]
+            for future in as_completed(futures):
+                result = future.result()
+                status = '✓' if result['ok'] else '✗'
+                print(f"{status} {result['manifest']} ({result['seconds']:.2f}s)")
+                if not result['ok']:
+                    print(f"    {result['error']}")
+                results.append(result)
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(r['seconds'] for r in results)
+    return {
+        'runs': sorted(results, key=lambda r: r['manifest']),
+        'total': len(results),
+        'succeeded': sum(1 for r in results if r['ok']),
+        'failed': sum(1 for r in results if not r['ok']),
+        'workers': workers,
+        'elapsed_seconds': elapsed,
+        'runs_per_second': len(results) / elapsed if elapsed > 0 else 0.0,
+        'latency_p50_seconds': _percentile(latencies, 50) if latencies else None,
+        'latency_p95_seconds': _percentile(latencies, 95) if latencies else None
+    }
+
+
 def main():
     """CLI entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Evaluate run and generate scorecard')
-    parser.add_argument('--manifest', required=True, help='Path to manifest JSON')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--manifest', help='Path to manifest JSON')
+    target.add_argument('--runs-dir', help='Evaluate every run (manifest.json) under this directory')
+    parser.add_argument('--isolation', choices=['in-process', 'subprocess'], default='in-process',
+                        help='Run evaluators in this interpreter or one subprocess each')
+    parser.add_argument('--workers', type=int, help='Batch worker processes (default: CPU cores)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-run every evaluator, bypassing the evaluation cache')
     
     args = parser.parse_args()
     
+    if args.runs_dir:
+        print(f'Evaluating runs under: {args.runs_dir}')
+        summary = evaluate_runs_dir(args.runs_dir, args.isolation, args.workers, not args.no_cache)
+        print(f"\nEvaluated {summary['total']} runs with {summary['workers']} workers: "
+              f"{summary['succeeded']} succeeded, {summary['failed']} failed")
+        if summary['total']:
+            print(f"  Throughput: {summary['runs_per_second']:.2f} runs/sec "
+                  f"({summary['elapsed_seconds']:.2f}s total)")
+            print(f"  Per-run latency: p50={summary['latency_p50_seconds']:.3f}s, "
+                  f"p95={summary['latency_p95_seconds']:.3f}s")
+        return 0 if summary['failed'] == 0 else 1
+    
     print(f'Evaluating run: {args.manifest}')
     
     try:
-        scorecard = evaluate(args.manifest)
+        scorecard = evaluate(args.manifest, args.isolation, use_cache=not args.no_cache)
         
         # Write scorecard
         manifest_dir = Path(args.manifest).parent
         scorecard_path = manifest_dir / 'scorecard.json'
         
-        with open(scorecard_path, 'w') as f:
-            json.dump(scorecard, f, indent=2)
+        write_scorecard(scorecard, scorecard_path)
         
         print(f'✓ Scorecard generated: {scorecard_path}')
         return 0
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Evaluator Impact
+
+Works out which runs a change to an evaluator module can affect, by
+comparing the pinned and candidate sources rather than running them.
+
+Both sources are split into top-level units (functions, classes,
+assignments, imported names) and compared structurally, ignoring
+docstrings, line numbers, and the result fields that only identify the
+evaluator ('evaluator', 'version'). A unit's dependencies are the other
+top-level names it refers to, followed transitively.
+
+Evaluators with a registry of independent checks are analyzed per check:
+task_success criteria (functions registered with @criterion) and
+constraint_adherence predicates (entries of the PREDICATES dict). A change
+reached from the evaluator's entry point outside the registry affects
+every run; otherwise only runs whose task spec uses a changed criterion or
+constraint are affected. For other evaluators any change affects every run.
+
+Helper modules the evaluators import (execution_log, file_hashing) are
+outside the analysis: they are pinned with the harness, not the evaluator.
+"""
+
+import ast
+from typing import Dict, NamedTuple, Optional, Set
+
+
+# Result keys that identify the evaluator rather than describe the run
+IDENTITY_FIELDS = ('evaluator', 'version')
+
+# Per evaluator: entry point, and how its registry of checks is declared
+REGISTRIES = {
+    'task_success': {'entry': 'evaluate_task_success', 'decorator': 'criterion'},
+    'constraint_adherence': {'entry': 'evaluate_constraint_adherence', 'dict': 'PREDICATES'}
+}
+
+# Pseudo-unit for module-level statements that are not named definitions
+MODULE_UNIT = '<module>'
+
+
+class Unit(NamedTuple):
+    """Normalized dump of a top-level statement and the top-level names it uses"""
+    dump: str
+    names: frozenset
+
+
+class Impact(NamedTuple):
+    """
+    Changes between two versions of an evaluator
+    
+    affects_all is True when every run may score differently; otherwise
+    only runs using one of the `affected` registry keys can.
+    """
+    affects_all: bool
+    changed: frozenset
+    affected: frozenset
+    
+    def affects(self, keys) -> bool:
+        return self.affects_all or any(key in self.affected for key in keys)
+
+
+class _Normalize(ast.NodeTransformer):
+    """Drop docstrings and identity-field values so they do not count as changes"""
+    
+    def _strip_docstring(self, node):
+        self.generic_visit(node)
+        body = node.body
+        if (len(body) > 1 and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)):
+            node.body = body[1:]
+        return node
+    
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = _strip_docstring
+    
+    def visit_Dict(self, node):
+        self.generic_visit(node)
+        node.values = [
+            ast.Constant(None) if isinstance(key, ast.Constant) and key.value in IDENTITY_FIELDS else value
+            for key, value in zip(node.keys, node.values)
+        ]
+        return node
+
+
+def _dump(node: ast.AST) -> str:
+    return ast.dump(_Normalize().visit(node))
+
+
+def _names(node: ast.AST) -> Set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == '__name__')
+
+
+def _registry_decorator(decorator: ast.expr, name: str) -> Optional[str]:
+    """Registered key of a @name('key', ...) decorator"""
+    if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name) and decorator.func.id == name
+            and decorator.args and isinstance(decorator.args[0], ast.Constant)):
+        return decorator.args[0].value
+    return None
+
+
+class ModuleSummary(NamedTuple):
+    """Top-level units of a module and its registry entries (key -> Unit)"""
+    units: Dict[str, Unit]
+    registry: Dict[str, Unit]
+
+
+def summarize(source: str, registry: dict = None) -> ModuleSummary:
+    """
+    Split a module into comparable top-level units
+    
+    Args:
+        source: Module source
+        registry: REGISTRIES entry of the evaluator (None: no registry)
+    
+    Returns:
+        ModuleSummary: Units by name and registry entries by key
+    """
+    registry = registry or {}
+    units, entries = {}, {}
+    module_dumps = []
+    body = ast.parse(source).body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    
+    for node in body:
+        if _is_main_guard(node):
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            units[node.name] = Unit(_dump(node), frozenset(_names(node) - {node.name}))
+            for decorator in getattr(node, 'decorator_list', []):
+                key = _registry_decorator(decorator, registry.get('decorator'))
+                if key is not None:
+                    entries[key] = Unit(_dump(decorator), frozenset(_names(decorator) | {node.name}))
+        elif (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+              and any(isinstance(t, ast.Name) and t.id == registry.get('dict') for t in node.targets)):
+            for key, value in zip(node.value.keys, node.value.values):
+                if isinstance(key, ast.Constant):
+                    entries[key.value] = Unit(_dump(value), frozenset(_names(value)))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            unit = Unit(_dump(node), frozenset(_names(node.value) if node.value else ()))
+            for target in targets:
+                for name in _names(target):
+                    units[name] = unit
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                units[(alias.asname or alias.name).split('.')[0]] = Unit(_dump(node), frozenset())
+        else:
+            module_dumps.append(_dump(node))
+    
+    units[MODULE_UNIT] = Unit('\n'.join(module_dumps), frozenset())
+    return ModuleSummary(units, entries)
+
+
+def _closure(units: Dict[str, Unit], roots) -> Set[str]:
+    """Top-level names reachable from roots"""
+    seen = set()
+    pending = [name for name in roots if name in units]
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(n for n in units[name].names if n in units and n not in seen)
+    return seen
+
+
+def analyze(evaluator_name: str, baseline_source: str, candidate_source: str) -> Impact:
+    """
+    Compare two versions of an evaluator module
+    
+    Args:
+        evaluator_name: Evaluator identifier (selects the registry to analyze)
+        baseline_source: Source of the pinned module
+        candidate_source: Source of the candidate module
+    
+    Returns:
+        Impact: Changed units, and whether all runs or only some registry keys are affected
+    """
+    registry = REGISTRIES.get(evaluator_name)
+    old = summarize(baseline_source, registry)
+    new = summarize(candidate_source, registry)
+    changed = frozenset(
+        name for name in set(old.units) | set(new.units)
+        if old.units.get(name) != new.units.get(name)
+    )
+    if registry is None:
+        return Impact(bool(changed), changed, frozenset())
+    
+    # Anything the entry point reaches outside the registry is shared by every run
+    core = {MODULE_UNIT}
+    for summary in (old, new):
+        core |= _closure(summary.units, (registry['entry'],))
+    if changed & core:
+        return Impact(True, changed, frozenset())
+    
+    affected = set()
+    for key in set(old.registry) | set(new.registry):
+        before, after = old.registry.get(key), new.registry.get(key)
+        if before != after:
+            affected.add(key)
+            continue
+        reached = _closure(old.units, before.names) | _closure(new.units, after.names)
+        if changed & reached:
+            affected.add(key)
+    return Impact(False, changed, frozenset(affected))
+
+
+def registry_keys(evaluator_name: str, task_spec: dict) -> list:
+    """Registry keys a run's task spec uses (criteria or constraint ids)"""
+    if evaluator_name == 'task_success':
+        return list(task_spec.get('success_criteria', []))
+    if evaluator_name == 'constraint_adherence':
+        constraints = [c if isinstance(c, dict) else {'id': c} for c in task_spec.get('constraints', [])]
+        return [c.get('id', c.get('type')) for c in constraints]
+    return []
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Hash Outputs
+
+Hashes a run's outputs/ tree and records the file index in its manifest.
+
+Files are hashed concurrently on a thread pool (hashlib releases the GIL
+while digesting large chunks) through the shared persistent hash cache.
+The resulting outputs.files index is sorted by path, so manifests of
+identical output trees are identical.
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'evaluators'))
+
+from atomic_io import atomic_write_json  # noqa: E402
+from file_hashing import cached_file_hash  # noqa: E402
+
+
+def list_output_files(outputs_dir: Path) -> list:
+    """List regular files under outputs_dir (symlinks are not followed)"""
+    files = []
+    for root, dirs, names in os.walk(outputs_dir):
+        dirs.sort()
+        for name in names:
+            path = Path(root) / name
+            if path.is_file() and not path.is_symlink():
+                files.append(path)
+    return files
+
+
+def hash_outputs(outputs_dir: str, workers: int = None) -> list:
+    """
+    Hash every file under an outputs directory concurrently
+    
+    Args:
+        outputs_dir: Run outputs directory
+        workers: Thread pool size (default: ThreadPoolExecutor default)
+    
+    Returns:
+        list: [{'path', 'hash', 'size_bytes'}] sorted by relative path
+    """
+    outputs_dir = Path(outputs_dir)
+    files = list_output_files(outputs_dir)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = list(pool.map(cached_file_hash, files))
+    
+    index = [
+        {
+            'path': path.relative_to(outputs_dir).as_posix(),
+            'hash': f'sha256:{digest}',
+            'size_bytes': path.stat().st_size
+        }
+        for path, digest in zip(files, digests)
+    ]
+    return sorted(index, key=lambda entry: entry['path'])
+
+
+def update_manifest_outputs(manifest_path: str, outputs_dir: str = None, workers: int = None) -> dict:
+    """
+    Write the sorted output file index into a run manifest
+    
+    Args:
+        manifest_path: Path to manifest JSON
+        outputs_dir: Outputs directory (default: manifest outputs.path, else <run>/outputs)
+        workers: Thread pool size
+    
+    Returns:
+        dict: Result with updated status, file count, and errors
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    
+    if manifest.get('immutability', {}).get('locked'):
+        return {
+            'updated': False,
+            'errors': ['Run is locked; outputs index cannot be changed'],
+            'files': 0
+        }
+    
+    outputs = manifest.setdefault('outputs', {})
+    if outputs_dir is None:
+        outputs_dir = outputs.get('path')
+        if not outputs_dir or not Path(outputs_dir).is_dir():
+            outputs_dir = str(Path(manifest_path).parent / 'outputs')
+    
+    if not Path(outputs_dir).is_dir():
+        return {
+            'updated': False,
+            'errors': [f'Outputs directory not found: {outputs_dir}'],
+            'files': 0
+        }
+    
+    outputs['files'] = hash_outputs(outputs_dir, workers)
+    outputs.setdefault('path', outputs_dir)
+    
+    # Atomic replace so a crash never leaves a truncated manifest
+    atomic_write_json(manifest, manifest_path)
+    
+    return {
+        'updated': True,
+        'errors': [],
+        'files': len(outputs['files']),
+        'total_bytes': sum(entry['size_bytes'] for entry in outputs['files'])
+    }
+
+
+def main():
+    """CLI entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Hash run outputs into the manifest')
+    parser.add_argument('--manifest', required=True, help='Path to manifest JSON')
+    parser.add_argument('--outputs-dir', help='Outputs directory (default: from manifest)')
+    parser.add_argument('--workers', type=int, help='Hashing threads')
+    
+    args = parser.parse_args()
+    
+    result = update_manifest_outputs(args.manifest, args.outputs_dir, args.workers)
+    
+    if result['updated']:
+        print(f"✓ Hashed {result['files']} output files ({result['total_bytes']} bytes)")
+        print(f'  Manifest: {args.manifest}')
+        return 0
+    else:
+        print('✗ Output hashing failed')
+        for error in result['errors']:
+            print(f'  ✗ {error}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Rescore Runs
+
+Applies a candidate version of one evaluator to every locked run and
+reports how the pinned scorecards would change, without touching the runs.
+
+Only the changed evaluator is re-run, and only on runs the change can
+affect. The pinned and candidate modules are compared (evaluator_impact.py):
+for task_success and constraint_adherence a change confined to some
+criteria or constraint predicates only affects runs whose task spec uses
+them; any other change affects every run. Runs missing an input the
+evaluator needs, and runs already scored with the candidate module, are
+skipped too. When a pinned module's source is no longer on disk under its
+pin, the change cannot be analyzed and its runs are all rescored.
+
+Affected runs are scored in parallel, one evaluation per run. Candidate
+results go through the evaluation cache, so repeated rescoring of the same
+candidate is nearly free.
+"""
+
+import json
+import math
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from evaluate import compute_module_hash, evaluate_single, task_spec_path
+from evaluator_impact import analyze, registry_keys
+
+
+# Inputs that must exist for an evaluator's result to be meaningful
+REQUIRED_INPUTS = {
+    'task_success': ('task_spec',),
+    'constraint_adherence': ('task_spec', 'agent_log'),
+    'runtime': ('agent_log',),
+    'clarification_counter': ('agent_log',),
+    'reproducibility': ()
+}
+
+# Result keys that identify the evaluator rather than describe the run
+IGNORED_FIELDS = ('evaluator', 'version')
+
+
+@lru_cache(maxsize=None)
+def _load_task_spec(path: str) -> str:
+    """Memoized task spec (as JSON text, so callers get a fresh copy)"""
+    try:
+        with open(path) as f:
+            return json.dumps(json.load(f))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def candidate_config(module: str, version: str = None) -> dict:
+    """Pin entry for a candidate evaluator module"""
+    return {
+        'module': module,
+        'version': version or 'candidate',
+        'hash': compute_module_hash(Path(module).read_bytes())
+    }
+
+
+@lru_cache(maxsize=None)
+def _impact(evaluator_name: str, pinned_module: str, pinned_hash: str, candidate_module: str):
+    """Impact of replacing a pinned module with the candidate (None if the pinned source is gone)"""
+    try:
+        baseline = Path(pinned_module).read_bytes()
+    except (OSError, TypeError):
+        return None
+    if compute_module_hash(baseline).split(':')[-1] != str(pinned_hash).split(':')[-1]:
+        return None
+    return analyze(evaluator_name, baseline.decode(), Path(candidate_module).read_text())
+
+
+def plan_run(manifest_path: Path, evaluator_name: str, candidate: dict, include_unlocked: bool = False) -> dict:
+    """
+    Decide whether a run needs rescoring
+    
+    Returns:
+        dict: run_id, manifest, pinned config, and 'skip' (reason) if it does not
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    run = {
+        'run_id': manifest.get('run_id'),
+        'manifest': str(manifest_path),
+        'pinned': manifest.get('pins', {}).get('evaluator_versions', {}).get(evaluator_name)
+    }
+    
+    if not include_unlocked and not manifest.get('immutability', {}).get('locked'):
+        return dict(run, skip='not_locked')
+    if run['pinned'] is None:
+        return dict(run, skip='evaluator_not_pinned')
+    if run['pinned'].get('hash') == candidate['hash']:
+        return dict(run, skip='already_candidate')
+    
+    run_dir = manifest_path.parent
+    task_spec_file = task_spec_path(manifest, run_dir)
+    task_spec_json = _load_task_spec(str(task_spec_file)) if task_spec_file else None
+    available = {
+        'task_spec': task_spec_json is not None,
+        'agent_log': (run_dir / 'agent.log').is_file()
+    }
+    missing = [name for name in REQUIRED_INPUTS.get(evaluator_name, ()) if not available[name]]
+    if missing:
+        return dict(run, skip=f"missing_{'_'.join(missing)}")
+    
+    impact = _impact(evaluator_name, run['pinned'].get('module'), run['pinned'].get('hash'), candidate['module'])
+    task_spec = json.loads(task_spec_json) if task_spec_json else {}
+    if impact is not None and not impact.affects(registry_keys(evaluator_name, task_spec)):
+        return dict(run, skip='unaffected')
+    return run
+
+
+def flatten(result, prefix: str = '') -> dict:
+    """Flatten a nested result dict to dotted field names"""
+    if not isinstance(result, dict):
+        return {prefix: result}
+    fields = {}
+    for key, value in result.items():
+        if not prefix and key in IGNORED_FIELDS:
+            continue
+        name = f'{prefix}.{key}' if prefix else key
+        if isinstance(value, dict) and value:
+            fields.update(flatten(value, name))
+        else:
+            fields[name] = value
+    return fields
+
+
+def _same(old, new) -> bool:
+    if isinstance(old, float) and isinstance(new, float) and math.isnan(old) and math.isnan(new):
+        return True
+    return old == new
+
+
+def diff_results(baseline: dict, candidate: dict) -> dict:
+    """Changed fields between two results: {field: (old, new)}"""
+    old, new = flatten(baseline or {}), flatten(candidate or {})
+    return {
+        field: (old.get(field), new.get(field))
+        for field in sorted(set(old) | set(new))
+        if not _same(old.get(field), new.get(field))
+    }
+
+
+def _pinned_result(manifest_path: str, evaluator_name: str) -> dict:
+    """The evaluator's result in the run's scorecard (None if not scored)"""
+    scorecard_path = Path(manifest_path).parent / 'scorecard.json'
+    if not scorecard_path.exists():
+        return None
+    with open(scorecard_path) as f:
+        return json.load(f).get('metrics', {}).get(evaluator_name)
+
+
+def _rescore_run(manifest_path: str, evaluator_name: str, config: dict, use_cache: bool) -> dict:
+    """Process pool worker: score one run with the candidate"""
+    return evaluate_single(manifest_path, evaluator_name, config, use_cache)
+
+
+def rescore(runs_dir: str, evaluator_name: str, module: str, version: str = None,
+            include_unlocked: bool = False, workers: int = None, use_cache: bool = True) -> dict:
+    """
+    Score runs with a candidate evaluator and diff against their scorecards
+    
+    Args:
+        runs_dir: Directory searched recursively for manifest.json files
+        evaluator_name: Evaluator to replace (key in pins.evaluator_versions)
+        module: Candidate evaluator module path
+        version: Candidate version label
+        include_unlocked: Also rescore runs that are not locked
+        workers: Process pool size (default: number of CPU cores)
+        use_cache: Use the evaluation cache for candidate results
+    
+    Returns:
+        dict: Change report with per-field summaries and per-run changes
+    """
+    if evaluator_name not in REQUIRED_INPUTS:
+        raise ValueError(f'Unknown evaluator: {evaluator_name}')
+    candidate = candidate_config(module, version)
+    
+    manifests = sorted(Path(runs_dir).rglob('manifest.json'))
+    runs = [plan_run(path, evaluator_name, candidate, include_unlocked) for path in manifests]
+    skipped = Counter(run['skip'] for run in runs if 'skip' in run)
+    to_score = [run for run in runs if 'skip' not in run]
+    
+    # What changed relative to each pinned module version that was analyzed
+    impacts = {}
+    for run in runs:
+        pinned = run['pinned'] or {}
+        if run.get('skip') not in (None, 'unaffected') or pinned.get('hash') in impacts:
+            continue
+        impact = _impact(evaluator_name, pinned.get('module'), pinned.get('hash'), candidate['module'])
+        impacts[pinned.get('hash')] = None if impact is None else {
+            'affects_all': impact.affects_all,
+            'changed': sorted(impact.changed),
+            'affected': sorted(impact.affected)
+        }
+    
+    # Pinned config (patterns, ...) carries over to the candidate
+    results = {}
+    if to_score:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(to_score))) as pool:
+            futures = {
+                run['manifest']: pool.submit(
+                    _rescore_run, run['manifest'], evaluator_name,
+                    dict(run['pinned'], **candidate), use_cache
+                )
+                for run in to_score
+            }
+            results = {manifest: future.result() for manifest, future in futures.items()}
+    
+    fields = {}
+    changes = []
+    for run in to_score:
+        new = results[run['manifest']]
+        old = _pinned_result(run['manifest'], evaluator_name)
+        entry = {'run_id': run['run_id'], 'manifest': run['manifest']}
+        if 'error' in new:
+            entry.update(status='candidate_error', error=new['error'])
+        elif old is None:
+            entry.update(status='no_baseline')
+        else:
+            changed = diff_results(old, new)
+            entry.update(status='changed' if changed else 'unchanged', changes={
+                field: {'old': before, 'new': after} for field, (before, after) in changed.items()
+            })
+            for field in set(flatten(old)) | set(flatten(new)):
+                summary = fields.setdefault(field, {'changed': 0, 'unchanged': 0, 'transitions': Counter()})
+                if field in changed:
+                    summary['changed'] += 1
+                    before, after = changed[field]
+                    summary['transitions'][f'{json.dumps(before)} -> {json.dumps(after)}'] += 1
+                else:
+                    summary['unchanged'] += 1
+        changes.append(entry)
+    
+    statuses = Counter(entry['status'] for entry in changes)
+    return {
+        'evaluator': evaluator_name,
+        'candidate': candidate,
+        'runs_total': len(runs),
+        'rescored': len(to_score),
+        'impact': impacts,
+        'skipped': dict(skipped),
+        'status': dict(statuses),
+        'fields': {
+            field: dict(summary, transitions=dict(summary['transitions'].most_common()))
+            for field, summary in sorted(fields.items())
+        },
+        'runs': changes
+    }
+
+
+def main():
+    """CLI entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Rescore locked runs with a candidate evaluator version',
+        epilog='Runs the change cannot affect are skipped: for task_success and constraint_adherence, '
+               'runs whose task spec uses none of the changed criteria or constraint predicates. '
+               'Every other change to an evaluator affects all of its runs.'
+    )
+    parser.add_argument('--runs-dir', required=True, help='Directory containing run subdirectories')
+    parser.add_argument('--evaluator', required=True, help='Evaluator to replace (e.g. task_success)')
+    parser.add_argument('--module', required=True, help='Candidate evaluator module')
+    parser.add_argument('--version', help='Candidate version label')
+    parser.add_argument('--include-unlocked', action='store_true', help='Also rescore runs that are not locked')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU cores)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the evaluation cache')
+    parser.add_argument('--output', help='Write the change report JSON here')
+    
+    args = parser.parse_args()
+    
+    try:
+        report = rescore(args.runs_dir, args.evaluator, args.module, args.version,
+                         args.include_unlocked, args.workers, not args.no_cache)
+    except (ValueError, FileNotFoundError) as e:
+        print(f'✗ {e}')
+        return 1
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    print(f"Rescored {report['rescored']}/{report['runs_total']} runs with {args.evaluator} "
+          f"{report['candidate']['version']}")
+    for pinned_hash, impact in report['impact'].items():
+        if impact is None:
+            scope = 'not analyzed (pinned source no longer on disk), all runs rescored'
+        elif impact['affects_all']:
+            scope = f"all runs (changed: {', '.join(impact['changed'])})"
+        else:
+            scope = f"runs using {', '.join(impact['affected']) or 'nothing'}"
+        print(f'  Impact vs {str(pinned_hash)[:19]}: {scope}')
+    for reason, count in sorted(report['skipped'].items()):
+        print(f'  Skipped {count}: {reason}')
+    for status, count in sorted(report['status'].items()):
+        print(f'  {status}: {count}')
+    
+    errors = [entry for entry in report['runs'] if entry['status'] == 'candidate_error']
+    if errors:
+        print(f"\n✗ Candidate failed on {len(errors)} runs, e.g. {errors[0]['run_id']}: {errors[0]['error']}")
+    
+    changed_fields = {field: s for field, s in report['fields'].items() if s['changed']}
+    if changed_fields:
+        print('\nChanged fields:')
+        for field, summary in changed_fields.items():
+            print(f"  ⚠ {field}: {summary['changed']} changed, {summary['unchanged']} unchanged")
+            for transition, count in list(summary['transitions'].items())[:5]:
+                print(f'      {transition}: {count}')
+    elif not errors:
+        print('\n✓ No scorecard changes')
+    
+    if args.output:
+        print(f'\nReport: {args.output}')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
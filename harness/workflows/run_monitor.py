@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Run Monitor
+
+Online evaluation of a run while it executes. The JSONL execution log is
+tailed as the agent writes it, and each new record is fed to the run's
+compiled constraints (constraint_adherence.compile_constraints) while
+elapsed time is tracked against the task timeout. A critical violation,
+or running past the timeout, terminates the executor early and the
+reason is recorded in the manifest (execution.exit_reason and
+execution.termination).
+
+Only constraints whose violations are final as soon as they are observed
+(out-of-scope access, forbidden tools, network use, writes to protected
+paths) are critical. Constraints that can only be decided at the end of
+the log, such as required actions or logging, are left to the post-run
+evaluator. Whole-document JSON logs cannot be read incrementally; for
+those only the timeout is enforced.
+
+Task specs name their constraints but not the run's tool permissions;
+those come from the tool permission set the run is pinned to
+(pins.tool_permission_set in the manifest): allowed_paths are enforced as
+scoped_operations, network_access: false as no_external_network_access,
+and permitted_tools, if pinned, as tool_permissions. A critical constraint
+whose parameters have no source (say, tool_permissions without
+permitted_tools) is an error, rather than a check that flags everything
+or nothing.
+
+The tail reads the log from its start, so a log left over from an earlier
+attempt must not be there when the executor starts: main() rotates it
+aside (rotate_stale_log), and schedule-pairs.py clears the run directory
+before each attempt.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'evaluators'))
+
+from atomic_io import atomic_write_json  # noqa: E402
+from constraint_adherence import compile_constraints  # noqa: E402
+from execution_log import RECORD_KINDS  # noqa: E402
+
+
+# Constraints whose first violation is conclusive, so the run can be stopped
+CRITICAL_CONSTRAINTS = frozenset({
+    'scoped_operations',
+    'tool_permissions',
+    'no_external_network_access',
+    'write_only_to_specified_path',
+    'write_only_to_output_path',
+    'modify_only_editable_file',
+    'do_not_change_readonly_file',
+    'respect_file_permissions',
+    'read_only_from_config_dir',
+    'search_only_in_data_dir'
+})
+
+POLL_INTERVAL_SECONDS = 0.5
+
+# Allowance over the task timeout for executor start-up and teardown
+TIMEOUT_GRACE_SECONDS = 10
+
+# Time between SIGTERM and SIGKILL when stopping an executor
+TERMINATE_GRACE_SECONDS = 5
+
+# Parameter each critical constraint cannot be checked without
+REQUIRED_PARAMETERS = {
+    'scoped_operations': 'authorized_paths',
+    'tool_permissions': 'permitted_tools'
+}
+
+
+class LogTail:
+    """
+    Incremental reader of a JSONL log that is still being written
+    
+    Each poll returns the records completed since the previous poll; a
+    trailing partial line is held back until its newline arrives. A log
+    that shrinks or is replaced by a new file is read again from its start.
+    A log whose first record is not a kind-tagged JSONL record is not
+    streamable.
+    """
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.streamable = True
+        self.invalid_lines = 0
+        self._offset = 0
+        self._inode = None
+        self._partial = b''
+        self._first = True
+    
+    def poll(self) -> list:
+        """New complete records since the last poll"""
+        if not self.streamable:
+            return []
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if stat.st_size < self._offset or stat.st_ino != self._inode:
+                    # New, truncated or replaced: start over
+                    self._offset, self._partial = 0, b''
+                    self._inode = stat.st_ino
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        self._offset += len(data)
+        
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if self._first:
+                    self.streamable = False
+                    return []
+                self.invalid_lines += 1
+                continue
+            if self._first and not (isinstance(record, dict) and 'kind' in record):
+                self.streamable = False
+                return []
+            self._first = False
+            records.append(record)
+        return records
+
+
+def load_tool_permission_set(path) -> dict:
+    """Tool permission set from a JSON file: a run manifest (pins.tool_permission_set) or the bare set"""
+    with open(path) as f:
+        document = json.load(f)
+    if 'pins' in document:
+        return document['pins'].get('tool_permission_set') or {}
+    return document
+
+
+def permission_constraints(tool_permission_set: dict) -> list:
+    """
+    Constraints enforcing a pinned tool permission set
+    
+    forbidden_paths need no constraint of their own: anything outside
+    allowed_paths is already out of scope.
+    
+    Returns:
+        list: Constraint dicts (scoped_operations, no_external_network_access, tool_permissions)
+    """
+    constraints = []
+    if tool_permission_set.get('allowed_paths'):
+        constraints.append({'id': 'scoped_operations', 'authorized_paths': list(tool_permission_set['allowed_paths'])})
+    if tool_permission_set.get('network_access') is False:
+        constraints.append({'id': 'no_external_network_access'})
+    if tool_permission_set.get('permitted_tools') is not None:
+        constraints.append({'id': 'tool_permissions', 'permitted_tools': list(tool_permission_set['permitted_tools'])})
+    return constraints
+
+
+def monitored_constraints(task_spec: dict, tool_permission_set: dict = None) -> list:
+    """
+    Task spec constraints plus those of the pinned tool permission set
+    
+    A constraint the spec lists by id takes its parameters from the pin
+    unless the spec gives them itself.
+    """
+    pinned = {c['id']: c for c in permission_constraints(tool_permission_set or {})}
+    constraints = []
+    for constraint in task_spec.get('constraints', []):
+        constraint = constraint if isinstance(constraint, dict) else {'id': constraint}
+        constraints.append(dict(pinned.pop(constraint.get('id', constraint.get('type')), {}), **constraint))
+    return constraints + list(pinned.values())
+
+
+def _has_source(constraint_id: str, constraint: dict, predicate) -> bool:
+    """True if a constraint can be checked with parameters it was actually given"""
+    required = REQUIRED_PARAMETERS.get(constraint_id)
+    return predicate is not None and predicate.checked and (required is None or required in constraint)
+
+
+class RunMonitor:
+    """Constraint predicates and a timeout checked against a growing log"""
+    
+    def __init__(self, log_path, task_spec: dict = None, timeout_seconds: float = None,
+                 critical=CRITICAL_CONSTRAINTS, timeout_grace: float = TIMEOUT_GRACE_SECONDS,
+                 tool_permission_set: dict = None):
+        task_spec = task_spec or {}
+        self.engine = compile_constraints(monitored_constraints(task_spec, tool_permission_set), task_spec)
+        unsourced = [
+            constraint_id for constraint_id, constraint, predicate in self.engine.predicates
+            if constraint_id in critical and not _has_source(constraint_id, constraint, predicate)
+        ]
+        if unsourced:
+            raise ValueError(f"No source for critical constraints: {', '.join(unsourced)} "
+                             '(missing from the task spec and the tool permission set)')
+        self.critical = [
+            (constraint_id, predicate)
+            for constraint_id, _, predicate in self.engine.predicates
+            if constraint_id in critical and predicate is not None and predicate.checked
+        ]
+        self.timeout_grace = timeout_grace
+        self._set_timeout(timeout_seconds or task_spec.get('timeout_seconds'))
+        self.tail = LogTail(log_path)
+        self.records = 0
+        self.started = time.monotonic()
+    
+    def _set_timeout(self, timeout: float):
+        self.timeout_seconds = timeout
+        self.deadline = timeout + self.timeout_grace if timeout else None
+    
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+    
+    def poll(self) -> dict:
+        """
+        Feed new log records and check for a reason to stop
+        
+        Returns:
+            dict: Termination (reason, constraint, violations, elapsed), or None
+        """
+        for record in self.tail.poll():
+            kind = record.get('kind')
+            if kind == 'meta' and self.timeout_seconds is None and record.get('timeout_seconds'):
+                self._set_timeout(record['timeout_seconds'])
+            convert = RECORD_KINDS.get(kind)
+            if convert is not None:
+                self.engine.feed(kind, convert(record))
+                self.records += 1
+        
+        for constraint_id, predicate in self.critical:
+            if predicate.violations:
+                return self._termination(
+                    'constraint_violation',
+                    constraint_id=constraint_id,
+                    violations=list(predicate.violations)
+                )
+        
+        if self.deadline is not None and self.elapsed() > self.deadline:
+            return self._termination('timeout', timeout_seconds=self.timeout_seconds)
+        return None
+    
+    def _termination(self, reason: str, **details) -> dict:
+        return dict(
+            reason=reason,
+            elapsed_seconds=round(self.elapsed(), 3),
+            records_seen=self.records,
+            log_streamable=self.tail.streamable,
+            terminated_at=datetime.now().isoformat(),
+            **details
+        )
+
+
+def rotate_stale_log(log_path) -> Path:
+    """
+    Move a log left by an earlier attempt aside, so the tail starts on the new one
+    
+    Returns:
+        Path: Where the old log was moved (None if there was none)
+    """
+    log_path = Path(log_path)
+    if not log_path.exists():
+        return None
+    rotated = log_path.with_name(f'{log_path.name}.{datetime.now():%Y%m%dT%H%M%S%f}')
+    os.replace(log_path, rotated)
+    return rotated
+
+
+def terminate(process: subprocess.Popen, grace: float = TERMINATE_GRACE_SECONDS):
+    """Stop an executor and its children: SIGTERM to its process group, then SIGKILL"""
+    def signal_group(sig):
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            process.send_signal(sig)
+    
+    signal_group(signal.SIGTERM)
+    try:
+        process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        signal_group(signal.SIGKILL)
+        process.wait()
+
+
+def supervise(process: subprocess.Popen, monitor: RunMonitor,
+              poll_interval: float = POLL_INTERVAL_SECONDS, run_timeout: float = None) -> dict:
+    """
+    Poll the monitor until the executor exits, terminating it if asked to
+    
+    The process should be started with start_new_session=True so that
+    termination reaches the agent's child processes too.
+    
+    Args:
+        process: Executor process
+        monitor: Monitor of the run's execution log
+        poll_interval: Seconds between log polls
+        run_timeout: Hard wall-clock limit; raises subprocess.TimeoutExpired
+            after stopping the executor, like subprocess.run
+    
+    Returns:
+        dict: Termination, or None if the executor exited on its own
+    """
+    while True:
+        termination = monitor.poll()
+        if termination is not None:
+            terminate(process)
+            return termination
+        if run_timeout is not None and monitor.elapsed() > run_timeout:
+            terminate(process)
+            raise subprocess.TimeoutExpired(process.args, run_timeout)
+        try:
+            process.wait(timeout=poll_interval)
+            return None
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def record_termination(run_dir, termination: dict) -> Path:
+    """
+    Record an early termination in the run's manifest
+    
+    Sets execution.exit_reason and execution.termination. If the executor
+    never wrote a manifest, the termination is written to termination.json.
+    
+    Returns:
+        Path: File the termination was written to
+    """
+    run_dir = Path(run_dir)
+    manifest_path = run_dir / 'manifest.json'
+    document, target = termination, run_dir / 'termination.json'
+    if manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                document = json.load(f)
+            execution = document.setdefault('execution', {})
+            execution['exit_reason'] = termination['reason']
+            execution['termination'] = termination
+            target = manifest_path
+        except json.JSONDecodeError:
+            document = termination
+    
+    atomic_write_json(document, target)
+    return target
+
+
+def main():
+    """CLI entry point: run an executor command under the monitor"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Run an executor, stopping it on critical violations or timeout')
+    parser.add_argument('--run-dir', required=True, help='Run directory (agent.log, manifest.json)')
+    parser.add_argument('--task-spec', help='Task spec JSON (constraints, paths, timeout_seconds)')
+    parser.add_argument('--tool-permissions', required=True,
+                        help='Pinned tool permission set: the run manifest (pins.tool_permission_set) or a JSON file holding the set')
+    parser.add_argument('--timeout', type=float, help=f'Task timeout in seconds, plus {TIMEOUT_GRACE_SECONDS}s grace (default: task spec timeout_seconds)')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL_SECONDS, help='Poll interval (seconds)')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='Executor command (after --)')
+    
+    args = parser.parse_args()
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error('an executor command is required')
+    
+    task_spec = {}
+    if args.task_spec:
+        with open(args.task_spec) as f:
+            task_spec = json.load(f)
+    
+    log_path = Path(args.run_dir) / 'agent.log'
+    try:
+        monitor = RunMonitor(log_path, task_spec, args.timeout,
+                             tool_permission_set=load_tool_permission_set(args.tool_permissions))
+    except ValueError as e:
+        print(f'✗ {e}')
+        return 2
+    rotated = rotate_stale_log(log_path)
+    if rotated:
+        print(f'⚠ Moved stale log from an earlier attempt to {rotated}')
+    process = subprocess.Popen(command, start_new_session=True)
+    termination = supervise(process, monitor, args.interval)
+    
+    if termination is None:
+        return process.returncode
+    
+    written = record_termination(args.run_dir, termination)
+    detail = termination.get('constraint_id') or f"limit {termination['timeout_seconds']}s"
+    print(f"✗ Terminated after {termination['elapsed_seconds']:.1f}s: {termination['reason']} ({detail})")
+    print(f'  Recorded in: {written}')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
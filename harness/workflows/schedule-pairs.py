@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+Schedule Pairs
+
+Executes a campaign of paired runs concurrently.
+
+Pairs run in parallel up to a configurable limit; within a pair the two
+variants run one after another in a seeded random order that is
+recorded in the schedule file. Each run gets its own scratch root so
+parallel runs never share /tmp/exp-test: the task's setup is materialized
+into it and the run receives a task spec rewritten to match. Finished runs are evaluated on
+a process pool while other runs are still executing, and each pair is
+verified with verify-pairing.py once both of its runs have executed.
+
+Progress is journaled (campaign_journal.py) as each run moves through
+scheduled -> running -> executed -> evaluated -> locked. With --resume,
+the plan is read back from the journal; completed work is skipped and
+only unfinished or failed stages are run again.
+
+Each executor is supervised by run_monitor.py: its agent.log is evaluated
+while it is written, and a run that hits a critical constraint violation
+or overruns the task timeout is stopped early, freeing its slot. The
+reason is recorded in the run's manifest (execution.termination). Besides
+the task's own constraints, the monitor enforces the experiment's tool
+permission set (--tool-permissions), which the executor pins in each
+manifest as pins.tool_permission_set.
+"""
+
+import importlib.util
+import json
+import os
+import random
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from atomic_io import atomic_write_json
+from campaign_journal import EVALUATED_STATES, EXECUTED_STATES, CampaignJournal
+from evaluate import TASK_SPEC_FILE, _evaluate_and_write
+from run_monitor import POLL_INTERVAL_SECONDS, RunMonitor, load_tool_permission_set, record_termination, supervise
+from scratch import materialize, rewrite_paths
+
+
+WORKFLOWS_DIR = Path(__file__).resolve().parent
+
+VARIANTS = ['role-centric', 'goal-centric']
+
+DEFAULT_SCRATCH_BASE = Path(tempfile.gettempdir()) / 'exp-runs'
+
+JOURNAL_FILE = 'campaign-journal.sqlite3'
+
+# Tool permission set in the experiment directory, pinned by every run
+TOOL_PERMISSIONS_FILE = 'tool-permission-set.json'
+
+# Placeholders available in the executor command template
+COMMAND_FIELDS = ('experiment', 'task_id', 'variant', 'pair_id', 'seed', 'run_id', 'run_dir', 'scratch_root', 'task_spec')
+
+
+def _load_workflow(filename: str, module_name: str):
+    """Import a hyphenated workflow script as a module"""
+    spec = importlib.util.spec_from_file_location(module_name, WORKFLOWS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+verify_pairing = _load_workflow('verify-pairing.py', 'verify_pairing').verify_pairing
+
+
+def plan_pairs(experiment_dir: Path, tasks: list, pairs_per_task: int, seed: int) -> list:
+    """
+    Plan every pair with its seeded variant order
+    
+    The order of each pair is drawn from a generator seeded with the
+    campaign seed and pair_id, so a pair's order does not depend on
+    which other pairs are in the campaign.
+    
+    Args:
+        experiment_dir: Experiment directory (tasks/<task_id>/spec.json)
+        tasks: Task identifiers
+        pairs_per_task: Pairs to run per task
+        seed: Campaign seed for variant-order randomization
+    
+    Returns:
+        list: Pair plans {pair_id, task_id, seed, order}
+    """
+    pairs = []
+    for task_num, task_id in enumerate(tasks, start=1):
+        spec_path = experiment_dir / 'tasks' / task_id / 'spec.json'
+        with open(spec_path) as f:
+            spec = json.load(f)
+        task_seed = spec.get('inputs', {}).get('seed')
+        
+        for pair_num in range(1, pairs_per_task + 1):
+            pair_id = f'pair-{task_num * 100 + pair_num:04d}'
+            order = list(VARIANTS)
+            random.Random(f'{seed}:{pair_id}').shuffle(order)
+            pairs.append({
+                'pair_id': pair_id,
+                'task_id': task_id,
+                'seed': task_seed,
+                'order': order
+            })
+    return pairs
+
+
+def run_id_for(pair: dict, variant: str) -> str:
+    """Deterministic run identifier for one half of a pair"""
+    return f"run-{pair['pair_id']}-{variant}-{pair['task_id']}"
+
+
+def build_command(template: str, fields: dict) -> list:
+    """Split the executor template and substitute placeholders per argument"""
+    return [arg.format(**fields) for arg in shlex.split(template)]
+
+
+class PairScheduler:
+    """Runs planned pairs concurrently with pipelined evaluation"""
+    
+    def __init__(self, experiment: str, runs_dir: Path, command: str, parallelism: int = 2,
+                 eval_workers: int = None, scratch_base: Path = DEFAULT_SCRATCH_BASE,
+                 run_timeout: float = None, isolation: str = 'in-process', verbose: bool = True,
+                 experiment_dir: Path = None, hardlink_readonly: bool = False,
+                 journal: CampaignJournal = None, lock_runs: bool = False,
+                 monitor: bool = True, monitor_interval: float = POLL_INTERVAL_SECONDS,
+                 tool_permission_set: dict = None):
+        self.experiment = experiment
+        self.journal = journal
+        self.lock_runs = lock_runs
+        self.experiment_dir = Path(experiment_dir) if experiment_dir else None
+        self.hardlink_readonly = hardlink_readonly
+        self.runs_dir = Path(runs_dir)
+        self.command = command
+        self.parallelism = parallelism
+        self.eval_workers = eval_workers
+        self.scratch_base = Path(scratch_base)
+        self.run_timeout = run_timeout
+        self.monitor = monitor
+        self.monitor_interval = monitor_interval
+        self.tool_permission_set = tool_permission_set
+        self.isolation = isolation
+        self.verbose = verbose
+        self._print_lock = threading.Lock()
+        self._eval_pool = None
+        self._finish_pool = None
+        self._specs = {}
+    
+    def _log(self, message: str):
+        if self.verbose:
+            with self._print_lock:
+                print(message, flush=True)
+    
+    def _task_spec(self, task_id: str) -> dict:
+        if task_id not in self._specs:
+            with open(self.experiment_dir / 'tasks' / task_id / 'spec.json') as f:
+                self._specs[task_id] = json.load(f)
+        return self._specs[task_id]
+    
+    def prepare_scratch(self, task_id: str, scratch_root: Path, run_dir: Path) -> dict:
+        """
+        Materialize the task setup into the run's scratch root
+        
+        Returns:
+            dict: Localized spec path, copy methods, and missing fixtures
+        """
+        spec = self._task_spec(task_id)
+        fixtures_dir = self.experiment_dir / 'tasks' / task_id / 'fixtures'
+        result = materialize(spec, scratch_root, fixtures_dir, hardlink_readonly=self.hardlink_readonly)
+        spec_path = run_dir / TASK_SPEC_FILE
+        with open(spec_path, 'w') as f:
+            json.dump(result['spec'], f, indent=2)
+        return {'task_spec': str(spec_path), 'methods': result['methods'], 'missing': result['missing']}
+    
+    def _localized_spec(self, fixtures: dict) -> dict:
+        """Task spec as the run sees it (paths inside its scratch root), for the monitor"""
+        if not fixtures:
+            return {}
+        with open(fixtures['task_spec']) as f:
+            return json.load(f)
+    
+    def _clear_earlier_attempt(self, run_id: str, run_dir: Path, scratch_root: Path) -> str:
+        """
+        Remove what an earlier attempt of this campaign left behind
+        
+        Run ids are deterministic, so a run directory may also belong to
+        another campaign (e.g. one started with a fresh --journal over old
+        runs). Directories are only cleared when the journal records that
+        this campaign already started the run; a locked run is never touched.
+        
+        Returns:
+            str: Reason the run must not be executed, or None
+        """
+        manifest_path = run_dir / 'manifest.json'
+        if manifest_path.exists():
+            try:
+                with open(manifest_path) as f:
+                    locked = json.load(f).get('immutability', {}).get('locked')
+            except (OSError, json.JSONDecodeError):
+                locked = False
+            if locked:
+                return f'Refusing to overwrite locked run: {run_dir}'
+        
+        row = self.journal.run_state(run_id) if self.journal else None
+        leftovers = [path for path in (run_dir, scratch_root) if path.exists() and any(path.iterdir())]
+        if leftovers and not (row and row['attempts']):
+            return f'Refusing to clear {leftovers[0]}: not started by this campaign'
+        for path in leftovers:
+            shutil.rmtree(path)
+        return None
+    
+    def execute_run(self, pair: dict, variant: str, position: int) -> dict:
+        """
+        Execute one run with its own scratch root
+        
+        A run is only executed when it has not completed, so anything this
+        campaign left in its run directory or scratch root is from an earlier,
+        failed or interrupted attempt (agent.log, manifest.json, outputs,
+        termination.json, scorecard.json, written files) and is cleared before
+        the run starts. Locked runs, and directories the journal does not
+        know this campaign created, are left alone and the run fails.
+        
+        Returns:
+            dict: Run result (exit code, timing, manifest path)
+        """
+        run_id = run_id_for(pair, variant)
+        run_dir = self.runs_dir / run_id
+        scratch_root = self.scratch_base / run_id
+        result = {
+            'run_id': run_id,
+            'variant': variant,
+            'position': position,
+            'run_dir': str(run_dir),
+            'scratch_root': str(scratch_root),
+            'manifest': str(run_dir / 'manifest.json'),
+            'fixtures': None,
+            'exit_code': None,
+            'error': None,
+            'termination': None,
+            'seconds': 0.0
+        }
+        
+        refusal = self._clear_earlier_attempt(run_id, run_dir, scratch_root)
+        if refusal is not None:
+            result['error'] = refusal
+            if self.journal:
+                self.journal.transition(run_id, 'failed', error=refusal, stage='execute')
+            self._log(f'✗ {run_id}: {refusal}')
+            return result
+        
+        # Recorded before anything is created, so a later attempt may clear it
+        if self.journal:
+            self.journal.transition(run_id, 'running')
+        run_dir.mkdir(parents=True, exist_ok=True)
+        scratch_root.mkdir(parents=True, exist_ok=True)
+        
+        fixtures = None
+        if self.experiment_dir:
+            fixtures = self.prepare_scratch(pair['task_id'], scratch_root, run_dir)
+        result['fixtures'] = fixtures
+        if fixtures and fixtures['missing']:
+            # The agent would run against an incomplete setup
+            result['error'] = f"Missing fixtures: {', '.join(fixtures['missing'])}"
+            if self.journal:
+                self.journal.transition(run_id, 'failed', error=result['error'], stage='execute')
+            self._log(f"✗ {run_id}: {result['error']}")
+            return result
+        
+        fields = {
+            'experiment': self.experiment,
+            'task_id': pair['task_id'],
+            'variant': variant,
+            'pair_id': pair['pair_id'],
+            'seed': pair['seed'],
+            'run_id': run_id,
+            'run_dir': str(run_dir),
+            'scratch_root': str(scratch_root),
+            'task_spec': fixtures['task_spec'] if fixtures else ''
+        }
+        env = dict(os.environ, HARNESS_SCRATCH_ROOT=str(scratch_root), HARNESS_RUN_DIR=str(run_dir))
+        if fixtures:
+            env['HARNESS_TASK_SPEC'] = fixtures['task_spec']
+        
+        started = time.perf_counter()
+        try:
+            if self.monitor:
+                monitor = RunMonitor(
+                    run_dir / 'agent.log', self._localized_spec(fixtures),
+                    tool_permission_set=rewrite_paths(self.tool_permission_set, str(scratch_root))
+                )
+                process = subprocess.Popen(build_command(self.command, fields), env=env, start_new_session=True)
+                result['termination'] = supervise(process, monitor, self.monitor_interval, self.run_timeout)
+                returncode = process.returncode
+            else:
+                returncode = subprocess.run(
+                    build_command(self.command, fields),
+                    env=env,
+                    timeout=self.run_timeout
+                ).returncode
+            result['exit_code'] = returncode
+            if result['termination']:
+                termination = result['termination']
+                record_termination(run_dir, termination)
+                result['error'] = f"Terminated: {termination['reason']}" + (
+                    f" ({termination['constraint_id']})" if termination.get('constraint_id') else ''
+                )
+            elif returncode != 0:
+                result['error'] = f'Executor exited with code {returncode}'
+        except subprocess.TimeoutExpired:
+            result['error'] = f'Executor exceeded {self.run_timeout}s'
+        except OSError as e:
+            result['error'] = f'Executor failed to start: {e}'
+        except ValueError as e:
+            result['error'] = f'Monitor cannot check the run: {e}'
+        result['seconds'] = time.perf_counter() - started
+        
+        if result['error'] is None and not Path(result['manifest']).exists():
+            result['error'] = 'Executor did not write manifest.json'
+        
+        if self.journal:
+            if result['error'] is None:
+                self.journal.transition(run_id, 'executed', manifest=result['manifest'])
+            else:
+                self.journal.transition(run_id, 'failed', error=result['error'], stage='execute')
+        
+        status = '✓' if result['error'] is None else '✗'
+        self._log(f"{status} {run_id} executed ({result['seconds']:.1f}s)"
+                  + (f": {result['error']}" if result['error'] else ''))
+        return result
+    
+    def _resumable(self, run_id: str) -> dict:
+        """Journal row of a run whose execution already succeeded, else None"""
+        if not self.journal:
+            return None
+        row = self.journal.run_state(run_id)
+        if row and (row['state'] in EXECUTED_STATES
+                    or (row['state'] == 'failed' and row['failed_stage'] in ('evaluate', 'lock'))):
+            return row
+        return None
+    
+    def finish_run(self, run: dict, stage: str) -> dict:
+        """
+        Evaluate (stage 'evaluate') and optionally lock (stage 'lock') an executed run
+        
+        Runs on the finisher thread pool; evaluation itself goes to the process pool.
+        
+        Returns:
+            dict: Evaluation result (ok, error, seconds), with 'locked' when locking
+        """
+        run_id = run['run_id']
+        if stage == 'evaluate':
+            evaluation = self._eval_pool.submit(_evaluate_and_write, run['manifest'], self.isolation).result()
+            if not evaluation['ok']:
+                if self.journal:
+                    self.journal.transition(run_id, 'failed', error=evaluation['error'], stage='evaluate')
+                self._log(f"✗ {run_id} evaluation failed: {evaluation['error']}")
+                return evaluation
+            if self.journal:
+                self.journal.transition(run_id, 'evaluated')
+        else:
+            evaluation = {'manifest': run['manifest'], 'ok': True, 'error': None, 'seconds': 0.0, 'resumed': True}
+        
+        if self.lock_runs:
+            locked = subprocess.run(
+                [str(WORKFLOWS_DIR / 'lock-run.sh'), run['manifest']],
+                capture_output=True,
+                text=True
+            )
+            evaluation['locked'] = locked.returncode == 0
+            if self.journal:
+                if evaluation['locked']:
+                    self.journal.transition(run_id, 'locked')
+                else:
+                    error = (locked.stdout + locked.stderr).strip() or f'lock-run.sh exited {locked.returncode}'
+                    self.journal.transition(run_id, 'failed', error=error, stage='lock')
+        return evaluation
+    
+    def run_pair(self, pair: dict) -> dict:
+        """
+        Execute both variants of a pair sequentially in the planned order
+        
+        Evaluation of each run is submitted as soon as it has executed.
+        Runs the journal records as executed are not executed again, and
+        only their unfinished stages (evaluate, lock) are resubmitted.
+        
+        Returns:
+            dict: Pair result with runs, pending evaluations, and pairing check
+        """
+        done_states = ('locked',) if self.lock_runs else EVALUATED_STATES
+        runs = []
+        evaluations = []
+        for position, variant in enumerate(pair['order'], start=1):
+            run_id = run_id_for(pair, variant)
+            journaled = self._resumable(run_id)
+            if journaled:
+                run = {
+                    'run_id': run_id,
+                    'variant': variant,
+                    'position': position,
+                    'manifest': journaled['manifest'],
+                    'error': None,
+                    'resumed': journaled['state']
+                }
+            else:
+                run = self.execute_run(pair, variant, position)
+            runs.append(run)
+            
+            if run['error'] is not None:
+                continue
+            if journaled and journaled['state'] in done_states:
+                run['evaluation'] = {'manifest': run['manifest'], 'ok': True, 'error': None, 'seconds': 0.0, 'resumed': True}
+                continue
+            
+            needs_evaluation = not journaled or journaled['state'] == 'executed' or journaled['failed_stage'] == 'evaluate'
+            stage = 'evaluate' if needs_evaluation else 'lock'
+            evaluations.append(self._finish_pool.submit(self.finish_run, run, stage))
+        
+        pairing = None
+        if self.journal and self.journal.pair_state(pair['pair_id']) == 'verified' and all(r['error'] is None for r in runs):
+            pairing = {'valid': True, 'pair_id': pair['pair_id'], 'resumed': True}
+        elif all(run['error'] is None for run in runs):
+            pairing = verify_pairing(pair['pair_id'], [run['manifest'] for run in runs])
+            status = '✓' if pairing['valid'] else '✗'
+            self._log(f"{status} {pair['pair_id']} pairing {'verified' if pairing['valid'] else 'FAILED'}")
+            if self.journal:
+                self.journal.set_pair(pair['pair_id'], 'verified' if pairing['valid'] else 'failed', pairing)
+        
+        return {'pair': pair, 'runs': runs, 'evaluations': evaluations, 'pairing': pairing}
+    
+    def run(self, pairs: list) -> dict:
+        """
+        Run all pairs and wait for every evaluation
+        
+        Returns:
+            dict: Campaign results and summary
+        """
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.eval_workers) as eval_pool, \
+                ThreadPoolExecutor(max_workers=self.eval_workers or os.cpu_count()) as finish_pool:
+            self._eval_pool = eval_pool
+            self._finish_pool = finish_pool
+            with ThreadPoolExecutor(max_workers=self.parallelism) as pair_pool:
+                pair_results = list(pair_pool.map(self.run_pair, pairs))
+            
+            for pair_result in pair_results:
+                evaluations = [future.result() for future in pair_result.pop('evaluations')]
+                for run in pair_result['runs']:
+                    if 'evaluation' not in run:
+                        run['evaluation'] = next(
+                            (e for e in evaluations if e['manifest'] == run['manifest']), None
+                        )
+        self._eval_pool = None
+        self._finish_pool = None
+        
+        runs = [run for pair_result in pair_results for run in pair_result['runs']]
+        return {
+            'pairs': pair_results,
+            'summary': {
+                'pairs': len(pair_results),
+                'runs': len(runs),
+                'executed': sum(1 for run in runs if run['error'] is None),
+                'evaluated': sum(1 for run in runs if run.get('evaluation') and run['evaluation']['ok']),
+                'pairing_verified': sum(1 for p in pair_results if p['pairing'] and p['pairing']['valid']),
+                'resumed_runs': sum(1 for run in runs if run.get('resumed')),
+                'terminated_runs': sum(1 for run in runs if run.get('termination')),
+                'elapsed_seconds': time.perf_counter() - started
+            }
+        }
+
+
+def write_schedule(schedule: dict, path: Path):
+    """Write the schedule file atomically"""
+    atomic_write_json(schedule, path)
+
+
+def main():
+    """CLI entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Execute paired runs concurrently')
+    parser.add_argument('--experiment', required=True, help='Experiment identifier (e.g. exp-001-role-vs-goal)')
+    parser.add_argument('--experiment-dir', help='Experiment directory (default: experiments/<experiment>)')
+    parser.add_argument('--tasks', nargs='+', help='Task identifiers (required unless --resume)')
+    parser.add_argument('--pairs-per-task', type=int, default=15, help='Pairs per task')
+    parser.add_argument('--runs-dir', help='Run output directory (default: <experiment-dir>/runs)')
+    parser.add_argument('--command', required=True,
+                        help='Executor command template; placeholders: ' + ', '.join(f'{{{f}}}' for f in COMMAND_FIELDS))
+    parser.add_argument('--parallelism', type=int, default=2, help='Pairs executing concurrently')
+    parser.add_argument('--eval-workers', type=int, help='Evaluation processes (default: CPU cores)')
+    parser.add_argument('--scratch-base', default=str(DEFAULT_SCRATCH_BASE), help='Parent of per-run scratch roots')
+    parser.add_argument('--run-timeout', type=float, help='Wall-clock limit per executor invocation (seconds)')
+    parser.add_argument('--no-monitor', action='store_true',
+                        help='Do not stop runs early on critical violations or task timeout')
+    parser.add_argument('--monitor-interval', type=float, default=POLL_INTERVAL_SECONDS,
+                        help='Seconds between execution log polls')
+    parser.add_argument('--tool-permissions',
+                        help=f'Tool permission set the monitor enforces (default: <experiment-dir>/{TOOL_PERMISSIONS_FILE})')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for per-pair variant order')
+    parser.add_argument('--hardlink-readonly', action='store_true',
+                        help='Hard-link read-only fixtures into scratch roots instead of copying')
+    parser.add_argument('--lock', action='store_true', help='Lock each run (lock-run.sh) once evaluated')
+    parser.add_argument('--journal', help=f'Campaign journal (default: <runs-dir>/{JOURNAL_FILE})')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume the campaign recorded in the journal, skipping completed work')
+    
+    args = parser.parse_args()
+    
+    experiment_dir = Path(args.experiment_dir or Path('experiments') / args.experiment)
+    runs_dir = Path(args.runs_dir or experiment_dir / 'runs')
+    
+    tool_permission_set = None
+    if not args.no_monitor:
+        tool_permissions_path = Path(args.tool_permissions or experiment_dir / TOOL_PERMISSIONS_FILE)
+        if not tool_permissions_path.is_file():
+            print(f'✗ Tool permission set not found: {tool_permissions_path} (pass --tool-permissions or --no-monitor)')
+            return 1
+        tool_permission_set = load_tool_permission_set(tool_permissions_path)
+    
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    
+    journal = CampaignJournal(args.journal or runs_dir / JOURNAL_FILE)
+    schedule_path = runs_dir / 'schedule.json'
+    
+    if args.resume:
+        schedule, pairs = journal.plan()
+        if schedule is None:
+            print(f'✗ No campaign recorded in journal: {journal.path}')
+            return 1
+        print(f"Resuming campaign: {journal.summary()['runs']}")
+    else:
+        if journal.has_plan():
+            print(f'✗ Journal already holds a campaign: {journal.path} (use --resume)')
+            return 1
+        if not args.tasks:
+            parser.error('--tasks is required unless --resume is given')
+        pairs = plan_pairs(experiment_dir, args.tasks, args.pairs_per_task, args.seed)
+        schedule = {
+            'experiment': args.experiment,
+            'created_at': datetime.now().isoformat(),
+            'order_seed': args.seed,
+            'command': args.command,
+            'parallelism': args.parallelism,
+            'pairs': pairs
+        }
+        journal.record_plan({key: value for key, value in schedule.items() if key != 'pairs'}, pairs, run_id_for)
+    schedule['pairs'] = pairs
+    write_schedule(schedule, schedule_path)
+    
+    print(f"Scheduling {len(pairs)} pairs ({len(pairs) * 2} runs), {args.parallelism} concurrent")
+    
+    scheduler = PairScheduler(
+        args.experiment,
+        runs_dir,
+        args.command,
+        parallelism=args.parallelism,
+        eval_workers=args.eval_workers,
+        scratch_base=Path(args.scratch_base),
+        run_timeout=args.run_timeout,
+        experiment_dir=experiment_dir,
+        hardlink_readonly=args.hardlink_readonly,
+        journal=journal,
+        lock_runs=args.lock,
+        monitor=not args.no_monitor,
+        monitor_interval=args.monitor_interval,
+        tool_permission_set=tool_permission_set
+    )
+    results = scheduler.run(pairs)
+    journal.close()
+    
+    schedule['completed_at'] = datetime.now().isoformat()
+    schedule['results'] = results
+    write_schedule(schedule, schedule_path)
+    
+    summary = results['summary']
+    print(f"\nExecuted {summary['executed']}/{summary['runs']} runs, evaluated {summary['evaluated']}, "
+          f"{summary['pairing_verified']}/{summary['pairs']} pairs verified ({summary['elapsed_seconds']:.1f}s)")
+    if summary['resumed_runs']:
+        print(f"  Resumed: {summary['resumed_runs']} runs already executed were not re-run")
+    if summary['terminated_runs']:
+        print(f"  Terminated early: {summary['terminated_runs']} runs (reasons in execution.termination)")
+    print(f'  Schedule: {schedule_path}')
+    
+    complete = summary['evaluated'] == summary['runs'] and summary['pairing_verified'] == summary['pairs']
+    return 0 if complete else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Scorecard Index Store
+
+On-disk layout of the columnar scorecard index shared by its writer
+(create-scorecard-index.py) and its readers (the analysis scripts).
+
+The index directory holds append-only parts (Parquet or Arrow IPC) named
+part-<seq>, plus the writer's state file. Every row carries the sequence
+number of the part that wrote it (_seq) and a tombstone flag (_deleted):
+a row in a later part supersedes earlier rows for the same run_id, and a
+tombstone removes the run. read_index applies both rules.
+
+Requires pyarrow (see requirements.txt).
+"""
+
+import os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+STATE_FILE = 'state.json'
+
+INDEX_SCHEMA = pa.schema([
+    ('run_id', pa.string()),
+    ('variant', pa.string()),
+    ('task_id', pa.string()),
+    ('pair_id', pa.string()),
+    ('seed', pa.int64()),
+    ('task_success', pa.int8()),
+    ('constraint_adherence', pa.float64()),
+    ('runtime', pa.float64()),
+    ('timeout_reached', pa.bool_()),
+    ('clarification_count', pa.int64()),
+    ('reproducibility', pa.float64()),
+    ('evaluated_at', pa.string()),
+    ('scorecard_path', pa.string()),
+    ('_seq', pa.int64()),
+    ('_deleted', pa.bool_())
+])
+
+# Internal bookkeeping columns, not exported to CSV
+INTERNAL_COLUMNS = ('_seq', '_deleted')
+
+# Row order of the merged index
+SORT_COLUMNS = ('task_id', 'pair_id', 'variant', 'run_id')
+
+PART_SUFFIXES = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+
+def list_parts(index_dir) -> list:
+    """Part files of an index directory in sequence order ([] if it does not exist)"""
+    index_dir = Path(index_dir)
+    if not index_dir.exists():
+        return []
+    return sorted(
+        p for p in index_dir.iterdir()
+        if p.name.startswith('part-') and p.suffix in PART_SUFFIXES.values()
+    )
+
+
+def write_part(table: pa.Table, path: Path, fmt: str):
+    """Write one part atomically in the given format"""
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    if fmt == 'parquet':
+        pq.write_table(table, tmp_path)
+    else:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def read_part(path: Path) -> pa.Table:
+    if path.suffix == '.parquet':
+        return pq.read_table(path, schema=INDEX_SCHEMA)
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def read_index(index_dir) -> pa.Table:
+    """
+    Read the current index: latest row per run_id, tombstones removed
+    
+    An index directory without parts yields an empty table with the
+    index columns.
+    
+    Args:
+        index_dir: Index directory with columnar parts
+    
+    Returns:
+        pa.Table: Merged index (internal columns dropped)
+    """
+    parts = [read_part(part) for part in list_parts(index_dir)]
+    table = pa.concat_tables(parts) if parts else INDEX_SCHEMA.empty_table()
+    
+    # Keep each run's row from its latest part, then drop tombstones
+    latest = table.group_by('run_id').aggregate([('_seq', 'max')])
+    table = table.join(latest, keys=['run_id', '_seq'], right_keys=['run_id', '_seq_max'], join_type='inner')
+    table = table.filter(pc.invert(pc.fill_null(table['_deleted'], False)))
+    
+    # Missing values sort as empty strings
+    keys = pa.table({name: pc.fill_null(table[name], '') for name in SORT_COLUMNS})
+    order = pc.sort_indices(keys, sort_keys=[(name, 'ascending') for name in SORT_COLUMNS])
+    return table.take(order).select([name for name in INDEX_SCHEMA.names if name not in INTERNAL_COLUMNS])
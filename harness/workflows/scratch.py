@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Run Scratch Spaces
+
+Materializes a task's setup_required into a per-run scratch root so runs
+of the same task can execute side by side.
+
+Task specs address their files under /tmp/exp-test. For each run the
+spec is rewritten so every such path (inputs, expected_outputs,
+setup_required, authorized_paths, ...) points into the run's own root.
+Each task's fixture tree is built once into a content-keyed cache and
+copied into run roots with reflinks (copy-on-write clones) where the
+filesystem supports them, falling back to a regular copy. Read-only
+fixtures can optionally be hard-linked instead.
+
+Pre-populated files are either inline ({"path", "content", "permissions"})
+or bare paths whose content comes from tasks/<task_id>/fixtures/, laid
+out relative to /tmp/exp-test. Fixtures that cannot be found are
+reported, not silently skipped.
+"""
+
+import copy
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'evaluators'))
+
+from constraint_adherence import file_mode  # noqa: E402
+from file_hashing import cached_file_hash  # noqa: E402
+
+
+SCRATCH_PREFIX = '/tmp/exp-test'
+
+# Built fixture trees; set HARNESS_FIXTURE_CACHE to relocate
+DEFAULT_FIXTURE_CACHE = Path.home() / '.cache' / 'agent-design-lab' / 'fixtures'
+
+FIXTURE_MANIFEST = '.fixture.json'
+
+# ioctl request number for FICLONE (linux/fs.h)
+FICLONE = 0x40049409
+
+_build_locks = {}
+_build_locks_guard = threading.Lock()
+
+
+def rewrite_paths(value, root: str, prefix: str = SCRATCH_PREFIX):
+    """
+    Replace the scratch prefix with root in every string of a JSON value
+    
+    Only whole path components match: /tmp/exp-test/a.txt is rewritten,
+    /tmp/exp-test-other is not.
+    """
+    if isinstance(value, str):
+        if value == prefix or value.startswith(prefix + '/'):
+            return root + value[len(prefix):]
+        return value
+    if isinstance(value, dict):
+        return {key: rewrite_paths(item, root, prefix) for key, item in value.items()}
+    if isinstance(value, list):
+        return [rewrite_paths(item, root, prefix) for item in value]
+    return value
+
+
+def localize_spec(spec: dict, root: str) -> dict:
+    """Return a copy of a task spec with all scratch paths under root"""
+    return rewrite_paths(copy.deepcopy(spec), str(root).rstrip('/'))
+
+
+def fixture_source(fixtures_dir, root: str = SCRATCH_PREFIX) -> dict:
+    """
+    Fixtures block of a task spec: where the pristine copies of the files under root live
+    
+    Evaluators read a task's input files from here rather than from the
+    run's scratch root, which the agent may have changed.
+    """
+    return {'dir': str(Path(fixtures_dir).resolve()), 'root': str(root).rstrip('/')}
+
+
+def _relative(path: str) -> str:
+    """Path relative to the scratch prefix, or None if outside it"""
+    if not path.startswith(SCRATCH_PREFIX + '/'):
+        return None
+    return path[len(SCRATCH_PREFIX) + 1:]
+
+
+def fixture_entries(spec: dict) -> list:
+    """
+    Normalize setup_required.pre_populated_files
+    
+    Returns:
+        list: [{'relpath', 'content' (None if from fixtures dir), 'permissions' (int mode or None)}]
+    """
+    entries = []
+    for item in spec.get('setup_required', {}).get('pre_populated_files', []):
+        if isinstance(item, str):
+            item = {'path': item}
+        relpath = _relative(item.get('path', ''))
+        if relpath is None:
+            continue
+        entries.append({
+            'relpath': relpath,
+            'content': item.get('content'),
+            'permissions': file_mode(item.get('permissions'))
+        })
+    return entries
+
+
+def _fixture_key(spec: dict, entries: list, fixtures_dir: Path) -> str:
+    """Content key of a fixture tree: setup block plus source file hashes"""
+    digest = hashlib.sha256(json.dumps(spec.get('setup_required', {}), sort_keys=True).encode())
+    for entry in entries:
+        source = fixtures_dir / entry['relpath']
+        if entry['content'] is None and source.is_file():
+            digest.update(f"{entry['relpath']}:{cached_file_hash(source)}".encode())
+    return digest.hexdigest()[:16]
+
+
+def build_fixture_tree(spec: dict, fixtures_dir: Path, cache_dir: Path = None) -> Path:
+    """
+    Build (or reuse) the fixture tree for a task spec
+    
+    Args:
+        spec: Task spec (original, unrewritten paths)
+        fixtures_dir: Source directory for bare-path fixtures
+        cache_dir: Fixture cache (default: HARNESS_FIXTURE_CACHE or ~/.cache)
+    
+    Returns:
+        Path: Built tree; its .fixture.json lists files and missing fixtures
+    """
+    cache_dir = Path(cache_dir or os.environ.get('HARNESS_FIXTURE_CACHE') or DEFAULT_FIXTURE_CACHE)
+    fixtures_dir = Path(fixtures_dir)
+    entries = fixture_entries(spec)
+    tree = cache_dir / f"{spec.get('task_id', 'task')}-{_fixture_key(spec, entries, fixtures_dir)}"
+    
+    with _build_locks_guard:
+        lock = _build_locks.setdefault(tree, threading.Lock())
+    
+    with lock:
+        if (tree / FIXTURE_MANIFEST).exists():
+            return tree
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=cache_dir, prefix=f'.{tree.name}-'))
+        files, missing = [], []
+        for entry in entries:
+            target = staging / entry['relpath']
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if entry['content'] is not None:
+                target.write_text(entry['content'])
+            elif (fixtures_dir / entry['relpath']).is_file():
+                shutil.copyfile(fixtures_dir / entry['relpath'], target)
+            else:
+                missing.append(entry['relpath'])
+                continue
+            if entry['permissions'] is not None:
+                os.chmod(target, entry['permissions'])
+            files.append(entry['relpath'])
+        
+        with open(staging / FIXTURE_MANIFEST, 'w') as f:
+            json.dump({'files': files, 'missing': missing}, f, indent=2)
+        
+        # Another process may have built the same tree concurrently
+        try:
+            os.rename(staging, tree)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+    return tree
+
+
+def clone_file(source: Path, target: Path, hardlink: bool = False) -> str:
+    """
+    Copy a file, preferring a reflink; optionally hard-link instead
+    
+    Returns:
+        str: 'hardlink', 'reflink', or 'copy'
+    """
+    if hardlink:
+        try:
+            os.link(source, target)
+            return 'hardlink'
+        except OSError:
+            pass
+    
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            method = 'reflink'
+        except OSError:
+            shutil.copyfileobj(src, dst)
+            method = 'copy'
+    shutil.copymode(source, target)
+    return method
+
+
+def materialize(spec: dict, run_root: str, fixtures_dir: str, cache_dir: str = None,
+                hardlink_readonly: bool = False) -> dict:
+    """
+    Populate a run's scratch root and localize its task spec
+    
+    Args:
+        spec: Task spec with /tmp/exp-test paths
+        run_root: Per-run scratch root (created if missing)
+        fixtures_dir: Source directory for bare-path fixtures
+        cache_dir: Fixture cache directory
+        hardlink_readonly: Hard-link fixtures without write permission
+            (shares the inode with the cache, so only safe when the agent
+            cannot chmod them back)
+    
+    Returns:
+        dict: Localized spec, root, copied files per method, missing fixtures
+    """
+    run_root = Path(run_root)
+    run_root.mkdir(parents=True, exist_ok=True)
+    tree = build_fixture_tree(spec, Path(fixtures_dir), cache_dir)
+    
+    with open(tree / FIXTURE_MANIFEST) as f:
+        fixture = json.load(f)
+    
+    methods = {}
+    for relpath in fixture['files']:
+        source = tree / relpath
+        target = run_root / relpath
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            target.unlink()
+        readonly = not os.stat(source).st_mode & 0o222
+        method = clone_file(source, target, hardlink=hardlink_readonly and readonly)
+        methods[method] = methods.get(method, 0) + 1
+    
+    return {
+        'root': str(run_root),
+        'spec': dict(localize_spec(spec, str(run_root)), fixtures=fixture_source(fixtures_dir, run_root)),
+        'fixture_tree': str(tree),
+        'files': fixture['files'],
+        'methods': methods,
+        'missing': fixture['missing']
+    }
+
+
+def main():
+    """CLI entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Materialize a task setup into a per-run scratch root')
+    parser.add_argument('--spec', required=True, help='Path to task spec.json')
+    parser.add_argument('--root', required=True, help='Per-run scratch root')
+    parser.add_argument('--fixtures-dir', help='Fixture source directory (default: <spec dir>/fixtures)')
+    parser.add_argument('--output', required=True, help='Path to write the localized spec')
+    parser.add_argument('--hardlink-readonly', action='store_true', help='Hard-link read-only fixtures')
+    
+    args = parser.parse_args()
+    
+    with open(args.spec) as f:
+        spec = json.load(f)
+    fixtures_dir = args.fixtures_dir or str(Path(args.spec).parent / 'fixtures')
+    
+    result = materialize(spec, args.root, fixtures_dir, hardlink_readonly=args.hardlink_readonly)
+    
+    with open(args.output, 'w') as f:
+        json.dump(result['spec'], f, indent=2)
+    
+    print(f"✓ Materialized {len(result['files'])} fixtures into {result['root']} {result['methods']}")
+    print(f'  Spec: {args.output}')
+    if result['missing']:
+        print('\nMissing fixtures:')
+        for relpath in result['missing']:
+            print(f'  ✗ {relpath}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
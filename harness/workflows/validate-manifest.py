@@ -3,13 +3,41 @@
 Manifest Validator
 
 Validates run manifests meet all requirements before execution.
+
+In batch mode (a directory or glob of manifests) manifests are validated
+on a thread pool; existence checks and spec parsing are memoized, since
+a campaign's runs share a handful of variant and task specifications.
 """
 
+import glob
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
+def path_exists(path: str) -> bool:
+    """Memoized existence check (paths resolve against the working directory)"""
+    return Path(path).exists()
+
+
+@lru_cache(maxsize=None)
+def load_spec(path: str) -> tuple:
+    """
+    Memoized parse of a JSON specification
+    
+    Returns:
+        tuple: (spec dict or None, parse error or None)
+    """
+    try:
+        with open(path) as f:
+            return json.load(f), None
+    except (OSError, json.JSONDecodeError) as e:
+        return None, str(e)
+
+
 def validate_manifest(manifest_path: str) -> dict:
     """
     Validate run manifest before execution
@@ -59,13 +87,13 @@ def validate_manifest(manifest_path: str) -> dict:
         if not config.get('version'):
             errors.append(f'Evaluator {evaluator} has no version pin')
         if not config.get('hash'):
-            warnings.append(f'Evaluator {evaluator} has no hash pin')
+            errors.append(f'Evaluator {evaluator} has no hash pin')
     
     # Check variant specification exists
     variant = manifest.get('variant', {})
     variant_spec = variant.get('specification_file')
     if variant_spec:
-        if not Path(variant_spec).exists():
+        if not path_exists(variant_spec):
             errors.append(f'Variant specification not found: {variant_spec}')
     else:
         errors.append('No variant specification file specified')
@@ -74,8 +102,14 @@ def validate_manifest(manifest_path: str) -> dict:
     task = manifest.get('task', {})
     task_spec = task.get('specification_file')
     if task_spec:
-        if not Path(task_spec).exists():
+        if not path_exists(task_spec):
             errors.append(f'Task specification not found: {task_spec}')
+        else:
+            spec, error = load_spec(task_spec)
+            if error:
+                errors.append(f'Task specification is not valid JSON: {task_spec}: {error}')
+            elif task.get('task_id') and spec.get('task_id') != task.get('task_id'):
+                warnings.append(f"Task specification is for {spec.get('task_id')}, manifest says {task.get('task_id')}")
     else:
         errors.append('No task specification file specified')
     
@@ -83,7 +117,7 @@ def validate_manifest(manifest_path: str) -> dict:
     inputs = manifest.get('inputs', {})
     input_path = inputs.get('snapshot_path')
     if input_path:
-        if not Path(input_path).exists():
+        if not path_exists(input_path):
             warnings.append(f'Input snapshot path not found: {input_path}')
     
     valid = len(errors) == 0
@@ -95,15 +129,71 @@ def validate_manifest(manifest_path: str) -> dict:
     }
 
 
+def collect_manifests(target: str) -> list:
+    """Manifest paths under a directory (manifest.json, recursively) or matching a glob"""
+    if Path(target).is_dir():
+        return sorted(str(p) for p in Path(target).rglob('manifest.json'))
+    return sorted(glob.glob(target, recursive=True))
+
+
+def validate_manifests(manifest_paths: list, workers: int = None) -> dict:
+    """
+    Validate many manifests concurrently
+    
+    Args:
+        manifest_paths: Manifest JSON paths
+        workers: Thread pool size (default: ThreadPoolExecutor default)
+    
+    Returns:
+        dict: Report with per-manifest results, totals, and cache statistics
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = dict(zip(manifest_paths, pool.map(validate_manifest, manifest_paths)))
+    
+    exists_info = path_exists.cache_info()
+    spec_info = load_spec.cache_info()
+    return {
+        'valid': all(r['valid'] for r in results.values()),
+        'total': len(results),
+        'passed': sum(1 for r in results.values() if r['valid']),
+        'failed': sum(1 for r in results.values() if not r['valid']),
+        'with_warnings': sum(1 for r in results.values() if r['warnings']),
+        'path_checks': {'hits': exists_info.hits, 'misses': exists_info.misses},
+        'spec_parses': {'hits': spec_info.hits, 'misses': spec_info.misses},
+        'manifests': results
+    }
+
+
 def main():
     """CLI entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Validate run manifest')
-    parser.add_argument('--manifest', required=True, help='Path to manifest JSON')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--manifest', help='Path to manifest JSON')
+    target.add_argument('--manifests', help='Directory (searched for manifest.json) or glob of manifests')
+    parser.add_argument('--workers', type=int, help='Validation threads (batch mode)')
+    parser.add_argument('--output', help='Write the batch report JSON here (default: stdout)')
     
     args = parser.parse_args()
     
+    if args.manifests:
+        manifest_paths = collect_manifests(args.manifests)
+        if not manifest_paths:
+            print(f'✗ No manifests found: {args.manifests}', file=sys.stderr)
+            return 1
+        report = validate_manifests(manifest_paths, args.workers)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
+            status = '✓ VALIDATION PASSED' if report['valid'] else '✗ VALIDATION FAILED'
+            print(f"{status}: {report['passed']}/{report['total']} manifests valid")
+            print(f'  Report: {args.output}')
+        else:
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        return 0 if report['valid'] else 1
+    
     result = validate_manifest(args.manifest)
     
     if result['valid']: